@@ -0,0 +1,111 @@
+import sys
+import unittest
+import time
+import os
+import tracemalloc
+from ressat.cnf_parser import parse_cnf
+from ressat.resolvent_generator import generate_resolvents_minimal
+from ressat.res_sat import res_sat
+from ressat.validator import validate_interpretation
+from ressat.symmetry import break_symmetries
+from ressat.result_cache import DEFAULT_PATH, ResultCache
+
+FOLDER = "data/PHOLE"
+# Add lex-leader symmetry-breaking clauses before resolution (--symmetry)
+BREAK_SYMMETRY = False
+# Reuse results of unchanged instances from this result cache (--cache [PATH])
+CACHE_PATH = None
+from tqdm import tqdm
+
+
+def measure(cnf_path):
+    """Solves one instance, tracking its runtime and peak traced memory."""
+    # Start memory tracking
+    tracemalloc.start()
+    start_time = time.time()
+
+    num_vars, clauses, true_label = parse_cnf(cnf_path)
+    working_clauses, working_vars = clauses, num_vars
+    if BREAK_SYMMETRY:
+        working_clauses, working_vars, _ = break_symmetries(clauses, num_vars)
+    R = generate_resolvents_minimal(working_clauses, verbose=False)
+    interpretation = res_sat(R, working_vars)
+    interpretation = {l for l in interpretation if abs(l) <= num_vars}
+
+    end_time = time.time()
+    current, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()  # Stop memory tracking
+
+    return {
+        "label": true_label,
+        "valid": validate_interpretation(clauses, interpretation),
+        "interpretation": sorted(interpretation, key=abs),
+        "runtime": end_time - start_time,
+        "peak_memory": peak_memory,
+        "closure_size": len(R),
+    }
+
+
+class TestAIM(unittest.TestCase):
+    def test_aim(self):
+        pred = []
+        labels = []
+        cnf_files = [f for f in os.listdir(FOLDER) if f.endswith(".cnf")]
+
+        runtimes = []
+        memory_usages = []  # Store memory usage for each CNF instance
+        cache = ResultCache(CACHE_PATH) if CACHE_PATH else None
+        cache_config = {"runner": "test_phole", "method": "minimal", "symmetry": BREAK_SYMMETRY}
+
+        for cnf_file in tqdm(cnf_files, desc="Processing CNF files"):
+            cnf_path = os.path.join(FOLDER, cnf_file)
+
+            result = cache.get(cnf_path, cache_config) if cache is not None else None
+            cached = result is not None
+            if not cached:
+                result = measure(cnf_path)
+                if cache is not None:
+                    cache.put(cnf_path, cache_config, result)
+            true_label, predicted_label = result["label"], result["valid"]
+            peak_memory = result["peak_memory"]
+
+            pred.append(predicted_label)
+            labels.append(true_label)
+
+            instance_runtime = result["runtime"]
+            runtimes.append(instance_runtime)
+            memory_usages.append(peak_memory)  # Store peak memory usage
+
+            current_accuracy = (
+                sum(p == l for p, l in zip(pred, labels)) / len(labels) if labels else 0
+            )
+            current_avg_runtime = sum(runtimes) / len(runtimes) if runtimes else 0
+            current_avg_memory = (
+                sum(memory_usages) / len(memory_usages) if memory_usages else 0
+            )
+
+            tqdm.write(f"After processing {cnf_file}{' (cached)' if cached else ''}: | Resolvent {result['closure_size']}")
+            tqdm.write(f"  True Label: {true_label} | Pred: {predicted_label}")
+            tqdm.write(f"  Accuracy: {current_accuracy:.2%}")
+            tqdm.write(f"  Avg Runtime: {current_avg_runtime:.4f} seconds")
+            tqdm.write(f"  Peak Memory Usage: {peak_memory / 1024:.2f} KB")
+            tqdm.write(
+                f"  Avg Memory Usage per CNF: {current_avg_memory / 1024:.2f} KB"
+            )
+
+        if cache is not None:
+            cache.close()
+        correct_predictions = sum(p == l for p, l in zip(pred, labels))
+        self.assertGreaterEqual(correct_predictions / len(labels) if labels else 0, 0)
+
+
+if __name__ == "__main__":
+    if "--symmetry" in sys.argv:
+        sys.argv.remove("--symmetry")
+        BREAK_SYMMETRY = True
+    if "--cache" in sys.argv:
+        index = sys.argv.index("--cache")
+        sys.argv.pop(index)
+        given = index < len(sys.argv) and not sys.argv[index].startswith("-")
+        CACHE_PATH = sys.argv.pop(index) if given else DEFAULT_PATH
+    unittest.main()
@@ -1,13 +1,23 @@
-from setuptools import setup, find_packages
+from setuptools import find_packages, setup
 
 setup(
     name="res_sat",
     version="0.1",
-    packages=find_packages(where="src"),
+    packages=find_packages("src"),
     package_dir={"": "src"},
+    python_requires=">=3.8",
+    extras_require={
+        # only benchmarking.py's plots and CSV export need these
+        "plot": ["pandas", "matplotlib"],
+    },
     entry_points={
         "console_scripts": [
-            "res_sat=main:main",
+            "res_sat=ressat.main:main",
+            "res_sat_all=ressat.run_all:main",
+            "res_sat_server=ressat.server:main",
+            "res_sat_bench=ressat.benchmark_suite:main",
+            "res_sat_portfolio=ressat.portfolio:main",
+            "res_sat_proof=ressat.proof_log:main",
         ],
     },
-)
\ No newline at end of file
+)
@@ -0,0 +1,6 @@
+"""
+RES-SAT: finds a model of a satisfiable CNF formula by resolution.
+
+The modules are imported one by one (``from ressat.res_sat import res_sat``);
+this package imports nothing itself, so the command-line tools start fast.
+"""
@@ -0,0 +1,401 @@
+# benchmark_suite.py
+import argparse
+import functools
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from .generators import random_ksat, pigeonhole, aim_like
+from .cnf_parser import parse_cnf
+from .prop_to_cnf import write_dimacs
+from .resolvent_generator import generate_resolvents_minimal, generate_resolvents
+from .res_sat import res_sat
+from .validator import validate_interpretation
+
+# family -> (default sizes, generator(size, seed) -> (num_vars, clauses))
+FAMILIES = {
+    "random": ([6, 8, 10, 12], lambda size, seed: random_ksat(size, 4.26, seed=seed)),
+    "php": ([2, 3, 4], lambda size, seed: pigeonhole(size)),
+    "aim-yes": ([10, 20, 30], lambda size, seed: aim_like(size, 1.6, satisfiable=True, seed=seed)),
+    "aim-no": ([10, 20, 30], lambda size, seed: aim_like(size, 1.6, satisfiable=False, seed=seed)),
+}
+
+METHODS = {
+    "minimal": generate_resolvents_minimal,
+    "standard": generate_resolvents,
+    "ordered-minimal": functools.partial(generate_resolvents_minimal, ordered=True),
+    "ordered": functools.partial(generate_resolvents, ordered=True),
+}
+
+# measured unless --methods says otherwise
+DEFAULT_METHODS = ["minimal", "standard"]
+
+# ordered method -> the unrestricted method it restricts
+ORDERED_PAIRS = {"ordered-minimal": "minimal", "ordered": "standard"}
+
+PHASES = ["resolve", "res_sat", "validate", "total"]
+
+
+def _exact_u_counts(m, n):
+    """
+    Number of orderings of m x-samples and n y-samples for every value of the
+    Mann-Whitney U statistic (no ties), as a list indexed by U.
+    """
+    # counts[j][u]: orderings of i x-samples and j y-samples with statistic u
+    counts = [[1] for _ in range(n + 1)]
+    for i in range(1, m + 1):
+        new = [[1]]
+        for j in range(1, n + 1):
+            size = i * j + 1
+            row = [0] * size
+            for u, c in enumerate(new[j - 1]):      # last sample is a y
+                row[u] += c
+            for u, c in enumerate(counts[j]):       # last sample is an x above j y's
+                row[u + j] += c
+            new.append(row)
+        counts = new
+    return counts[n]
+
+
+def mann_whitney_u(x, y):
+    """
+    Two-sided Mann-Whitney U test of whether samples x and y come from the
+    same distribution.
+
+    Uses the exact null distribution for small samples without ties and the
+    normal approximation (with tie and continuity corrections) otherwise.
+
+    Returns:
+        u (float): the U statistic of x.
+        p (float): the two-sided p-value.
+    """
+    m, n = len(x), len(y)
+    if m == 0 or n == 0:
+        return 0.0, 1.0
+    pooled = sorted([(v, 0) for v in x] + [(v, 1) for v in y])
+    ranks = [0.0] * len(pooled)
+    tie_term = 0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        t = j - i + 1
+        tie_term += t ** 3 - t
+        i = j + 1
+    rank_sum = sum(r for r, (_, side) in zip(ranks, pooled) if side == 0)
+    u = rank_sum - m * (m + 1) / 2
+
+    if tie_term == 0 and m + n <= 40:
+        counts = _exact_u_counts(m, n)
+        total = sum(counts)
+        extreme = min(u, m * n - u)
+        p = 2 * sum(counts[:int(extreme) + 1]) / total
+        return u, min(p, 1.0)
+
+    mean = m * n / 2
+    variance = m * n / 12 * ((m + n + 1) - tie_term / ((m + n) * (m + n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (abs(u - mean) - 0.5) / math.sqrt(variance)
+    return u, min(math.erfc(max(z, 0.0) / math.sqrt(2)), 1.0)
+
+
+def measure_instance(num_vars, clauses, method="minimal", repeats=5, memory_repeats=5):
+    """
+    Times the resolve / RES-SAT / validate phases of one instance.
+
+    Every phase is timed `repeats` times with perf_counter; `memory_repeats`
+    further runs under tracemalloc give the peak memory (kept separate
+    because tracing slows the timed runs down).
+
+    Returns:
+        dict: per-phase lists of seconds, "peak_memory" (list of bytes),
+        "closure_size", "complete", "valid" and "clashing_pairs" (the
+        resolution steps taken by the last run).
+    """
+    generate = METHODS[method]
+    samples = {phase: [] for phase in PHASES}
+    for _ in range(repeats):
+        stats = {}
+        start = time.perf_counter()
+        R = generate(clauses, verbose=False, stats=stats)
+        resolved = time.perf_counter()
+        interpretation = res_sat(R, num_vars)
+        solved = time.perf_counter()
+        valid = validate_interpretation(clauses, interpretation)
+        end = time.perf_counter()
+        samples["resolve"].append(resolved - start)
+        samples["res_sat"].append(solved - resolved)
+        samples["validate"].append(end - solved)
+        samples["total"].append(end - start)
+
+    peaks = []
+    for _ in range(memory_repeats):
+        tracemalloc.start()
+        res_sat(generate(clauses, verbose=False), num_vars)
+        peaks.append(tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return {**samples, "peak_memory": peaks, "closure_size": len(R),
+            "complete": stats["complete"], "valid": valid, "clashing_pairs": stats.get("clashing_pairs", 0)}
+
+
+def run_suite(families=None, sizes=None, methods=None, repeats=5, seed=0, dump_dir=None, verbose=True):
+    """
+    Sweeps every family over its instance sizes and measures each method.
+
+    Args:
+        families: names from FAMILIES (default: all).
+        sizes: optional dict family -> list of sizes overriding the defaults.
+        methods: names from METHODS (default: DEFAULT_METHODS).
+        dump_dir: if given, every generated instance is also written there as DIMACS.
+
+    Returns:
+        list of dict: one record per (family, size, method).
+    """
+    results = []
+    for family in families or FAMILIES:
+        default_sizes, generator = FAMILIES[family]
+        for size in (sizes or {}).get(family, default_sizes):
+            num_vars, clauses = generator(size, seed)
+            if dump_dir:
+                os.makedirs(dump_dir, exist_ok=True)
+                write_dimacs([sorted(c) for c in clauses], num_vars,
+                             os.path.join(dump_dir, f"{family}-{size}-s{seed}.cnf"))
+            for method in methods or DEFAULT_METHODS:
+                record = {"family": family, "size": size, "method": method, "seed": seed,
+                          "num_vars": num_vars, "num_clauses": len(clauses)}
+                record.update(measure_instance(num_vars, clauses, method, repeats))
+                results.append(record)
+                if verbose:
+                    print(f"{family:8} size={size:<4} {method:9} closure={record['closure_size']:<6} "
+                          f"total={statistics.median(record['total']):.4f}s "
+                          f"peak={statistics.median(record['peak_memory']) / 1024:.0f}KB")
+    return results
+
+
+def run_files(cnf_files, methods=None, repeats=5, verbose=True):
+    """
+    Measures each method on DIMACS files (e.g. data/AIM and data/PHOLE).
+
+    Records look like those of run_suite, with the directory name as the
+    family and the file name as the size.
+    """
+    results = []
+    for cnf_file in cnf_files:
+        num_vars, clauses, _ = parse_cnf(cnf_file)
+        family = os.path.basename(os.path.dirname(os.path.abspath(cnf_file))).lower()
+        name = os.path.basename(cnf_file)
+        for method in methods or DEFAULT_METHODS:
+            record = {"family": family, "size": name, "method": method, "seed": None,
+                      "num_vars": num_vars, "num_clauses": len(clauses)}
+            record.update(measure_instance(num_vars, clauses, method, repeats))
+            results.append(record)
+            if verbose:
+                print(f"{family:8} {name:<36} {method:15} closure={record['closure_size']:<6} "
+                      f"steps={record['clashing_pairs']:<7} total={statistics.median(record['total']):.4f}s")
+    return results
+
+
+def _git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(results, path):
+    """
+    Writes results to a JSON file together with the commit and platform they came from.
+    """
+    data = {
+        "meta": {
+            "commit": _git_commit(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=1)
+
+
+def compare_to_baseline(results, baseline, alpha=0.05, min_change=0.05):
+    """
+    Flags regressions of `results` against the records of a baseline run.
+
+    A phase, or the peak memory, regresses when the Mann-Whitney test
+    rejects equal distributions at level `alpha` and the median is more than
+    `min_change` higher (baselines that stored a single peak-memory sample
+    can therefore not show a memory regression). Generation is
+    deterministic, so any growth of the closure is reported. Improvements
+    are never reported.
+
+    Returns:
+        list of dict: one entry per regression.
+    """
+    base = {(r["family"], r["size"], r["method"]): r for r in baseline}
+    regressions = []
+    for record in results:
+        key = (record["family"], record["size"], record["method"])
+        old = base.get(key)
+        if old is None:
+            continue
+        for metric in PHASES + ["peak_memory"]:
+            old_samples, new_samples = _samples(old[metric]), _samples(record[metric])
+            before, after = statistics.median(old_samples), statistics.median(new_samples)
+            _, p = mann_whitney_u(old_samples, new_samples)
+            if p < alpha and after > before * (1 + min_change):
+                regressions.append({"key": key, "metric": metric, "before": before, "after": after, "p": p})
+        if record["closure_size"] > old["closure_size"]:
+            regressions.append({"key": key, "metric": "closure_size",
+                                "before": old["closure_size"], "after": record["closure_size"], "p": None})
+    return regressions
+
+
+def _samples(value):
+    """A metric's list of samples; older results stored a single number."""
+    return value if isinstance(value, list) else [value]
+
+
+def compare_methods(results, alpha=0.05):
+    """
+    Compares minimal against standard generation on every instance.
+
+    Returns:
+        list of dict: per (family, size), the median total times, closure
+        sizes and the Mann-Whitney p-value of the total times.
+    """
+    by_instance = {}
+    for r in results:
+        by_instance.setdefault((r["family"], r["size"]), {})[r["method"]] = r
+    rows = []
+    for (family, size), methods in by_instance.items():
+        if "minimal" not in methods or "standard" not in methods:
+            continue
+        minimal, standard = methods["minimal"], methods["standard"]
+        _, p = mann_whitney_u(minimal["total"], standard["total"])
+        rows.append({"family": family, "size": size,
+                     "minimal_total": statistics.median(minimal["total"]),
+                     "standard_total": statistics.median(standard["total"]),
+                     "minimal_closure": minimal["closure_size"],
+                     "standard_closure": standard["closure_size"],
+                     "p": p, "significant": p < alpha})
+    return rows
+
+
+def compare_ordered(results):
+    """
+    Compares every ordered method with the unrestricted method it restricts
+    (ORDERED_PAIRS) on each instance measured with both.
+
+    Returns:
+        list of dict: per (family, size, ordered method), the resolution
+        steps, closure sizes, median total times and validity of both, and
+        "step_ratio" (unrestricted steps per ordered step).
+    """
+    by_instance = {}
+    for r in results:
+        by_instance.setdefault((r["family"], r["size"]), {})[r["method"]] = r
+    rows = []
+    for (family, size), methods in by_instance.items():
+        for ordered, unrestricted in ORDERED_PAIRS.items():
+            if ordered not in methods or unrestricted not in methods:
+                continue
+            o, u = methods[ordered], methods[unrestricted]
+            rows.append({"family": family, "size": size, "method": ordered,
+                         "steps": o["clashing_pairs"], "unrestricted_steps": u["clashing_pairs"],
+                         "step_ratio": (u["clashing_pairs"] / o["clashing_pairs"] if o["clashing_pairs"]
+                                        else 1.0 if not u["clashing_pairs"] else math.inf),
+                         "closure": o["closure_size"], "unrestricted_closure": u["closure_size"],
+                         "total": statistics.median(o["total"]),
+                         "unrestricted_total": statistics.median(u["total"]),
+                         "valid": o["valid"], "unrestricted_valid": u["valid"]})
+    return rows
+
+
+def _parse_sizes(specs):
+    sizes = {}
+    for spec in specs or []:
+        family, _, values = spec.partition("=")
+        if family not in FAMILIES or not values:
+            raise argparse.ArgumentTypeError(f"invalid --sizes entry {spec!r}")
+        sizes[family] = [int(v) for v in values.split(",")]
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Scaling benchmarks for RES-SAT on generated instances")
+    parser.add_argument("--families", nargs="+", choices=list(FAMILIES), default=list(FAMILIES),
+                        help="Instance families to run")
+    parser.add_argument("--sizes", nargs="+", metavar="FAMILY=N,N,...",
+                        help="Override the sizes swept for a family, e.g. random=6,8,10")
+    parser.add_argument("--methods", nargs="+", choices=list(METHODS), default=DEFAULT_METHODS,
+                        help="Resolvent generation methods to measure (default: minimal standard)")
+    parser.add_argument("--files", nargs="+", metavar="CNF",
+                        help="Measure these DIMACS files instead of the generated families")
+    parser.add_argument("--repeats", type=int, default=7, help="Timed runs per instance and method")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the instance generators")
+    parser.add_argument("--output", default="benchmark_results.json", help="Where to write the results")
+    parser.add_argument("--baseline", help="Earlier results file to check for regressions")
+    parser.add_argument("--alpha", type=float, default=0.05, help="Significance level of the regression test")
+    parser.add_argument("--min-change", type=float, default=0.05,
+                        help="Smallest relative slowdown reported as a regression")
+    parser.add_argument("--dump", metavar="DIR", help="Also write the generated instances as DIMACS files")
+    args = parser.parse_args()
+
+    if args.files:
+        results = run_files(args.files, args.methods, repeats=args.repeats)
+    else:
+        results = run_suite(args.families, _parse_sizes(args.sizes), args.methods,
+                            repeats=args.repeats, seed=args.seed, dump_dir=args.dump)
+    save_results(results, args.output)
+    print(f"Results written to {args.output}")
+
+    print("\nMinimal vs standard generation (median total time):")
+    for row in compare_methods(results, args.alpha):
+        mark = "*" if row["significant"] else " "
+        print(f"  {row['family']:8} size={row['size']:<4} minimal={row['minimal_total']:.4f}s "
+              f"standard={row['standard_total']:.4f}s p={row['p']:.3f}{mark} "
+              f"closure {row['minimal_closure']} vs {row['standard_closure']}")
+
+    ordered = compare_ordered(results)
+    if ordered:
+        print("\nOrdered vs unrestricted resolution (resolution steps, closure, median total time, valid):")
+        for row in ordered:
+            print(f"  {row['family']:8} {row['size']:<36} {row['method']:15} "
+                  f"steps {row['steps']} vs {row['unrestricted_steps']} ({row['step_ratio']:.1f}x fewer) "
+                  f"closure {row['closure']} vs {row['unrestricted_closure']} "
+                  f"time {row['total']:.4f}s vs {row['unrestricted_total']:.4f}s "
+                  f"valid {row['valid']} vs {row['unrestricted_valid']}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"\nComparing against {args.baseline} (commit {baseline['meta'].get('commit')}):")
+        regressions = compare_to_baseline(results, baseline["results"], args.alpha, args.min_change)
+        for r in regressions:
+            family, size, method = r["key"]
+            p = f" p={r['p']:.3f}" if r["p"] is not None else ""
+            print(f"  REGRESSION {family} size={size} {method} {r['metric']}: {r['before']} -> {r['after']}{p}")
+        if regressions:
+            sys.exit(1)
+        print("  no significant regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,106 +1,88 @@
 # benchmarking.py
-import time
+# pandas dan matplotlib diimpor di dalam fungsi yang memakainya, karena
+# mengimpornya memakan ratusan milidetik.
 import os
-import psutil
-import matplotlib.pyplot as plt
-from cnf_parser import parse_cnf
-from resolvent_generator import generate_resolvents_minimal, generate_resolvents
-from res_sat import res_sat
-from validator import validate_interpretation
-import pandas as pd
-import numpy as np
+from .trial import measure_trial, run_isolated, run_trials
 import argparse
 
-def measure_performance(cnf_file, use_minimal=True, verbose=True):
+def measure_performance(cnf_file, use_minimal=True, verbose=True, isolated=True, cpu=None, profile_dir=None):
     """
     Mengukur performa algoritma RES-SAT untuk sebuah file CNF.
+
+    Secara default pengukuran dijalankan di proses Python baru (trial.run_isolated),
+    sehingga puncak RSS (ru_maxrss) hanya mencakup percobaan ini dan tidak
+    dipengaruhi oleh percobaan sebelumnya.
     
     Args:
         cnf_file: Path ke file CNF
         use_minimal: Boolean untuk menentukan apakah menggunakan resolvent minimal
         verbose: Boolean untuk menentukan apakah output detail ditampilkan
+        isolated: Boolean, jalankan percobaan di subprocess terpisah
+        cpu: Nomor CPU untuk subprocess (opsional, hanya Linux)
+        profile_dir: Folder untuk profil per tahap (.pstats, .collapsed, summary.txt), opsional
     
     Returns:
-        Dictionary berisi metrik performa
+        Dictionary berisi metrik performa (waktu wall dan CPU per tahap,
+        puncak RSS dalam MB, dan penghitung solver)
     """
-    # Ukur penggunaan memori awal
-    process = psutil.Process(os.getpid())
-    start_memory = process.memory_info().rss / 1024 / 1024  # dalam MB
-    
-    # Parse file CNF
-    start_time = time.time()
-    num_vars, clauses, _ = parse_cnf(cnf_file)
-    parse_time = time.time() - start_time
-    
-    if verbose:
-        print(f"File: {cnf_file}")
-        print(f"Jumlah variabel: {num_vars}")
-        print(f"Jumlah klausa awal: {len(clauses)}")
-    
-    # Generasi resolvent
-    start_time = time.time()
-    if use_minimal:
-        R = generate_resolvents_minimal(clauses)
+    if isolated:
+        result = run_isolated(cnf_file, use_minimal=use_minimal, profile_dir=profile_dir, cpu=cpu)
     else:
-        R = generate_resolvents(clauses)
-    resolvent_time = time.time() - start_time
-    
-    if verbose:
-        print(f"Jumlah klausa setelah resolusi: {len(R)}")
-    
-    # Jalankan RES-SAT
-    start_time = time.time()
-    interpretation = res_sat(R, num_vars)
-    res_sat_time = time.time() - start_time
-    
-    # Ukur penggunaan memori akhir
-    end_memory = process.memory_info().rss / 1024 / 1024  # dalam MB
-    memory_used = end_memory - start_memory
-    
-    # Validasi hasil
-    start_time = time.time()
-    valid = validate_interpretation(clauses, interpretation)
-    validation_time = time.time() - start_time
+        result = measure_trial(cnf_file, use_minimal=use_minimal, profile_dir=profile_dir)
+    if verbose and profile_dir:
+        print_profile_summary(profile_dir)
     
     if verbose:
-        print(f"Interpretasi valid: {valid}")
-        print(f"Waktu parsing: {parse_time:.4f} detik")
-        print(f"Waktu resolusi: {resolvent_time:.4f} detik")
-        print(f"Waktu RES-SAT: {res_sat_time:.4f} detik")
-        print(f"Waktu validasi: {validation_time:.4f} detik")
-        print(f"Total waktu: {parse_time + resolvent_time + res_sat_time + validation_time:.4f} detik")
-        print(f"Penggunaan memori: {memory_used:.2f} MB")
-    
-    return {
-        "file": os.path.basename(cnf_file),
-        "num_vars": num_vars,
-        "num_clauses_orig": len(clauses),
-        "num_clauses_res": len(R),
-        "parse_time": parse_time,
-        "resolvent_time": resolvent_time,
-        "res_sat_time": res_sat_time,
-        "validation_time": validation_time,
-        "total_time": parse_time + resolvent_time + res_sat_time + validation_time,
-        "memory_used": memory_used,
-        "valid": valid,
-        "method": "minimal" if use_minimal else "standard"
-    }
+        print(f"File: {cnf_file}")
+        print(f"Jumlah variabel: {result['num_vars']}")
+        print(f"Jumlah klausa awal: {result['num_clauses_orig']}")
+        print(f"Jumlah klausa setelah resolusi: {result['num_clauses_res']}")
+        print(f"Interpretasi valid: {result['valid']}")
+        print(f"Waktu parsing: {result['parse_time']:.4f} detik (CPU {result['parse_cpu']:.4f})")
+        print(f"Waktu resolusi: {result['resolvent_time']:.4f} detik (CPU {result['resolvent_cpu']:.4f})")
+        print(f"Waktu RES-SAT: {result['res_sat_time']:.4f} detik (CPU {result['res_sat_cpu']:.4f})")
+        print(f"Waktu validasi: {result['validation_time']:.4f} detik (CPU {result['validation_cpu']:.4f})")
+        print(f"Total waktu: {result['total_time']:.4f} detik (CPU {result['total_cpu']:.4f})")
+        print(f"Penggunaan memori: {result['memory_used']:.2f} MB (puncak RSS {result['peak_rss']:.2f} MB)")
+    
+    return result
+
+def print_profile_summary(profile_dir):
+    """
+    Menampilkan tabel fungsi terberat per tahap yang ditulis oleh PhaseProfiler.
+    """
+    with open(os.path.join(profile_dir, "summary.txt")) as f:
+        print(f.read())
+    print(f"Profil disimpan di {profile_dir}")
 
-def compare_methods(cnf_file, output_file=None):
+def compare_methods(cnf_file, output_file=None, jobs=1, profile_dir=None):
     """
     Membandingkan performa metode standard dan minimal pada file CNF.
     
     Args:
         cnf_file: Path ke file CNF
         output_file: Path untuk menyimpan hasil perbandingan (opsional)
+        jobs: Jumlah percobaan yang dijalankan bersamaan (masing-masing di CPU sendiri)
+        profile_dir: Folder profil (opsional); tiap metode mendapat subfolder sendiri
     """
     print(f"Membandingkan metode untuk file: {cnf_file}")
     
+    trials = [(cnf_file, True), (cnf_file, False)]
+    if profile_dir:
+        trials = [(cnf_file, True, os.path.join(profile_dir, "minimal")),
+                  (cnf_file, False, os.path.join(profile_dir, "standard"))]
+    minimal_result, standard_result = run_trials(trials, jobs=jobs)
+    if profile_dir:
+        for trial in trials:
+            print_profile_summary(trial[2])
+    
     print("\n=== Metode Resolvent Minimal ===")
-    minimal_result = measure_performance(cnf_file, use_minimal=True)
+    print(f"  Waktu: {minimal_result['total_time']:.4f}s, CPU: {minimal_result['total_cpu']:.4f}s, "
+          f"Puncak RSS: {minimal_result['peak_rss']:.2f}MB")
     
     print("\n=== Metode Resolvent Standard ===")
-    standard_result = measure_performance(cnf_file, use_minimal=False)
+    print(f"  Waktu: {standard_result['total_time']:.4f}s, CPU: {standard_result['total_cpu']:.4f}s, "
+          f"Puncak RSS: {standard_result['peak_rss']:.2f}MB")
     
     # Bandingkan hasil
     print("\n=== Perbandingan ===")
@@ -122,6 +104,7 @@ def compare_methods(cnf_file, output_file=None):
     
     # Simpan hasil jika diminta
     if output_file:
+        import pandas as pd
         results_df = pd.DataFrame([minimal_result, standard_result])
         results_df.to_csv(output_file, index=False)
         print(f"Hasil disimpan ke {output_file}")
@@ -155,6 +138,8 @@ def create_comparison_plots(minimal_result, standard_result):
     }
     
     # Buat plot
+    import matplotlib.pyplot as plt
+    import pandas as pd
     plt.figure(figsize=(15, 10))
     
     # Plot 1: Waktu eksekusi per tahap
@@ -191,29 +176,38 @@ def create_comparison_plots(minimal_result, standard_result):
     print("Visualisasi perbandingan disimpan ke comparison_results.png")
     plt.close()
 
-def run_multiple_tests(cnf_file, num_runs=5, use_minimal=True, output_file=None):
+def run_multiple_tests(cnf_file, num_runs=5, use_minimal=True, output_file=None, jobs=1, profile_dir=None):
     """
     Menjalankan beberapa kali pengujian pada file CNF yang sama untuk
     mendapatkan statistik performa yang lebih akurat.
+
+    Setiap pengujian berjalan di proses baru, sehingga pengujian berikutnya
+    tidak diuntungkan oleh allocator yang sudah "hangat".
     
     Args:
         cnf_file: Path ke file CNF
         num_runs: Jumlah pengujian yang dilakukan
         use_minimal: Boolean untuk menentukan metode resolvent
         output_file: Path untuk menyimpan hasil (opsional)
+        jobs: Jumlah pengujian yang dijalankan bersamaan (masing-masing di CPU sendiri)
+        profile_dir: Folder profil (opsional); tiap pengujian mendapat subfolder run-<i>
     """
     print(f"Menjalankan {num_runs} kali pengujian pada file: {cnf_file}")
     print(f"Metode: {'Minimal' if use_minimal else 'Standard'}")
     
-    results = []
+    if profile_dir:
+        trials = [(cnf_file, use_minimal, os.path.join(profile_dir, f"run-{i+1}")) for i in range(num_runs)]
+    else:
+        trials = [(cnf_file, use_minimal)] * num_runs
+    results = run_trials(trials, jobs=jobs)
     
-    for i in range(num_runs):
+    for i, result in enumerate(results):
         print(f"\nPengujian ke-{i+1}:")
-        result = measure_performance(cnf_file, use_minimal=use_minimal, verbose=False)
-        results.append(result)
-        print(f"  Waktu: {result['total_time']:.4f}s, Memori: {result['memory_used']:.2f}MB")
+        print(f"  Waktu: {result['total_time']:.4f}s, CPU: {result['total_cpu']:.4f}s, "
+              f"Memori: {result['memory_used']:.2f}MB, Puncak RSS: {result['peak_rss']:.2f}MB")
     
     # Buat DataFrame dari hasil
+    import pandas as pd
     df = pd.DataFrame(results)
     
     # Hitung statistik
@@ -242,11 +236,23 @@ def run_multiple_tests(cnf_file, num_runs=5, use_minimal=True, output_file=None)
             'min': df['total_time'].min(),
             'max': df['total_time'].max()
         },
+        'total_cpu': {
+            'mean': df['total_cpu'].mean(),
+            'std': df['total_cpu'].std(),
+            'min': df['total_cpu'].min(),
+            'max': df['total_cpu'].max()
+        },
         'memory_used': {
             'mean': df['memory_used'].mean(),
             'std': df['memory_used'].std(),
             'min': df['memory_used'].min(),
             'max': df['memory_used'].max()
+        },
+        'peak_rss': {
+            'mean': df['peak_rss'].mean(),
+            'std': df['peak_rss'].std(),
+            'min': df['peak_rss'].min(),
+            'max': df['peak_rss'].max()
         }
     }
     
@@ -256,7 +262,9 @@ def run_multiple_tests(cnf_file, num_runs=5, use_minimal=True, output_file=None)
     print(f"Waktu resolusi: {stats['resolvent_time']['mean']:.4f} ± {stats['resolvent_time']['std']:.4f} detik")
     print(f"Waktu RES-SAT: {stats['res_sat_time']['mean']:.4f} ± {stats['res_sat_time']['std']:.4f} detik")
     print(f"Waktu total: {stats['total_time']['mean']:.4f} ± {stats['total_time']['std']:.4f} detik")
+    print(f"Waktu CPU total: {stats['total_cpu']['mean']:.4f} ± {stats['total_cpu']['std']:.4f} detik")
     print(f"Penggunaan memori: {stats['memory_used']['mean']:.2f} ± {stats['memory_used']['std']:.2f} MB")
+    print(f"Puncak RSS: {stats['peak_rss']['mean']:.2f} ± {stats['peak_rss']['std']:.2f} MB")
     
     # Visualisasikan hasil
     create_multiple_runs_plot(df)
@@ -275,6 +283,7 @@ def create_multiple_runs_plot(df):
     Args:
         df: DataFrame berisi hasil beberapa kali pengujian
     """
+    import matplotlib.pyplot as plt
     plt.figure(figsize=(12, 8))
     
     # Plot 1: Waktu eksekusi per pengujian
@@ -331,6 +340,12 @@ def main():
                       help="Output file for benchmark results")
     parser.add_argument("--standard", action="store_true", 
                       help="Use standard resolvent generation (default: minimal)")
+    parser.add_argument("--jobs", type=int, default=1,
+                      help="Number of isolated trials run concurrently, each pinned to its own CPU")
+    parser.add_argument("--no-isolation", action="store_true",
+                      help="Measure a single run in this process instead of a fresh subprocess")
+    parser.add_argument("--profile", nargs="?", const="profiles", metavar="DIR",
+                      help="Profile each phase and write .pstats and collapsed stacks to DIR (default: profiles)")
     
     args = parser.parse_args()
     
@@ -340,13 +355,15 @@ def main():
         return
     
     if args.compare:
-        compare_methods(args.file, args.output)
+        compare_methods(args.file, args.output, jobs=args.jobs, profile_dir=args.profile)
     else:
         if args.runs > 1:
             run_multiple_tests(args.file, num_runs=args.runs, 
-                            use_minimal=not args.standard, output_file=args.output)
+                            use_minimal=not args.standard, output_file=args.output, jobs=args.jobs,
+                            profile_dir=args.profile)
         else:
-            measure_performance(args.file, use_minimal=not args.standard)
+            measure_performance(args.file, use_minimal=not args.standard, isolated=not args.no_isolation,
+                                profile_dir=args.profile)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,93 @@
+from collections import defaultdict, deque
+from .utils import complement, is_tautology
+
+
+def is_blocked(clause, literal, occurrences):
+    """
+    Check whether `clause` is blocked on `literal`.
+
+    A clause C is blocked on a literal l in C if every resolvent of C with a
+    clause D containing ¬l (resolving on l) is a tautology.
+
+    Args:
+        clause (frozenset): the candidate clause.
+        literal (int): a literal of `clause`.
+        occurrences (dict): maps each literal to the set of live clauses containing it.
+
+    Returns:
+        bool: True if `clause` is blocked on `literal`.
+    """
+    rest = clause - {literal}
+    for other in occurrences.get(complement(literal), ()):
+        resolvent = rest | (other - {complement(literal)})
+        if not is_tautology(resolvent):
+            return False
+    return True
+
+
+def eliminate_blocked_clauses(clauses):
+    """
+    Remove blocked clauses from a CNF formula.
+
+    Every literal is queued once at the start. Whenever a clause C is removed,
+    the clauses containing the complement of one of C's literals have lost a
+    resolution partner and may have become blocked, so those complements are
+    queued again.
+
+    Args:
+        clauses (iterable of frozenset): the original clauses.
+
+    Returns:
+        remaining (list of frozenset): the clauses that were not eliminated.
+        stack (list of tuple): (clause, blocking literal) pairs in elimination
+            order, to be passed to `reconstruct_interpretation`.
+    """
+    clauses = list(clauses)
+    remaining = set(clauses)
+    occurrences = defaultdict(set)
+    for clause in remaining:
+        for literal in clause:
+            occurrences[literal].add(clause)
+
+    queue = deque(occurrences)
+    queued = set(queue)
+    stack = []
+    while queue:
+        literal = queue.popleft()
+        queued.discard(literal)
+        for clause in list(occurrences.get(literal, ())):
+            if clause not in remaining or not is_blocked(clause, literal, occurrences):
+                continue
+            remaining.discard(clause)
+            stack.append((clause, literal))
+            for l in clause:
+                occurrences[l].discard(clause)
+                if complement(l) not in queued:
+                    queue.append(complement(l))
+                    queued.add(complement(l))
+    return [clause for clause in clauses if clause in remaining], stack
+
+
+def reconstruct_interpretation(interpretation, stack):
+    """
+    Extend an interpretation of the reduced formula to one of the original formula.
+
+    Eliminated clauses are visited in reverse elimination order; whenever one is
+    falsified, its blocking literal is flipped to true. Flipping never falsifies
+    a clause eliminated later (or kept), because every such clause containing the
+    complement of the blocking literal also contains the complement of another
+    literal of the blocked clause, which is already true.
+
+    Args:
+        interpretation (set of int): a satisfying interpretation of the reduced formula.
+        stack (list of tuple): the stack returned by `eliminate_blocked_clauses`.
+
+    Returns:
+        set of int: the repaired interpretation.
+    """
+    T = set(interpretation)
+    for clause, literal in reversed(stack):
+        if clause.isdisjoint(T):
+            T.discard(complement(literal))
+            T.add(literal)
+    return T
@@ -0,0 +1,46 @@
+import time
+
+
+class CancellationToken:
+    """
+    Cooperative stop signal for the resolver, res_sat and validation.
+
+    A token is cancelled when its deadline (a time.monotonic() value,
+    `time_budget` seconds from creation by default) has passed, or once
+    cancel() has been called, e.g. from another thread or from an asyncio
+    task whose caller gave up. Long loops poll `cancelled` at cheap points
+    (once per row of pairs, per variable, ...) and return their best partial
+    result instead of blocking.
+    """
+
+    def __init__(self, time_budget=None, deadline=None):
+        if time_budget is not None:
+            deadline = time.monotonic() + time_budget
+        self.deadline = deadline
+        self._cancelled = False
+
+    def cancel(self):
+        """Requests a stop; safe to call from any thread."""
+        self._cancelled = True
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled or (self.deadline is not None and time.monotonic() >= self.deadline)
+
+    def remaining(self):
+        """Seconds left before the deadline (None without one, 0 once cancelled)."""
+        if self._cancelled:
+            return 0.0
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+
+def as_token(deadline):
+    """
+    Normalises a `deadline` argument: None, a CancellationToken, or a time
+    budget in seconds (which starts now).
+    """
+    if deadline is None or hasattr(deadline, "cancelled"):
+        return deadline
+    return CancellationToken(time_budget=deadline)
@@ -0,0 +1,303 @@
+import heapq
+from .cancellation import as_token
+
+
+def _luby(i: int) -> int:
+    """
+    Returns the i-th element (1-based) of the Luby sequence 1 1 2 1 1 2 4 ...
+    """
+    size, power = 1, 1
+    while size < i:
+        power *= 2
+        size = 2 * size + 1
+    while size != i:
+        size //= 2
+        power //= 2
+        if i > size:
+            i -= size
+    return power
+
+
+class _Solver:
+    """
+    State of one CDCL run. Literals are the usual non-zero ints and variables
+    are 1..num_vars. `val` is indexed directly by literal: a list of length
+    2*num_vars+1 maps v to index v and -v to a distinct negative index.
+    """
+
+    def __init__(self, num_vars, var_decay=0.95, clause_decay=0.999):
+        self.num_vars = num_vars
+        self.val = [0] * (2 * num_vars + 1)    # 1 true, -1 false, 0 unassigned, per literal
+        self.level = [0] * (num_vars + 1)
+        self.reason = [None] * (num_vars + 1)  # clause (list) that implied the variable
+        self.phase = [False] * (num_vars + 1)  # saved phase
+        self.activity = [0.0] * (num_vars + 1)
+        self.var_inc = 1.0
+        self.var_decay = var_decay
+        self.clause_inc = 1.0
+        self.clause_decay = clause_decay
+        self.watches = {}                      # literal -> clauses watching it
+        self.trail = []
+        self.trail_lim = []
+        self.qhead = 0
+        self.learnts = []
+        self.clause_activity = {}              # id(clause) -> activity, learnt clauses only
+        self.heap = [(0.0, v) for v in range(1, num_vars + 1)]
+        heapq.heapify(self.heap)
+
+    # -- assignment -------------------------------------------------------
+
+    def assign(self, lit, reason):
+        var = abs(lit)
+        self.val[lit] = 1
+        self.val[-lit] = -1
+        self.level[var] = len(self.trail_lim)
+        self.reason[var] = reason
+        self.trail.append(lit)
+
+    def backtrack(self, level):
+        if len(self.trail_lim) <= level:
+            return
+        start = self.trail_lim[level]
+        for lit in self.trail[start:]:
+            var = abs(lit)
+            self.phase[var] = lit > 0
+            self.val[lit] = self.val[-lit] = 0
+            self.reason[var] = None
+            heapq.heappush(self.heap, (-self.activity[var], var))
+        del self.trail[start:]
+        del self.trail_lim[level:]
+        self.qhead = len(self.trail)
+
+    # -- clauses ----------------------------------------------------------
+
+    def watch(self, clause):
+        self.watches.setdefault(clause[0], []).append(clause)
+        self.watches.setdefault(clause[1], []).append(clause)
+
+    def propagate(self):
+        """
+        Two-watched-literal unit propagation. Returns a conflicting clause or None.
+        """
+        val, trail, watches = self.val, self.trail, self.watches
+        while self.qhead < len(trail):
+            false_lit = -trail[self.qhead]
+            self.qhead += 1
+            watchers = watches.get(false_lit)
+            if not watchers:
+                continue
+            kept = []
+            i, n = 0, len(watchers)
+            while i < n:
+                clause = watchers[i]
+                i += 1
+                first = clause[0]
+                if first == false_lit:
+                    first = clause[1]
+                    clause[0], clause[1] = first, false_lit
+                if val[first] == 1:
+                    kept.append(clause)
+                    continue
+                for k in range(2, len(clause)):
+                    other = clause[k]
+                    if val[other] != -1:
+                        clause[1], clause[k] = other, false_lit
+                        watches.setdefault(other, []).append(clause)
+                        break
+                else:
+                    kept.append(clause)
+                    if val[first] == -1:
+                        kept.extend(watchers[i:])
+                        watches[false_lit] = kept
+                        return clause
+                    self.assign(first, clause)
+            watches[false_lit] = kept
+        return None
+
+    # -- heuristics -------------------------------------------------------
+
+    def bump_var(self, var):
+        self.activity[var] += self.var_inc
+        if self.activity[var] > 1e100:
+            self.activity = [a * 1e-100 for a in self.activity]
+            self.var_inc *= 1e-100
+            self.heap = [(-self.activity[v], v) for v in range(1, self.num_vars + 1) if self.val[v] == 0]
+            heapq.heapify(self.heap)
+        if self.val[var] == 0:
+            heapq.heappush(self.heap, (-self.activity[var], var))
+
+    def bump_clause(self, clause):
+        key = id(clause)
+        if key in self.clause_activity:
+            self.clause_activity[key] += self.clause_inc
+            if self.clause_activity[key] > 1e20:
+                for k in self.clause_activity:
+                    self.clause_activity[k] *= 1e-20
+                self.clause_inc *= 1e-20
+
+    def pick_branch_var(self):
+        while self.heap:
+            neg_act, var = heapq.heappop(self.heap)
+            if self.val[var] == 0 and -neg_act == self.activity[var]:
+                return var
+        for var in range(1, self.num_vars + 1):
+            if self.val[var] == 0:
+                return var
+        return None
+
+    # -- learning ---------------------------------------------------------
+
+    def analyze(self, conflict):
+        """
+        First-UIP conflict analysis.
+
+        Returns:
+            learnt (list): the learnt clause, asserting literal first and a
+                literal of the backjump level second.
+            level (int): the backjump level.
+        """
+        seen = set()
+        learnt = [None]
+        counter = 0
+        current = len(self.trail_lim)
+        index = len(self.trail) - 1
+        clause = conflict
+        lit = None
+        while True:
+            self.bump_clause(clause)
+            for q in clause:
+                if q == lit:
+                    continue
+                var = abs(q)
+                if var not in seen and self.level[var] > 0:
+                    seen.add(var)
+                    self.bump_var(var)
+                    if self.level[var] == current:
+                        counter += 1
+                    else:
+                        learnt.append(q)
+            while abs(self.trail[index]) not in seen:
+                index -= 1
+            lit = self.trail[index]
+            index -= 1
+            clause = self.reason[abs(lit)]
+            seen.discard(abs(lit))
+            counter -= 1
+            if counter == 0:
+                break
+        learnt[0] = -lit
+
+        if len(learnt) == 1:
+            return learnt, 0
+        best = max(range(1, len(learnt)), key=lambda k: self.level[abs(learnt[k])])
+        learnt[1], learnt[best] = learnt[best], learnt[1]
+        return learnt, self.level[abs(learnt[1])]
+
+    def reduce_learnts(self):
+        """
+        Deletes the less active half of the learnt clauses, keeping binary
+        clauses and clauses that are currently the reason for an assignment.
+        """
+        locked = {id(self.reason[abs(lit)]) for lit in self.trail if self.reason[abs(lit)] is not None}
+        self.learnts.sort(key=lambda c: self.clause_activity[id(c)])
+        half = len(self.learnts) // 2
+        keep, removed = [], set()
+        for k, clause in enumerate(self.learnts):
+            if k < half and len(clause) > 2 and id(clause) not in locked:
+                removed.add(id(clause))
+                del self.clause_activity[id(clause)]
+            else:
+                keep.append(clause)
+        self.learnts = keep
+        for lit, watchers in self.watches.items():
+            self.watches[lit] = [c for c in watchers if id(c) not in removed]
+
+
+def cdcl_sat(clauses, num_vars: int, restart_base=100, deadline=None, stats=None):
+    """
+    Conflict-driven clause learning SAT solver.
+
+    Uses two-watched-literal propagation, first-UIP learning, VSIDS variable
+    activity with phase saving, Luby restarts and deletion of inactive learnt
+    clauses.
+
+    Input:
+      - clauses: iterable of clauses (each clause is a frozenset of ints)
+      - num_vars: number of atoms (assumed to be numbered 1 to num_vars)
+      - restart_base: number of conflicts per unit of the Luby restart sequence
+      - deadline: optional time budget in seconds or CancellationToken,
+        polled at every conflict and decision; once it is cancelled the
+        search gives up and returns None with stats["truncated"] set (so
+        check the token or `stats` to tell a timeout from unsatisfiability)
+      - stats: optional dict receiving "truncated"
+
+    Returns:
+      - T: a set of literals representing a satisfying interpretation, or
+        None if the formula is unsatisfiable or the deadline stopped the search.
+    """
+    deadline = as_token(deadline)
+    if stats is not None:
+        stats["truncated"] = False
+    solver = _Solver(num_vars)
+    units = []
+    for clause in clauses:
+        if any(-l in clause for l in clause):
+            continue  # tautology
+        lits = list(clause)
+        if not lits:
+            return None
+        if len(lits) == 1:
+            units.append(lits[0])
+        else:
+            solver.watch(lits)
+    num_original = sum(len(w) for w in solver.watches.values()) // 2
+
+    for lit in units:
+        if solver.val[lit] == -1:
+            return None
+        if solver.val[lit] == 0:
+            solver.assign(lit, None)
+    if solver.propagate() is not None:
+        return None
+
+    max_learnts = max(num_original // 3, 100)
+    restarts = 0
+    conflicts_until_restart = restart_base * _luby(1)
+    while True:
+        if deadline is not None and deadline.cancelled:
+            if stats is not None:
+                stats["truncated"] = True
+            return None
+        conflict = solver.propagate()
+        if conflict is not None:
+            if not solver.trail_lim:
+                return None
+            learnt, level = solver.analyze(conflict)
+            solver.backtrack(level)
+            if len(learnt) == 1:
+                solver.assign(learnt[0], None)
+            else:
+                solver.watch(learnt)
+                solver.learnts.append(learnt)
+                solver.clause_activity[id(learnt)] = 0.0
+                solver.bump_clause(learnt)
+                solver.assign(learnt[0], learnt)
+            solver.var_inc /= solver.var_decay
+            solver.clause_inc /= solver.clause_decay
+            conflicts_until_restart -= 1
+            continue
+
+        if conflicts_until_restart <= 0:
+            restarts += 1
+            conflicts_until_restart = restart_base * _luby(restarts + 1)
+            solver.backtrack(0)
+            continue
+        if len(solver.learnts) - len(solver.trail) >= max_learnts:
+            solver.reduce_learnts()
+            max_learnts = int(max_learnts * 1.1)
+
+        var = solver.pick_branch_var()
+        if var is None:
+            return {v if solver.val[v] == 1 else -v for v in range(1, num_vars + 1)}
+        solver.trail_lim.append(len(solver.trail))
+        solver.assign(var if solver.phase[var] else -var, None)
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import os
+import time
+
+FORMAT = 1
+
+
+def encode_clauses(clauses) -> list:
+    """Flattens clauses to one list of literals, each clause ended by 0 (as in DIMACS)."""
+    flat = []
+    for clause in clauses:
+        flat.extend(clause)
+        flat.append(0)
+    return flat
+
+
+def decode_clauses(flat) -> list:
+    """Inverse of encode_clauses; returns a list of frozensets in the stored order."""
+    clauses, current = [], []
+    for literal in flat:
+        if literal == 0:
+            clauses.append(frozenset(current))
+            current = []
+        else:
+            current.append(literal)
+    return clauses
+
+
+def clauses_digest(clauses) -> str:
+    """Order-independent hash of a clause collection, used to tie a checkpoint to its input."""
+    canonical = sorted(sorted(clause) for clause in set(map(frozenset, clauses)))
+    return hashlib.sha256(json.dumps(canonical).encode()).hexdigest()
+
+
+class Checkpoint:
+    """
+    A saturation checkpoint file.
+
+    Pass one as the `checkpoint` argument of generate_resolvents or
+    generate_resolvents_minimal. The state is saved at every iteration
+    boundary or, if `interval` is given, whenever `interval` seconds have
+    passed (between rows of the pairwise loop, so a long iteration is not
+    lost either) and once more when saturation ends.
+
+    The file is gzip-compressed JSON: the parameters, the iteration counter,
+    the clause set, the resolvents of the running (or last) round and the
+    solver counters. Writes go to a temporary file in the same directory
+    that is fsynced and then renamed over the checkpoint, so a crash leaves
+    either the previous or the new checkpoint, never a partial one.
+
+    With `resume=True`, an existing checkpoint is loaded and saturation
+    continues from it; otherwise it is overwritten.
+    """
+
+    def __init__(self, path, interval=None, resume=False):
+        self.path = path
+        self.interval = interval
+        self.resume = resume
+        self._last_save = time.monotonic()
+
+    def due(self) -> bool:
+        """True when `interval` seconds have passed since the last save."""
+        return self.interval is not None and time.monotonic() - self._last_save >= self.interval
+
+    def load(self):
+        """The saved state, or None if not resuming or there is no checkpoint yet."""
+        if not self.resume or not os.path.exists(self.path):
+            return None
+        import gzip  # gzip and tempfile are imported on use to keep solver start-up fast
+        with gzip.open(self.path, "rt") as f:
+            state = json.load(f)
+        if state.get("format") != FORMAT:
+            raise ValueError(f"{self.path}: unsupported checkpoint format {state.get('format')}")
+        return state
+
+    def save(self, state):
+        """Atomically replaces the checkpoint with `state` (a JSON-serialisable dict)."""
+        import gzip
+        import tempfile
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temporary = tempfile.mkstemp(dir=directory, prefix=".checkpoint-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=1) as f:
+                    f.write(json.dumps({"format": FORMAT, **state}).encode())
+                raw.flush()
+                os.fsync(raw.fileno())
+            os.replace(temporary, self.path)
+        except BaseException:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+            raise
+        if hasattr(os, "O_DIRECTORY"):
+            # make the rename itself durable
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        self._last_save = time.monotonic()
@@ -0,0 +1,142 @@
+from array import array
+
+
+class ClauseArena:
+    """
+    Compact clause store.
+
+    The literals of all clauses live in one array('i'); clause `cid` occupies
+    lits[offsets[cid]:offsets[cid] + lengths[cid]], sorted ascending. Clauses
+    are identified by integer IDs and deduplicated through a dict from content
+    hash to clause ID. Removed clauses are only marked dead (tombstones); their
+    space is reclaimed by `compact`, which renumbers the live clauses.
+
+    Iterating over an arena yields frozensets, so it can be passed anywhere a
+    collection of clauses is expected; `iter_clauses` yields plain tuples and
+    avoids building sets.
+    """
+
+    def __init__(self, clauses=()):
+        self._reset()
+        for clause in clauses:
+            self.add(clause)
+
+    def _reset(self):
+        self.lits = array('i')
+        self.offsets = array('q')
+        self.lengths = array('i')
+        self.alive = bytearray()
+        self._index = {}  # content hash -> clause ID, or list of IDs on collision
+        self._live = 0
+
+    def __len__(self):
+        return self._live
+
+    def __iter__(self):
+        for clause in self.iter_clauses():
+            yield frozenset(clause)
+
+    def __contains__(self, clause):
+        return self.find(clause) is not None
+
+    @property
+    def num_dead(self):
+        """Number of tombstoned clauses still occupying space."""
+        return len(self.alive) - self._live
+
+    def clause(self, cid: int) -> tuple:
+        """Returns the literals of clause `cid` as a sorted tuple."""
+        start = self.offsets[cid]
+        return tuple(self.lits[start:start + self.lengths[cid]])
+
+    def ids(self):
+        """Iterates over the IDs of the live clauses."""
+        alive = self.alive
+        return (cid for cid in range(len(alive)) if alive[cid])
+
+    def iter_clauses(self):
+        """Iterates over the live clauses as sorted tuples of literals."""
+        lits, offsets, lengths, alive = self.lits, self.offsets, self.lengths, self.alive
+        for cid in range(len(alive)):
+            if alive[cid]:
+                start = offsets[cid]
+                yield tuple(lits[start:start + lengths[cid]])
+
+    def _candidates(self, key):
+        entry = self._index.get(hash(key))
+        if entry is None:
+            return ()
+        return entry if isinstance(entry, list) else (entry,)
+
+    def find(self, clause):
+        """Returns the ID of the live clause with the same literals, or None."""
+        key = tuple(sorted(clause))
+        for cid in self._candidates(key):
+            if self.alive[cid] and self.clause(cid) == key:
+                return cid
+        return None
+
+    def add(self, clause):
+        """
+        Adds a clause unless it is already stored.
+
+        Returns:
+            cid (int): the ID of the stored clause.
+            added (bool): False if the clause was already present.
+        """
+        key = tuple(sorted(clause))
+        for cid in self._candidates(key):
+            if self.alive[cid] and self.clause(cid) == key:
+                return cid, False
+        cid = len(self.alive)
+        self.offsets.append(len(self.lits))
+        self.lengths.append(len(key))
+        self.lits.extend(key)
+        self.alive.append(1)
+        self._live += 1
+        h = hash(key)
+        entry = self._index.get(h)
+        if entry is None:
+            self._index[h] = cid
+        elif isinstance(entry, list):
+            entry.append(cid)
+        else:
+            self._index[h] = [entry, cid]
+        return cid, True
+
+    def remove(self, cid: int):
+        """Marks clause `cid` as deleted."""
+        if self.alive[cid]:
+            self.alive[cid] = 0
+            self._live -= 1
+
+    def compact(self):
+        """
+        Drops tombstoned clauses and renumbers the live ones (keeping their order).
+
+        Returns:
+            dict: maps the old ID of every live clause to its new ID.
+        """
+        clauses = [(cid, self.clause(cid)) for cid in self.ids()]
+        self._reset()
+        return {old: self.add(clause)[0] for old, clause in clauses}
+
+    def maybe_compact(self, max_garbage=0.5):
+        """Compacts the arena once more than `max_garbage` of its clauses are dead."""
+        if self.num_dead > max_garbage * len(self.alive):
+            self.compact()
+
+    def copy(self):
+        other = ClauseArena()
+        other.lits = array('i', self.lits)
+        other.offsets = array('q', self.offsets)
+        other.lengths = array('i', self.lengths)
+        other.alive = bytearray(self.alive)
+        other._index = {h: list(e) if isinstance(e, list) else e for h, e in self._index.items()}
+        other._live = self._live
+        return other
+
+    def nbytes(self) -> int:
+        """Approximate size of the flat buffers in bytes (excluding the hash index)."""
+        return (self.lits.itemsize * len(self.lits) + self.offsets.itemsize * len(self.offsets)
+                + self.lengths.itemsize * len(self.lengths) + len(self.alive))
@@ -0,0 +1,46 @@
+import re
+
+def parse_cnf(file_path: str):
+    """
+    Parses a CNF file in DIMACS format.
+    
+    Returns:
+        num_vars (int): number of variables.
+        clauses (list of frozenset): each clause is represented as a frozenset of integers.
+    """
+    with open(file_path, "r") as f:
+        return parse_dimacs_lines(f)
+
+def parse_cnf_text(text: str):
+    """
+    Parses a DIMACS formula given as a string; returns the same as parse_cnf.
+    """
+    return parse_dimacs_lines(text.splitlines())
+
+def parse_dimacs_lines(lines):
+    """
+    Parses an iterable of DIMACS lines; returns the same as parse_cnf.
+    """
+    clauses = []
+    num_vars = None
+    satisfiable = None
+    for line in lines:
+        line = line.strip()
+        if line == "" or line.startswith("c"):
+            if "NOTE: Not Satisfiable" in line:
+                satisfiable = False
+            elif "NOTE: Satisfiable" in line:
+                satisfiable = True
+            continue
+        if line.startswith("p"):
+            # Format: p cnf num_vars num_clauses
+            tokens = line.split()
+            if len(tokens) >= 4 and tokens[1] == "cnf":
+                num_vars = int(tokens[2])
+            continue
+        # Each clause line ends with a 0. Split the line into tokens.
+        tokens = re.split(r'\s+', line)
+        literals = [int(tok) for tok in tokens if tok and int(tok) != 0]
+        if literals:
+            clauses.append(frozenset(literals))
+    return num_vars, clauses, satisfiable
@@ -0,0 +1,133 @@
+from .resolvent_generator import generate_resolvents_minimal, generate_resolvents
+from .res_sat import res_sat
+
+
+def _find(parent, v):
+    """
+    Returns the representative of v, compressing the path on the way.
+    """
+    root = v
+    while parent[root] != root:
+        root = parent[root]
+    while parent[v] != root:
+        parent[v], v = root, parent[v]
+    return root
+
+
+def split_components(clauses, num_vars: int):
+    """
+    Splits a clause set into variable-disjoint components using union-find.
+
+    Args:
+        clauses (iterable of frozenset): the clauses of the formula.
+        num_vars (int): number of atoms (numbered 1 to num_vars).
+
+    Returns:
+        components (list of tuple): (variables, clauses) pairs, where variables
+            is a sorted list of the atoms of the component and clauses is the
+            list of clauses over them. Components are ordered by their smallest variable.
+            An empty clause makes the formula unsatisfiable: it is put first, in a
+            component of its own with no variables.
+        free_vars (list of int): atoms that occur in no clause.
+    """
+    clauses = list(clauses)
+    empty = [clause for clause in clauses if not clause]
+    if empty:
+        clauses = [clause for clause in clauses if clause]
+    parent = list(range(num_vars + 1))
+    used = [False] * (num_vars + 1)
+    for clause in clauses:
+        variables = [abs(l) for l in clause]
+        root = _find(parent, variables[0])
+        for v in variables:
+            used[v] = True
+            other = _find(parent, v)
+            if other != root:
+                parent[other] = root
+
+    groups = {}
+    for v in range(1, num_vars + 1):
+        if used[v]:
+            groups.setdefault(_find(parent, v), []).append(v)
+    component_clauses = {root: [] for root in groups}
+    for clause in clauses:
+        component_clauses[_find(parent, abs(next(iter(clause))))].append(clause)
+
+    components = [(variables, component_clauses[root]) for root, variables in groups.items()]
+    if empty:
+        components.insert(0, ([], empty))
+    free_vars = [v for v in range(1, num_vars + 1) if not used[v]]
+    return components, free_vars
+
+
+def solve_component(variables, clauses, max_iterations=2, max_resolvents=10000, minimal=True):
+    """
+    Runs resolution and RES-SAT on a single component.
+
+    The component's atoms are renumbered to 1..k, keeping their relative order,
+    so that RES-SAT decides them in the same order as on the whole formula.
+
+    Returns:
+        R: the resolution closure of the component (in the original numbering).
+        T: a set of literals over the component's atoms.
+        complete (bool): False if resolution stopped on a limit.
+    """
+    index = {v: i for i, v in enumerate(variables, 1)}
+    renumbered = [frozenset(index[abs(l)] if l > 0 else -index[abs(l)] for l in clause)
+                  for clause in clauses]
+    stats = {}
+    if minimal:
+        R = generate_resolvents_minimal(renumbered, max_iterations=max_iterations,
+                                        max_resolvents=max_resolvents, verbose=False, stats=stats)
+    else:
+        R = generate_resolvents(renumbered, max_iterations=max_iterations,
+                                max_resolvents=max_resolvents, verbose=False, stats=stats)
+    T = res_sat(R, len(variables))
+
+    def restore(l):
+        return variables[l - 1] if l > 0 else -variables[-l - 1]
+
+    return {frozenset(restore(l) for l in clause) for clause in R}, {restore(l) for l in T}, stats["complete"]
+
+
+def solve_decomposed(clauses, num_vars: int, max_iterations=2, max_resolvents=10000,
+                     minimal=True, processes=None, stats=None):
+    """
+    Solves each variable-disjoint component independently and merges the results.
+
+    Atoms that occur in no clause are set to true without any resolution work.
+
+    Args:
+        clauses (iterable of frozenset): the clauses of the formula.
+        num_vars (int): number of atoms.
+        max_iterations, max_resolvents: resolution limits, applied to each component separately.
+        minimal (bool): use generate_resolvents_minimal instead of generate_resolvents.
+        processes (int or None): if greater than 1, components are solved in a
+            process pool of that size; otherwise they are solved sequentially.
+        stats (dict or None): receives "complete", True if every component's
+            closure reached its fixpoint.
+
+    Returns:
+        R: union of the component closures.
+        T: a set of literals assigning every atom 1..num_vars.
+        num_components (int): number of components that were solved.
+    """
+    components, free_vars = split_components(clauses, num_vars)
+    args = [(variables, comp, max_iterations, max_resolvents, minimal) for variables, comp in components]
+
+    if processes and processes > 1 and len(components) > 1:
+        # imported here: multiprocessing is slow to import and most runs are serial
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(solve_component, *zip(*args)))
+    else:
+        results = [solve_component(*a) for a in args]
+
+    R = set()
+    T = set(free_vars)
+    for closure, partial, _ in results:
+        R |= closure
+        T |= partial
+    if stats is not None:
+        stats["complete"] = all(complete for _, _, complete in results)
+    return R, T, len(components)
@@ -0,0 +1,204 @@
+import os
+from array import array
+
+
+def _encode(clause: tuple) -> bytes:
+    return array('i', clause).tobytes()
+
+
+def _decode(blob: bytes) -> tuple:
+    lits = array('i')
+    lits.frombytes(blob)
+    return tuple(lits)
+
+
+class DiskClauseStore:
+    """
+    Out-of-core clause set backed by a local SQLite file.
+
+    Every clause is stored once (sorted literals as a packed int32 blob) and
+    indexed under each of its literals, so the clauses of one pivot literal
+    form a partition that can be read on its own. RAM only holds:
+
+      - a set of content hashes, used to skip the database lookup for clauses
+        that are certainly new (about 60 bytes per clause);
+      - a buffer of pending inserts, flushed when it reaches its share of
+        `memory_limit`;
+      - the partitions being resolved, read in chunks bounded by `memory_limit`;
+      - SQLite's page cache, also sized from `memory_limit`.
+
+    Iterating over a store yields frozensets, so it can be handed to res_sat
+    and validate_interpretation like any other collection of clauses.
+    """
+
+    def __init__(self, path=None, memory_limit=256 * 1024 * 1024):
+        # imported here so that importing the solver stays cheap when no store is used
+        import sqlite3
+        import tempfile
+        if path is None:
+            fd, path = tempfile.mkstemp(suffix=".sqlite", prefix="res_sat_")
+            os.close(fd)
+            self._temporary = True
+        else:
+            self._temporary = False
+        self.path = path
+        self.memory_limit = memory_limit
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=OFF")
+        self.db.execute("PRAGMA synchronous=OFF")
+        self.db.execute(f"PRAGMA cache_size=-{max(memory_limit // 4 // 1024, 1024)}")
+        self.db.execute("CREATE TABLE IF NOT EXISTS clauses (id INTEGER PRIMARY KEY, lits BLOB UNIQUE, size INTEGER)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS occurrences (lit INTEGER, id INTEGER)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS occurrences_lit ON occurrences (lit, id)")
+        self.db.execute("CREATE INDEX IF NOT EXISTS occurrences_id ON occurrences (id)")
+
+        self._hashes = set()
+        self._pending = {}  # blob -> (id, clause) not yet written
+        self._pending_bytes = 0
+        self._count = 0
+        self._next_id = 1
+        for cid, blob in self.db.execute("SELECT id, lits FROM clauses"):
+            self._hashes.add(hash(blob))
+            self._count += 1
+            self._next_id = max(self._next_id, cid + 1)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.db.close()
+        if self._temporary and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, clause):
+        blob = _encode(tuple(sorted(clause)))
+        return self._lookup(blob)
+
+    def __iter__(self):
+        for clause in self.iter_clauses():
+            yield frozenset(clause)
+
+    @property
+    def last_id(self) -> int:
+        """ID of the most recently added clause (IDs grow with insertion order)."""
+        return self._next_id - 1
+
+    def _lookup(self, blob) -> bool:
+        if blob in self._pending:
+            return True
+        if hash(blob) not in self._hashes:
+            return False
+        return self.db.execute("SELECT 1 FROM clauses WHERE lits = ?", (blob,)).fetchone() is not None
+
+    def add(self, clause) -> bool:
+        """Adds a clause; returns False if it was already stored."""
+        key = tuple(sorted(clause))
+        blob = _encode(key)
+        if self._lookup(blob):
+            return False
+        self._pending[blob] = (self._next_id, key)
+        self._next_id += 1
+        self._hashes.add(hash(blob))
+        self._count += 1
+        self._pending_bytes += 100 + 8 * len(key)
+        if self._pending_bytes > self.memory_limit // 4:
+            self.flush()
+        return True
+
+    def update(self, clauses):
+        for clause in clauses:
+            self.add(clause)
+        self.flush()
+
+    def flush(self):
+        """Writes pending inserts to the database."""
+        if not self._pending:
+            return
+        self.db.executemany("INSERT INTO clauses (id, lits, size) VALUES (?, ?, ?)",
+                            ((cid, blob, len(key)) for blob, (cid, key) in self._pending.items()))
+        self.db.executemany("INSERT INTO occurrences (lit, id) VALUES (?, ?)",
+                            ((l, cid) for cid, key in self._pending.values() for l in key))
+        self.db.commit()
+        self._pending.clear()
+        self._pending_bytes = 0
+
+    def remove(self, ids):
+        """Deletes the clauses with the given IDs."""
+        self.flush()
+        rows = [(cid,) for cid in ids]
+        self.db.executemany("DELETE FROM clauses WHERE id = ?", rows)
+        self.db.executemany("DELETE FROM occurrences WHERE id = ?", rows)
+        self.db.commit()
+        self._count -= len(rows)
+
+    def iter_clauses(self, max_id=None):
+        """Streams the stored clauses (with ID <= max_id) as sorted tuples."""
+        self.flush()
+        max_id = self.last_id if max_id is None else max_id
+        cursor = self.db.execute("SELECT lits FROM clauses WHERE id <= ? ORDER BY id", (max_id,))
+        for (blob,) in cursor:
+            yield _decode(blob)
+
+    def variables(self):
+        """Returns the sorted list of variables that occur in some stored clause."""
+        self.flush()
+        return sorted({abs(l) for (l,) in self.db.execute("SELECT DISTINCT lit FROM occurrences")})
+
+    def partition(self, literal: int, max_id=None):
+        """
+        Streams the partition of `literal` (the clauses containing it, with
+        ID <= max_id) in chunks whose estimated size stays within a quarter
+        of the memory limit.
+        """
+        self.flush()
+        max_id = self.last_id if max_id is None else max_id
+        cursor = self.db.execute(
+            "SELECT c.id, c.lits FROM occurrences o JOIN clauses c ON c.id = o.id "
+            "WHERE o.lit = ? AND o.id <= ? ORDER BY o.id", (literal, max_id))
+        chunk, size = [], 0
+        for cid, blob in cursor:
+            clause = _decode(blob)
+            chunk.append((cid, clause))
+            size += 100 + 8 * len(clause)
+            if size > self.memory_limit // 4:
+                yield chunk
+                chunk, size = [], 0
+        if chunk:
+            yield chunk
+
+    def subsumed_ids(self, deadline=None):
+        """
+        Returns the IDs of the clauses that have a proper subset in the store.
+
+        A stored clause d is a subset of c when every literal of d occurs in c,
+        i.e. d appears in the partitions of c's literals exactly len(d) times.
+        Once `deadline` (a CancellationToken) is cancelled the scan stops and
+        only the subsumed clauses found so far are returned.
+        """
+        self.flush()
+        has_empty = self.db.execute("SELECT 1 FROM clauses WHERE size = 0").fetchone() is not None
+        subsumed = []
+        for cid, blob in self.db.execute("SELECT id, lits FROM clauses ORDER BY id"):
+            if deadline is not None and deadline.cancelled:
+                break
+            clause = _decode(blob)
+            if not clause:
+                continue
+            if has_empty:
+                subsumed.append(cid)
+                continue
+            placeholders = ",".join("?" * len(clause))
+            row = self.db.execute(
+                f"SELECT 1 FROM occurrences o JOIN clauses c ON c.id = o.id "
+                f"WHERE o.lit IN ({placeholders}) AND c.size < ? "
+                f"GROUP BY o.id HAVING COUNT(*) = MAX(c.size) LIMIT 1",
+                (*clause, len(clause))).fetchone()
+            if row is not None:
+                subsumed.append(cid)
+        return subsumed
@@ -0,0 +1,60 @@
+import random
+
+
+def random_ksat(num_vars: int, ratio: float, k=3, seed=0):
+    """
+    Uniform random k-SAT, as in the uf* benchmarks: round(ratio * num_vars)
+    clauses, each over k distinct variables with random signs.
+
+    Returns:
+        num_vars (int): number of atoms.
+        clauses (list of frozenset): the generated clauses.
+    """
+    rng = random.Random(seed)
+    clauses = []
+    for _ in range(round(ratio * num_vars)):
+        variables = rng.sample(range(1, num_vars + 1), k)
+        clauses.append(frozenset(v if rng.random() < 0.5 else -v for v in variables))
+    return num_vars, clauses
+
+
+def pigeonhole(holes: int):
+    """
+    PHP(n): n + 1 pigeons in n holes, no two pigeons sharing a hole
+    (unsatisfiable). Variable p * n + h + 1 means pigeon p sits in hole h.
+    """
+    pigeons = holes + 1
+    var = lambda p, h: p * holes + h + 1
+    clauses = [frozenset(var(p, h) for h in range(holes)) for p in range(pigeons)]
+    for h in range(holes):
+        for p in range(pigeons):
+            for q in range(p + 1, pigeons):
+                clauses.append(frozenset({-var(p, h), -var(q, h)}))
+    return pigeons * holes, clauses
+
+
+def aim_like(num_vars: int, ratio=1.6, satisfiable=True, seed=0):
+    """
+    AIM-style 3-SAT at the low AIM clause/variable ratios (1.6, 2.0, 3.4, 6.0).
+
+    Satisfiable instances keep only clauses that agree with a hidden planted
+    assignment. Unsatisfiable ones replace the last eight clauses by all sign
+    patterns over three variables, a small unsatisfiable core hidden among
+    otherwise satisfiable clauses. This imitates the structure of the AIM
+    files, not their exact generator.
+    """
+    rng = random.Random(seed)
+    planted = {v: rng.random() < 0.5 for v in range(1, num_vars + 1)}
+    num_clauses = round(ratio * num_vars)
+    if not satisfiable:
+        num_clauses = max(num_clauses - 8, 0)
+    clauses = []
+    while len(clauses) < num_clauses:
+        variables = rng.sample(range(1, num_vars + 1), 3)
+        clause = frozenset(v if rng.random() < 0.5 else -v for v in variables)
+        if any((l > 0) == planted[abs(l)] for l in clause):
+            clauses.append(clause)
+    if not satisfiable:
+        a, b, c = rng.sample(range(1, num_vars + 1), 3)
+        clauses += [frozenset({a * sa, b * sb, c * sc}) for sa in (1, -1) for sb in (1, -1) for sc in (1, -1)]
+    return num_vars, clauses
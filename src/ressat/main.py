@@ -0,0 +1,170 @@
+import argparse
+from .cnf_parser import parse_cnf
+from .resolvent_generator import generate_resolvents_minimal, generate_resolvents
+from .res_sat import res_sat, res_sat_lazy
+from .validator import validate_interpretation
+from .blocked_clause import eliminate_blocked_clauses, reconstruct_interpretation
+from .decomposition import solve_decomposed
+from .symmetry import break_symmetries
+from .cdcl import cdcl_sat
+from .profiling import PhaseProfiler
+from .checkpoint import Checkpoint
+from .cancellation import CancellationToken
+from .proof_log import ProofLog
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run RES-SAT on a single CNF file")
+    parser.add_argument("cnf_file", help="Path to the CNF file (DIMACS format)")
+    parser.add_argument("--symmetry", action="store_true",
+                        help="Add lex-leader symmetry-breaking clauses before resolution")
+    parser.add_argument("--bce", action="store_true",
+                        help="Remove blocked clauses before generating the resolution closure")
+    parser.add_argument("--decompose", action="store_true",
+                        help="Solve variable-disjoint components of the formula independently")
+    parser.add_argument("--lazy", action="store_true",
+                        help="Generate resolvents on demand while RES-SAT decides each variable")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="Number of worker processes used with --decompose")
+    parser.add_argument("--engine", choices=["auto", "res-sat", "cdcl"], default="auto",
+                        help="Solving engine; 'auto' runs RES-SAT and switches to CDCL "
+                             "when the closure is incomplete and the RES-SAT model fails")
+    parser.add_argument("--profile", nargs="?", const="profiles", metavar="DIR",
+                        help="Profile each phase and write .pstats and collapsed stacks to DIR "
+                             "(default: profiles)")
+    parser.add_argument("--max-iterations", type=int, default=2,
+                        help="Number of saturation iterations of the resolution closure (default: 2)")
+    parser.add_argument("--checkpoint", metavar="PATH",
+                        help="Save the saturation state to PATH after every iteration")
+    parser.add_argument("--checkpoint-interval", type=float, metavar="SECONDS",
+                        help="With --checkpoint, save every SECONDS instead (also inside long iterations)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue saturation from the --checkpoint file if it exists")
+    parser.add_argument("--time-budget", type=float, metavar="SECONDS",
+                        help="Stop resolution, RES-SAT, CDCL and validation after SECONDS and report "
+                             "the best partial result")
+    parser.add_argument("--ordered", action="store_true",
+                        help="Ordered resolution: resolve clauses only upon their maximal literal")
+    parser.add_argument("--selection", choices=["negative"],
+                        help="With --ordered, resolve clauses with a negative literal upon their maximal "
+                             "negative literal (refutation complete, but RES-SAT may not find a model)")
+    parser.add_argument("--proof", metavar="PATH",
+                        help="Log how every clause of the resolution closure was derived to PATH "
+                             "(check it with proof_log.py)")
+    args = parser.parse_args()
+    if args.resume and not args.checkpoint:
+        parser.error("--resume requires --checkpoint")
+    if args.proof and (args.checkpoint or args.decompose or args.lazy):
+        parser.error("--proof cannot be combined with --checkpoint, --decompose or --lazy")
+    if args.selection and not args.ordered:
+        parser.error("--selection requires --ordered")
+    if args.ordered and (args.decompose or args.lazy):
+        parser.error("--ordered cannot be combined with --decompose or --lazy")
+    if args.time_budget is not None and (args.decompose or args.lazy):
+        parser.error("--time-budget cannot be combined with --decompose or --lazy")
+    if args.checkpoint and (args.engine == "cdcl" or args.decompose or args.lazy):
+        parser.error("--checkpoint and --resume save the resolution closure and cannot be combined with "
+                     "--engine cdcl, --decompose or --lazy")
+    if args.engine == "cdcl" and (args.proof or args.ordered):
+        parser.error("--proof and --ordered apply to resolution and cannot be used with --engine cdcl")
+    profiler = PhaseProfiler(args.profile, enabled=args.profile is not None)
+    checkpoint = None
+    if args.checkpoint:
+        checkpoint = Checkpoint(args.checkpoint, interval=args.checkpoint_interval, resume=args.resume)
+
+    # the budget covers the whole run, parsing included
+    deadline = CancellationToken(time_budget=args.time_budget) if args.time_budget is not None else None
+
+    cnf_file = args.cnf_file
+    print(f"Reading CNF file: {cnf_file}")
+    num_vars, clauses,_ = profiler.call("parse", parse_cnf, cnf_file)
+    print(f"Number of variables: {num_vars}")
+    print(f"Number of clauses: {len(clauses)}")
+
+    working_clauses = clauses
+    working_vars = num_vars
+    if args.symmetry:
+        working_clauses, working_vars, num_symmetries = profiler.call("symmetry", break_symmetries, clauses, num_vars)
+        print(f"Found {num_symmetries} symmetries; added {len(working_clauses) - len(clauses)} symmetry-breaking clauses.")
+
+    stack = []
+    if args.bce:
+        working_clauses, stack = profiler.call("bce", eliminate_blocked_clauses, working_clauses)
+        print(f"Blocked clause elimination removed {len(stack)} clauses; {len(working_clauses)} remain.")
+
+    stats = {"complete": False}
+    if args.engine != "cdcl":
+        if args.decompose:
+            print("Generating resolution closure and running RES-SAT per component...")
+            R, interpretation, num_components = profiler.call("decompose", solve_decomposed, working_clauses,
+                                                              working_vars, max_iterations=args.max_iterations,
+                                                              minimal=False,
+                                                              processes=args.jobs, stats=stats)
+            print(f"Solved {num_components} independent components; closure has {len(R)} clauses.")
+        elif args.lazy:
+            print("Running RES-SAT with on-demand resolvent generation...")
+            interpretation, R = profiler.call("res_sat_lazy", res_sat_lazy, working_clauses, working_vars,
+                                              stats=stats)
+            print(f"Generated {len(R) - len(set(working_clauses))} resolvents on demand.")
+        else:
+            print("Generating resolution closure (this may take some time for large inputs)...")
+            proof = ProofLog(args.proof) if args.proof else None
+            try:
+                R = profiler.call("resolve", generate_resolvents, working_clauses,
+                                  max_iterations=args.max_iterations, stats=stats, checkpoint=checkpoint,
+                                  deadline=deadline, proof=proof, ordered=args.ordered,
+                                  selection=args.selection)
+            finally:
+                if proof is not None:
+                    proof.close()
+            print(f"Resolution closure generated with {len(R)} clauses.")
+            if proof is not None:
+                print(f"Resolution proof written to {args.proof}.")
+
+            print("Running RES-SAT procedure...")
+            interpretation = profiler.call("res_sat", res_sat, R, working_vars, deadline=deadline)
+            if deadline is not None and deadline.cancelled:
+                print("Time budget exhausted: the closure is partial and undecided variables were set to true.")
+
+    fallback = args.engine == "cdcl"
+    if args.engine == "auto" and not stats["complete"] and not (deadline is not None and deadline.cancelled):
+        # an incomplete closure may still give a model: keep it if it checks out
+        if profiler.call("check", validate_interpretation, working_clauses, interpretation, deadline=deadline):
+            print("Resolution closure is incomplete, but the RES-SAT interpretation satisfies the formula.")
+        else:
+            print("Resolution closure is incomplete; switching to the CDCL engine.")
+            fallback = True
+    if deadline is not None and deadline.cancelled and args.engine == "auto":
+        print("Time budget exhausted; not switching to the CDCL engine.")
+    elif fallback:
+        print("Running CDCL solver...")
+        interpretation = profiler.call("cdcl", cdcl_sat, working_clauses, working_vars, deadline=deadline)
+        if interpretation is None and deadline is not None and deadline.cancelled:
+            print("Time budget exhausted before the CDCL solver reached an answer.")
+            profiler.write()
+            return
+        if interpretation is None:
+            print("The formula is unsatisfiable.")
+            profiler.write()
+            return
+
+    if stack:
+        interpretation = reconstruct_interpretation(interpretation, stack)
+    # Drop auxiliary variables introduced by symmetry breaking
+    interpretation = {l for l in interpretation if abs(l) <= num_vars}
+    print("Satisfying interpretation (as a set of literals):")
+    print(interpretation)
+
+    # Validate the interpretation against the original CNF clauses
+    valid = profiler.call("validate", validate_interpretation, clauses, interpretation, deadline=deadline)
+    if valid is None:
+        print("Validation skipped: the time budget ran out before every clause was checked.")
+    elif valid:
+        print(validate_interpretation(clauses, interpretation) == _)
+        print("Validation passed: the interpretation satisfies the CNF formula.")
+    else:
+        print("Validation failed: the interpretation does NOT satisfy the CNF formula.")
+    profiler.write()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+# microbench.py
+import argparse
+import json
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from .generators import random_ksat
+from .prop_to_cnf import write_dimacs
+from .cnf_parser import parse_cnf
+from .resolvent_generator import filter_minimal, generate_resolvents_minimal, generate_resolvents
+from .res_sat import res_sat
+from .validator import validate_interpretation
+from .benchmark_suite import mann_whitney_u, save_results
+
+
+def _random_clauses(num_vars, num_clauses, min_len, max_len, rng):
+    clauses = set()
+    while len(clauses) < num_clauses:
+        variables = rng.sample(range(1, num_vars + 1), rng.randint(min_len, max_len))
+        clauses.add(frozenset(v if rng.random() < 0.5 else -v for v in variables))
+    return clauses
+
+
+def _parse_cnf_case(size, rng):
+    num_vars, clauses = random_ksat(size, 4.26, seed=rng.randrange(2 ** 32))
+    fd, path = tempfile.mkstemp(suffix=".cnf", prefix="microbench_")
+    os.close(fd)
+    write_dimacs([sorted(c) for c in clauses], num_vars, path)
+    return parse_cnf, (path,), {}, lambda: os.remove(path)
+
+
+def _filter_minimal_case(size, rng):
+    # A closure-like mix of short and long clauses, some subsuming others.
+    return filter_minimal, (_random_clauses(max(size // 8, 5), size, 1, 5, rng),), {}, None
+
+
+def _resolve_pass_case(generate):
+    def make(size, rng):
+        _, clauses = random_ksat(size, 4.26, seed=rng.randrange(2 ** 32))
+        return generate, (clauses,), {"max_iterations": 1, "verbose": False}, None
+    return make
+
+
+def _res_sat_case(size, rng):
+    closure = _random_clauses(size, 40 * size, 2, 4, rng)
+    return res_sat, (closure, size), {}, None
+
+
+def _validate_case(size, rng):
+    num_vars, clauses = random_ksat(size, 4.26, seed=rng.randrange(2 ** 32))
+    interpretation = {v if rng.random() < 0.5 else -v for v in range(1, num_vars + 1)}
+    # Keep only satisfied clauses so the whole formula is scanned on every call.
+    clauses = [c for c in clauses if not c.isdisjoint(interpretation)]
+    return validate_interpretation, (clauses, interpretation), {}, None
+
+
+# name -> (default size, make(size, rng) -> (function, args, kwargs, cleanup))
+BENCHMARKS = {
+    "parse_cnf": (2000, _parse_cnf_case),
+    "filter_minimal": (400, _filter_minimal_case),
+    # One pass of the pairwise clash / tautology loop (max_iterations=1).
+    "resolve_pass_minimal": (30, _resolve_pass_case(generate_resolvents_minimal)),
+    "resolve_pass_standard": (30, _resolve_pass_case(generate_resolvents)),
+    "res_sat": (50, _res_sat_case),
+    "validate_interpretation": (5000, _validate_case),
+}
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def bench(function, args=(), kwargs=None, warmup=3, repeat=30):
+    """
+    Times repeated calls of function(*args, **kwargs) on the same input.
+
+    After `warmup` untimed calls, each of `repeat` calls is timed with
+    perf_counter. Memory is measured on one extra call under tracemalloc:
+    the peak of newly traced memory during the call, which includes
+    transient allocations, and the number of blocks allocated during the
+    call that survive it (mostly the returned value). tracemalloc cannot
+    count the blocks that were allocated and freed again.
+
+    Returns:
+        dict: "times" (seconds per call), "min", "median", "p95", "mean",
+        "alloc_peak_bytes" and "surviving_blocks".
+    """
+    kwargs = kwargs or {}
+    for _ in range(warmup):
+        function(*args, **kwargs)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args, **kwargs)
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    baseline, _ = tracemalloc.get_traced_memory()
+    tracemalloc.reset_peak()
+    result = function(*args, **kwargs)
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    del result
+
+    return {"times": times, "min": min(times), "median": statistics.median(times),
+            "p95": _percentile(times, 0.95), "mean": statistics.fmean(times),
+            "alloc_peak_bytes": peak - baseline, "surviving_blocks": blocks}
+
+
+def run_microbenchmarks(names=None, sizes=None, warmup=3, repeat=30, seed=0, verbose=True):
+    """
+    Runs the selected microbenchmarks on fixed synthetic inputs.
+
+    Args:
+        names: names from BENCHMARKS (default: all).
+        sizes: optional dict name -> input size overriding the default.
+
+    Returns:
+        list of dict: one record per benchmark.
+    """
+    results = []
+    for name in names or BENCHMARKS:
+        default_size, make = BENCHMARKS[name]
+        size = (sizes or {}).get(name, default_size)
+        function, args, kwargs, cleanup = make(size, random.Random(seed))
+        try:
+            record = {"name": name, "size": size, **bench(function, args, kwargs, warmup, repeat)}
+        finally:
+            if cleanup:
+                cleanup()
+        results.append(record)
+        if verbose:
+            print(f"{name:24} size={size:<6} min={record['min'] * 1e3:9.3f}ms "
+                  f"median={record['median'] * 1e3:9.3f}ms p95={record['p95'] * 1e3:9.3f}ms "
+                  f"peak={record['alloc_peak_bytes'] / 1024:9.1f}KB surviving blocks={record['surviving_blocks']}")
+    return results
+
+
+def compare_results(results, other, alpha=0.05):
+    """
+    Compares two microbenchmark runs (e.g. two branches) benchmark by benchmark.
+
+    Returns:
+        list of dict: median ratio (new / old) and Mann-Whitney p-value for
+        every benchmark present in both runs with the same input size.
+    """
+    old = {(r["name"], r["size"]): r for r in other}
+    rows = []
+    for record in results:
+        before = old.get((record["name"], record["size"]))
+        if before is None:
+            continue
+        _, p = mann_whitney_u(before["times"], record["times"])
+        rows.append({"name": record["name"], "size": record["size"],
+                     "ratio": record["median"] / before["median"] if before["median"] else float("inf"),
+                     "p": p, "significant": p < alpha})
+    return rows
+
+
+def _parse_sizes(specs):
+    sizes = {}
+    for spec in specs or []:
+        name, _, value = spec.partition("=")
+        if name not in BENCHMARKS or not value:
+            raise argparse.ArgumentTypeError(f"invalid --size entry {spec!r}")
+        sizes[name] = int(value)
+    return sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Microbenchmarks of the RES-SAT hot functions")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Benchmarks to run (default: all)")
+    parser.add_argument("--size", nargs="+", metavar="NAME=N", help="Override the input size of a benchmark")
+    parser.add_argument("--warmup", type=int, default=3, help="Untimed calls before measuring")
+    parser.add_argument("--repeat", type=int, default=30, help="Timed calls per benchmark")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic inputs")
+    parser.add_argument("--output", default="microbench_results.json", help="Where to write the results")
+    parser.add_argument("--compare", help="Earlier results file (e.g. from another branch) to compare with")
+    args = parser.parse_args()
+
+    results = run_microbenchmarks(args.only, _parse_sizes(args.size), args.warmup, args.repeat, args.seed)
+    save_results(results, args.output)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            other = json.load(f)
+        print(f"\nCompared with {args.compare} (commit {other['meta'].get('commit')}), median new/old:")
+        for row in compare_results(results, other["results"]):
+            mark = "*" if row["significant"] else " "
+            print(f"  {row['name']:24} size={row['size']:<6} x{row['ratio']:.3f} p={row['p']:.3f}{mark}")
+
+
+if __name__ == "__main__":
+    main()
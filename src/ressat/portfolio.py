@@ -0,0 +1,197 @@
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import re
+import time
+from collections import Counter
+from .cnf_parser import parse_cnf
+from .resolvent_generator import generate_resolvents_minimal, generate_resolvents
+from .res_sat import res_sat
+from .validator import validate_interpretation
+
+# Resolution configurations raced by default; none of them is best on every
+# family (see `portfolio.py --summary` on recorded races).
+CONFIGURATIONS = [
+    {"name": "minimal-i2", "minimal": True, "max_iterations": 2, "max_resolvents": 10000},
+    {"name": "standard-i2", "minimal": False, "max_iterations": 2, "max_resolvents": 10000},
+    {"name": "minimal-i1", "minimal": True, "max_iterations": 1, "max_resolvents": 10000},
+    {"name": "minimal-i3", "minimal": True, "max_iterations": 3, "max_resolvents": 30000},
+]
+
+
+def _run_configuration(config, clauses, num_vars, results):
+    """
+    Worker: resolve -> RES-SAT with one configuration, then report
+    (name, interpretation, closure size, seconds, error) on `results`.
+    """
+    start = time.perf_counter()
+    try:
+        generate = generate_resolvents_minimal if config["minimal"] else generate_resolvents
+        R = generate(clauses, max_iterations=config["max_iterations"],
+                     max_resolvents=config["max_resolvents"], verbose=False)
+        T = res_sat(R, num_vars)
+        results.put((config["name"], sorted(T), len(R), time.perf_counter() - start, None))
+    except Exception as e:
+        results.put((config["name"], None, None, time.perf_counter() - start, repr(e)))
+
+
+def race(clauses, num_vars: int, configurations=None, jobs=None, timeout=None):
+    """
+    Races several pipeline configurations on one formula.
+
+    Every configuration runs in its own process (at most `jobs` at a time).
+    The first interpretation that validate_interpretation confirms wins and
+    the processes still running are terminated.
+
+    Args:
+        configurations: list of dicts with "name", "minimal", "max_iterations"
+                        and "max_resolvents" (default: CONFIGURATIONS).
+        jobs: number of concurrent processes (default: one per configuration).
+        timeout: seconds after which the race is abandoned.
+
+    Returns:
+        dict: "winner" (configuration name, or None if no configuration
+        produced a model in time), "interpretation" (set of literals or
+        None), "time" (seconds until the winner was confirmed) and
+        "configurations", mapping each name to its "status" ("won",
+        "invalid", "error", "cancelled" or "not started") and, when it
+        finished, "time" and "closure_size".
+    """
+    configurations = list(configurations or CONFIGURATIONS)
+    jobs = max(1, jobs or len(configurations))
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    pending = list(configurations)
+    running = {}
+    report = {config["name"]: {"status": "not started"} for config in configurations}
+    outcome = {"winner": None, "interpretation": None, "time": None, "configurations": report}
+    start = time.perf_counter()
+
+    def launch():
+        config = pending.pop(0)
+        process = context.Process(target=_run_configuration, args=(config, clauses, num_vars, results),
+                                  daemon=True)
+        process.start()
+        running[config["name"]] = process
+
+    while pending and len(running) < jobs:
+        launch()
+    try:
+        while running:
+            remaining = None if timeout is None else timeout - (time.perf_counter() - start)
+            if remaining is not None and remaining <= 0:
+                break
+            try:
+                name, interpretation, closure_size, elapsed, error = results.get(
+                    timeout=0.1 if remaining is None else min(remaining, 0.1))
+            except queue.Empty:
+                # a worker that dies without reporting (e.g. killed for memory)
+                for name, process in list(running.items()):
+                    if process.exitcode not in (None, 0):
+                        running.pop(name)
+                        report[name] = {"status": "error", "error": f"exit code {process.exitcode}"}
+                        if pending:
+                            launch()
+                continue
+
+            running.pop(name).join()
+            report[name] = {"time": elapsed, "closure_size": closure_size}
+            if error is not None:
+                report[name].update({"status": "error", "error": error})
+            elif validate_interpretation(clauses, set(interpretation)):
+                report[name]["status"] = "won"
+                outcome.update({"winner": name, "interpretation": set(interpretation),
+                                "time": time.perf_counter() - start})
+                break
+            else:
+                report[name]["status"] = "invalid"
+            if pending:
+                launch()
+    finally:
+        for name, process in running.items():
+            process.terminate()
+            process.join()
+            report[name] = {"status": "cancelled"}
+    return outcome
+
+
+def family_of(path):
+    """Instance family from the file name: 'aim', 'hole', 'uf', ..."""
+    match = re.match(r"[A-Za-z]+", os.path.basename(path))
+    return match.group(0).lower() if match else "other"
+
+
+def record_result(stats_file, cnf_file, num_vars, num_clauses, outcome):
+    """Appends one JSON line describing a race to `stats_file`."""
+    record = {
+        "file": os.path.basename(cnf_file),
+        "family": family_of(cnf_file),
+        "num_vars": num_vars,
+        "num_clauses": num_clauses,
+        "winner": outcome["winner"],
+        "time": outcome["time"],
+        "statuses": {name: r["status"] for name, r in outcome["configurations"].items()},
+    }
+    with open(stats_file, "a") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+def win_table(stats_file):
+    """
+    Reads the records written by record_result.
+
+    Returns:
+        dict: family -> Counter of winning configuration names (None counts
+        races nobody won).
+    """
+    table = {}
+    with open(stats_file) as f:
+        for line in f:
+            record = json.loads(line)
+            table.setdefault(record["family"], Counter())[record["winner"]] += 1
+    return table
+
+
+def best_configuration(table, family):
+    """The configuration that won most often for `family`, or None."""
+    wins = Counter({name: n for name, n in table.get(family, {}).items() if name is not None})
+    return wins.most_common(1)[0][0] if wins else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Race several RES-SAT configurations on each CNF file")
+    parser.add_argument("cnf_files", nargs="*", help="CNF files (DIMACS format)")
+    parser.add_argument("--jobs", type=int, help="Concurrent configurations (default: all)")
+    parser.add_argument("--timeout", type=float, help="Seconds per file before the race is abandoned")
+    parser.add_argument("--stats", metavar="FILE", help="Append one JSON line per race to FILE")
+    parser.add_argument("--summary", metavar="FILE",
+                        help="Print the wins per family recorded in FILE and exit")
+    args = parser.parse_args()
+
+    if args.summary:
+        table = win_table(args.summary)
+        for family, wins in sorted(table.items()):
+            counts = ", ".join(f"{name}={n}" for name, n in wins.most_common())
+            print(f"{family}: {counts} (default: {best_configuration(table, family)})")
+        return
+    if not args.cnf_files:
+        parser.error("no CNF files given")
+
+    for cnf_file in args.cnf_files:
+        num_vars, clauses, _ = parse_cnf(cnf_file)
+        outcome = race(clauses, num_vars, jobs=args.jobs, timeout=args.timeout)
+        if outcome["winner"] is None:
+            print(f"{cnf_file}: no configuration found a model")
+        else:
+            print(f"{cnf_file}: {outcome['winner']} won in {outcome['time']:.3f}s")
+        for name, result in outcome["configurations"].items():
+            details = f" ({result['time']:.3f}s, {result['closure_size']} clauses)" if "time" in result else ""
+            print(f"  {name}: {result['status']}{details}")
+        if args.stats:
+            record_result(args.stats, cnf_file, num_vars, len(clauses), outcome)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,164 @@
+import io
+import os
+import signal
+import threading
+
+
+class _StackSampler:
+    """
+    Samples the Python stack of the main thread on every SIGPROF tick
+    (process CPU time), counting identical stacks.
+
+    The handler runs under cProfile, so it only collects code objects (no
+    Python-level calls); they are formatted, without this module's frames,
+    by `collapsed`.
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.counts = {}  # tuple of code objects, innermost first -> samples
+        self._previous = None
+
+    @staticmethod
+    def available():
+        return hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread()
+
+    def _sample(self, signum, frame):
+        stack = []
+        while frame is not None:
+            stack.append(frame.f_code)
+            frame = frame.f_back
+        key = tuple(stack)
+        self.counts[key] = self.counts.get(key, 0) + 1
+
+    def collapsed(self):
+        """Returns {"outer;...;inner": samples}, leaving out the profiler's own frames."""
+        lines = {}
+        for stack, count in self.counts.items():
+            names = [f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+                     for code in reversed(stack) if code.co_filename != __file__]
+            if names:
+                line = ";".join(names)
+                lines[line] = lines.get(line, 0) + count
+        return lines
+
+    def start(self):
+        self._previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous)
+
+
+def _without_profiler(profile):
+    """
+    pstats.Stats of `profile` without the profiler's own work: the functions
+    of this module (the SIGPROF handler, `call`) and whatever only they
+    called are removed, and their calls are subtracted from the counts and
+    times of the functions they share with the profiled code.
+    """
+    import pstats
+    stats = pstats.Stats(profile)
+    table = stats.stats
+    removed = {func for func in table if func[0] == __file__}
+    while removed:
+        for func in removed:
+            table.pop(func, None)
+        orphans = set()
+        for func, (cc, nc, tt, ct, callers) in table.items():
+            shared = [caller for caller in callers if caller in removed]
+            if not shared:
+                continue
+            for caller in shared:
+                c_cc, c_nc, c_tt, c_ct = callers.pop(caller)
+                cc, nc, tt, ct = cc - c_cc, nc - c_nc, tt - c_tt, ct - c_ct
+            table[func] = (cc, nc, max(tt, 0.0), max(ct, 0.0), callers)
+            if nc <= 0:
+                orphans.add(func)
+        removed = orphans
+    stats.total_calls = stats.prim_calls = 0
+    stats.total_tt = 0
+    stats.top_level = set()
+    stats.get_top_level_stats()
+    return stats
+
+
+class PhaseProfiler:
+    """
+    Profiles each pipeline phase (parse, resolve, res_sat, ...) separately.
+
+    Wrap the calls of a phase with `call`; calls sharing a phase name are
+    accumulated, so one profiler can cover a whole directory of files. For
+    every phase, `write` produces in `output_dir`:
+
+      - <phase>.pstats: cProfile data (for pstats, snakeviz, gprof2dot);
+      - <phase>.collapsed: sampled stacks in the collapsed format read by
+        flamegraph.pl, inferno and speedscope (Unix main thread only);
+      - summary.txt: the top-N functions of every phase by own time.
+
+    Both profilers run in the same pass, so the profiler's own work (the
+    SIGPROF handler, `call`) is filtered out of both outputs. The sample
+    counts still include cProfile's tracing overhead, which inflates
+    call-heavy functions: read the flamegraph's proportions as approximate.
+
+    A disabled profiler calls the function directly.
+    """
+
+    def __init__(self, output_dir="profiles", top=15, enabled=True, interval=0.001):
+        self.output_dir = output_dir
+        self.top = top
+        self.enabled = enabled
+        self.interval = interval
+        self.profiles = {}
+        self.samplers = {}
+
+    def call(self, phase, function, *args, **kwargs):
+        """Runs function(*args, **kwargs), attributing its cost to `phase`."""
+        if not self.enabled:
+            return function(*args, **kwargs)
+        import cProfile  # only needed when profiling is on
+        profile = self.profiles.setdefault(phase, cProfile.Profile())
+        sampler = None
+        if _StackSampler.available():
+            sampler = self.samplers.setdefault(phase, _StackSampler(self.interval))
+            sampler.start()
+        profile.enable()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            profile.disable()
+            if sampler is not None:
+                sampler.stop()
+
+    def report(self) -> str:
+        """Returns the top-N hot-function table of every phase."""
+        out = io.StringIO()
+        for phase, profile in self.profiles.items():
+            out.write(f"=== Phase: {phase} ===\n")
+            stats = _without_profiler(profile)
+            stats.stream = out
+            stats.sort_stats("tottime").print_stats(self.top)
+        return out.getvalue()
+
+    def write(self, verbose=True) -> str:
+        """
+        Writes the .pstats, .collapsed and summary files and returns the summary.
+        """
+        if not self.profiles:
+            return ""
+        os.makedirs(self.output_dir, exist_ok=True)
+        for phase, profile in self.profiles.items():
+            _without_profiler(profile).dump_stats(os.path.join(self.output_dir, f"{phase}.pstats"))
+            sampler = self.samplers.get(phase)
+            if sampler is not None:
+                with open(os.path.join(self.output_dir, f"{phase}.collapsed"), "w") as f:
+                    for stack, count in sorted(sampler.collapsed().items()):
+                        f.write(f"{stack} {count}\n")
+        summary = self.report()
+        with open(os.path.join(self.output_dir, "summary.txt"), "w") as f:
+            f.write(summary)
+        if verbose:
+            print(summary)
+            print(f"Profiles written to {self.output_dir}")
+        return summary
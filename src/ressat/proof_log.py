@@ -0,0 +1,246 @@
+import argparse
+import sys
+from array import array
+
+MAGIC = b"RESPRF1\n"
+
+# Records are runs of little-endian int32 words:
+#   input clause: id, 0, n, lit_1 .. lit_n
+#   resolvent:    id, parent1, parent2, pivot
+#   deletion:     -id
+# A resolvent's literals are not stored: the clause is
+# (parent1 - {pivot}) | (parent2 - {-pivot}), which keeps logging cheap.
+
+
+class ProofLog:
+    """
+    Binary resolution proof written by generate_resolvents*.
+
+    Every input clause, every resolvent added to the closure (as its two
+    parent IDs and the pivot literal) and every clause dropped by
+    filter_minimal is appended to an in-memory int32 buffer that is written
+    out in large blocks, so logging costs one dict update and four words per
+    added clause. check_proof verifies the file in one streaming pass and
+    export_tracecheck converts it to the TraceCheck text format.
+    """
+
+    def __init__(self, path, buffer_words=1 << 20):
+        self.path = path
+        self.buffer_words = buffer_words
+        self.ids = {}  # live clause (frozenset) -> ID
+        self.next_id = 1
+        self._buffer = array("i")
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _write(self, words):
+        self._buffer.fromlist(words)
+        if len(self._buffer) >= self.buffer_words:
+            self.flush()
+
+    def _new_id(self, clause):
+        cid = self.next_id
+        self.next_id += 1
+        self.ids[clause] = cid
+        return cid
+
+    def add_inputs(self, clauses):
+        """Logs the input clauses not seen yet, in the given order."""
+        for clause in clauses:
+            clause = frozenset(clause)
+            if clause not in self.ids:
+                self._write([self._new_id(clause), 0, len(clause), *sorted(clause)])
+
+    def add_resolvents(self, parents, keep=None):
+        """
+        Logs the resolvents of `parents`, a dict mapping each resolvent to
+        (parent1, parent2, pivot) with pivot in parent1 and -pivot in
+        parent2, both already logged. With `keep`, only the resolvents in
+        keep are logged.
+        """
+        ids, words, limit = self.ids, [], self.buffer_words
+        extend = words.extend
+        cid = self.next_id
+        for resolvent, (parent1, parent2, pivot) in parents.items():
+            if keep is not None and resolvent not in keep:
+                continue
+            ids[resolvent] = cid
+            extend((cid, ids[parent1], ids[parent2], pivot))
+            cid += 1
+            if len(words) >= limit:
+                self._write(words)
+                words = []
+                extend = words.extend
+        self.next_id = cid
+        self._write(words)
+
+    def delete(self, clauses):
+        """Logs that `clauses` left the closure."""
+        ids = self.ids
+        self._write([-ids.pop(clause) for clause in clauses])
+
+    def flush(self):
+        if sys.byteorder == "big":
+            self._buffer.byteswap()
+        self._buffer.tofile(self._file)
+        del self._buffer[:]
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+
+def _words(path, block_words=1 << 16):
+    """Streams the int32 words of a proof file."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a resolution proof")
+        while True:
+            block = array("i")
+            data = f.read(4 * block_words)
+            if len(data) % 4:
+                raise ValueError(f"{path}: truncated record")
+            block.frombytes(data)
+            if sys.byteorder == "big":
+                block.byteswap()
+            if not block:
+                return
+            yield from block
+
+
+def read_proof(path):
+    """
+    Iterates over the records of a proof file, as stored: ("input", id,
+    clause), ("resolvent", id, parent1, parent2, pivot) or ("delete", id).
+    """
+    words = _words(path)
+    for cid in words:
+        if cid < 0:
+            yield ("delete", -cid)
+            continue
+        try:
+            parent1 = next(words)
+            if parent1 == 0:
+                n = next(words)
+                yield ("input", cid, frozenset(next(words) for _ in range(n)))
+            else:
+                yield ("resolvent", cid, parent1, next(words), next(words))
+        except StopIteration:
+            raise ValueError(f"{path}: truncated record for clause {cid}") from None
+
+
+def check_proof(path, clauses=None, closure=None):
+    """
+    Verifies a proof in a single streaming pass, keeping only live clauses
+    in memory.
+
+    Every resolvent is rebuilt from its two live parents, which must clash
+    on its pivot, and must not be a tautology. If `clauses` (the original
+    formula) is given, every input clause must belong to it; if `closure` is
+    given, the clauses still live at the end must be exactly those.
+
+    Returns:
+        dict: "valid", "error" (None or the first problem found), the
+        numbers of "inputs", "resolvents" and "deleted" clauses, and
+        "empty_clause" (True if the empty clause was derived, i.e. the proof
+        refutes the formula).
+    """
+    formula = None if clauses is None else set(map(frozenset, clauses))
+    live = {}
+    result = {"valid": True, "error": None, "inputs": 0, "resolvents": 0, "deleted": 0, "empty_clause": False}
+
+    def fail(message):
+        result.update(valid=False, error=message)
+        return result
+
+    try:
+        for record in read_proof(path):
+            kind, cid = record[0], record[1]
+            if kind == "delete":
+                if live.pop(cid, None) is None:
+                    return fail(f"deletion of unknown clause {cid}")
+                result["deleted"] += 1
+                continue
+            if cid in live:
+                return fail(f"clause ID {cid} is used twice")
+            if kind == "input":
+                clause = record[2]
+                if formula is not None and clause not in formula:
+                    return fail(f"input clause {cid} {sorted(clause)} is not in the formula")
+                result["inputs"] += 1
+            else:
+                parent1, parent2, pivot = record[2:]
+                c1, c2 = live.get(parent1), live.get(parent2)
+                if c1 is None or c2 is None:
+                    return fail(f"clause {cid} has a parent that is not live")
+                if pivot not in c1 or -pivot not in c2:
+                    return fail(f"clause {cid}: parents {parent1} and {parent2} do not clash on {pivot}")
+                clause = (c1 - {pivot}) | (c2 - {-pivot})
+                if any(-l in clause for l in clause):
+                    return fail(f"clause {cid} is a tautology")
+                result["resolvents"] += 1
+                result["empty_clause"] |= not clause
+            live[cid] = clause
+    except ValueError as e:
+        return fail(str(e))
+    if closure is not None and set(live.values()) != set(map(frozenset, closure)):
+        return fail("the live clauses differ from the given closure")
+    return result
+
+
+def export_tracecheck(path, output):
+    """
+    Writes the proof in TraceCheck format: one line "id literals 0
+    antecedents 0" per clause, with no antecedents for input clauses.
+    Deletions are dropped (TraceCheck has none); the proof is assumed to
+    pass check_proof.
+    """
+    live = {}
+    with open(output, "w") as out:
+        for record in read_proof(path):
+            if record[0] == "delete":
+                live.pop(record[1], None)
+                continue
+            if record[0] == "input":
+                clause, antecedents = record[2], ""
+            else:
+                parent1, parent2, pivot = record[2:]
+                clause = (live[parent1] - {pivot}) | (live[parent2] - {-pivot})
+                antecedents = f"{parent1} {parent2} "
+            live[record[1]] = clause
+            literals = "".join(f"{l} " for l in sorted(clause, key=abs))
+            out.write(f"{record[1]} {literals}0 {antecedents}0\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check or convert a RES-SAT resolution proof")
+    parser.add_argument("proof", help="Proof file written with --proof")
+    parser.add_argument("--cnf", help="Check the input clauses against this CNF file")
+    parser.add_argument("--tracecheck", metavar="FILE", help="Also write the proof in TraceCheck format to FILE")
+    args = parser.parse_args()
+
+    clauses = None
+    if args.cnf:
+        from .cnf_parser import parse_cnf
+        _, clauses, _ = parse_cnf(args.cnf)
+    result = check_proof(args.proof, clauses)
+    print(f"{result['inputs']} input clauses, {result['resolvents']} resolvents, {result['deleted']} deletions")
+    if result["valid"]:
+        print("Proof verified" + (": the empty clause was derived." if result["empty_clause"] else "."))
+    else:
+        print(f"Proof rejected: {result['error']}")
+    if args.tracecheck:
+        export_tracecheck(args.proof, args.tracecheck)
+    sys.exit(0 if result["valid"] else 1)
+
+
+if __name__ == "__main__":
+    main()
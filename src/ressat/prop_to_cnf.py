@@ -225,17 +225,17 @@ def write_dimacs(clauses, num_vars, filename):
             clause_str = " ".join(map(str, clause)) + " 0\n"
             f.write(clause_str)
 
-# Main Routine
-def main():
-    if len(sys.argv) < 3:
-        print("Usage: python prop_to_cnf.py input_formula.txt output.cnf")
-        sys.exit(1)
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+def formula_to_cnf(text):
+    """
+    Converts a propositional formula to CNF with the Tseitin transformation.
+    Lines starting with '#' are ignored.
 
-    # Read the input formula (ignore comment lines that start with #)
-    with open(input_file, 'r') as f:
-        formula_lines = [line for line in f if not line.strip().startswith('#')]
+    Returns:
+        clauses (list of list of int): the CNF clauses.
+        num_vars (int): number of variables, including Tseitin variables.
+        mapping (dict): maps each variable name of the formula to its number.
+    """
+    formula_lines = [line for line in text.splitlines() if not line.strip().startswith('#')]
     formula_str = " ".join(formula_lines).strip()
 
     tokens = tokenize(formula_str)
@@ -244,6 +244,20 @@ def main():
 
     transformer = TseitinTransformer()
     clauses, num_vars = transformer.tseitin(ast)
+    return clauses, num_vars, transformer.mapping
+
+
+# Main Routine
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: python -m ressat.prop_to_cnf input_formula.txt output.cnf")
+        sys.exit(1)
+    input_file = sys.argv[1]
+    output_file = sys.argv[2]
+
+    # Read the input formula (ignore comment lines that start with #)
+    with open(input_file, 'r') as f:
+        clauses, num_vars, _ = formula_to_cnf(f.read())
 
     write_dimacs(clauses, num_vars, output_file)
     print(f"CNF written to {output_file}")
@@ -0,0 +1,201 @@
+from .utils import complement, complement_clause, is_tautology
+from .clause_arena import ClauseArena
+from .cancellation import as_token
+from .shared_closure import SharedClosure
+
+def res_sat(R, num_vars: int, stats=None, deadline=None, order=None):
+    """
+    Implements the RES-SAT procedure.
+    
+    Input:
+      - R: set of resolvent clauses (each clause is a frozenset of ints), a
+        ClauseArena or a SharedClosure
+      - num_vars: number of atoms (assumed to be numbered 1 to num_vars)
+      - stats: optional dict or SolverStats; receives "clauses_scanned", the
+        number of clauses checked while deciding each variable
+      - deadline: optional time budget in seconds or CancellationToken,
+        checked once per variable; once it is cancelled the remaining
+        variables are set to true and stats["truncated"] is set
+      - order: optional sequence of the variables 1..num_vars in the order
+        they are decided (default: ascending); on the full closure every
+        order yields a model, but not necessarily the same one
+    
+    Returns:
+      - T: a set of literals representing a satisfying interpretation.
+    """
+    deadline = as_token(deadline)
+    variables = range(1, num_vars+1) if order is None else order
+    if stats is not None:
+        return _res_sat_counted(R, num_vars, stats, deadline, variables)
+    if isinstance(R, (ClauseArena, SharedClosure)):
+        return _res_sat_arena(R, num_vars, deadline, variables)
+    T = set()
+    for i in variables:
+        if deadline is not None and deadline.cancelled:
+            return _fill_undecided(T, num_vars)
+        candidate = T | {i}  # Assume variable i is True
+        found_clause = False
+        for clause in R:
+            # ¬clause is the set of complements of the literals in clause.
+            if complement_clause(clause).issubset(candidate):
+                found_clause = True
+                break
+        if found_clause:
+            T.add(-i)
+        else:
+            T.add(i)
+    return T
+
+def _fill_undecided(T, num_vars: int):
+    """Completes T with the positive literals of the variables it does not assign."""
+    T.update(v for v in range(1, num_vars+1) if -v not in T)
+    return T
+
+def _res_sat_counted(R, num_vars: int, stats, deadline=None, variables=None):
+    """
+    res_sat that also records how many clauses were checked for each variable
+    (in decision order).
+    """
+    T = set()
+    scanned = []
+    for i in (range(1, num_vars+1) if variables is None else variables):
+        if deadline is not None and deadline.cancelled:
+            stats["truncated"] = True
+            _fill_undecided(T, num_vars)
+            break
+        candidate = T | {i}  # Assume variable i is True
+        found_clause = False
+        count = 0
+        for clause in R:
+            count += 1
+            if complement_clause(clause).issubset(candidate):
+                found_clause = True
+                break
+        scanned.append(count)
+        if found_clause:
+            T.add(-i)
+        else:
+            T.add(i)
+    stats["clauses_scanned"] = scanned
+    return T
+
+def _res_sat_arena(R, num_vars: int, deadline=None, variables=None):
+    """
+    res_sat for a ClauseArena or SharedClosure: the clauses are scanned as
+    literal tuples instead of being turned into sets.
+    """
+    T = set()
+    for i in (range(1, num_vars+1) if variables is None else variables):
+        if deadline is not None and deadline.cancelled:
+            return _fill_undecided(T, num_vars)
+        candidate = T | {i}  # Assume variable i is True
+        if any(all(-l in candidate for l in clause) for clause in R.iter_clauses()):
+            T.add(-i)
+        else:
+            T.add(i)
+    return T
+
+def res_sat_lazy(clauses, num_vars: int, max_resolvents=10000, stats=None):
+    """
+    RES-SAT with on-demand resolvent generation.
+
+    Instead of computing the whole closure up front, the resolvents needed for
+    variable i are generated while deciding it. A clause of RES(S) is falsified
+    by T ∪ {i} exactly when it is over variables <= i and its complement lies in
+    T ∪ {i}. Such a clause exists iff the clauses that T ∪ {i} does not satisfy
+    are unsatisfiable on the variables > i, which is decided by resolving those
+    clauses on their highest variable only (Davis-Putnam style), stopping at the
+    first clause over variables <= i. Every resolvent is a clause of RES(S) and
+    is cached for the later variables.
+
+    With an unlimited max_resolvents this returns the same interpretation as
+    res_sat on the full resolution closure.
+
+    Input:
+      - clauses: the original clauses (each clause is a frozenset of ints)
+      - num_vars: number of atoms (assumed to be numbered 1 to num_vars)
+      - max_resolvents: limit on the total number of cached clauses
+      - stats: optional dict; "complete" is set to False if the limit was
+        reached, in which case some decisions may be wrong
+
+    Returns:
+      - T: a set of literals representing a satisfying interpretation.
+      - R: the cached clauses (original clauses plus generated resolvents).
+    """
+    R = set(clauses)
+    T = set()
+    for i in range(1, num_vars+1):
+        candidate = T | {i}  # Assume variable i is True
+        # Clauses not satisfied by T ∪ {i}, bucketed by their highest literal
+        buckets = {}
+        found_clause = False
+        for clause in R:
+            if clause.isdisjoint(candidate):
+                top = max(clause, key=abs) if clause else 0
+                if abs(top) <= i:
+                    found_clause = True
+                    break
+                buckets.setdefault(top, []).append(clause)
+
+        frontier = [(top, clause) for top, bucket in buckets.items() for clause in bucket]
+        while not found_clause and frontier and len(R) < max_resolvents:
+            new_resolvents = []
+            for top, c1 in frontier:
+                for c2 in buckets.get(-top, ()):
+                    resolvent = (c1 - {top}) | (c2 - {-top})
+                    if is_tautology(resolvent) or resolvent in R:
+                        continue
+                    R.add(resolvent)
+                    new_top = max(resolvent, key=abs) if resolvent else 0
+                    if abs(new_top) <= i:
+                        found_clause = True
+                        break
+                    new_resolvents.append((new_top, resolvent))
+                if found_clause or len(R) >= max_resolvents:
+                    break
+            for top, clause in new_resolvents:
+                buckets.setdefault(top, []).append(clause)
+            frontier = new_resolvents
+
+        if found_clause:
+            T.add(-i)
+        else:
+            T.add(i)
+    if stats is not None:
+        stats["complete"] = len(R) < max_resolvents
+    return T, R
+
+def solve_anytime(clauses, num_vars: int, deadline=None, minimal=True, max_iterations=2, max_resolvents=10000):
+    """
+    Resolution closure -> RES-SAT -> validation under one deadline.
+
+    The closure, the interpretation and the validation share the deadline, so
+    the call returns soon after it expires, with whatever was reached: a
+    partial closure, an interpretation whose undecided variables are true,
+    and a verdict that may be missing.
+
+    Input:
+      - clauses: the original clauses (each clause is a frozenset of ints)
+      - num_vars: number of atoms (assumed to be numbered 1 to num_vars)
+      - deadline: time budget in seconds, a CancellationToken (e.g. one
+        cancelled from another thread or an asyncio task) or None
+      - minimal, max_iterations, max_resolvents: as for the resolvent generators
+
+    Returns:
+      - dict with "closure", "interpretation", "valid" (True, False or None
+        if validation was cut short), "truncated" and "stats" (a SolverStats).
+    """
+    # imported here: resolvent_generator and validator are not needed by res_sat itself
+    from .resolvent_generator import generate_resolvents, generate_resolvents_minimal
+    from .solver_stats import SolverStats
+    from .validator import validate_interpretation
+
+    deadline = as_token(deadline)
+    stats = SolverStats()
+    generate = generate_resolvents_minimal if minimal else generate_resolvents
+    R = generate(clauses, max_iterations=max_iterations, max_resolvents=max_resolvents, verbose=False,
+                 stats=stats, deadline=deadline)
+    T = res_sat(R, num_vars, stats=stats, deadline=deadline)
+    valid = validate_interpretation(clauses, T, deadline=deadline)
+    return {"closure": R, "interpretation": T, "valid": valid,
+            "truncated": stats["truncated"] or valid is None, "stats": stats}
@@ -0,0 +1,614 @@
+import time
+from .utils import complement, is_tautology
+from .clause_arena import ClauseArena
+from .disk_store import DiskClauseStore
+from .checkpoint import encode_clauses, decode_clauses, clauses_digest
+from .cancellation import as_token
+from bisect import bisect_right
+
+
+def filter_minimal(clauses, deadline=None):
+    """
+    Given a set of clauses, return a new set containing only the minimal clauses.
+    A clause c is minimal if there is no other clause d (c != d) with d ⊆ c.
+
+    A ClauseArena is filtered in place (non-minimal clauses are tombstoned)
+    and returned; so is a DiskClauseStore (non-minimal clauses are deleted).
+    Once `deadline` (a CancellationToken) is cancelled, filtering stops and
+    some non-minimal clauses may remain.
+    """
+    if isinstance(clauses, ClauseArena):
+        return _filter_minimal_arena(clauses, deadline)
+    if isinstance(clauses, DiskClauseStore):
+        clauses.remove(clauses.subsumed_ids(deadline))
+        return clauses
+    minimal = set(clauses)  # Start with a copy of all clauses
+    for c in clauses:
+        if deadline is not None and deadline.cancelled:
+            break
+        for d in clauses:
+            if c != d and d.issubset(c):
+                # c is not minimal because d is a subset of c
+                if c in minimal:
+                    minimal.remove(c)
+                break
+    return minimal
+
+def _record_outcome(stats, iteration, changed):
+    """
+    Stores how a saturation loop ended in the caller's `stats` dict (if any).
+    The closure is complete only if the last iteration produced nothing new,
+    rather than stopping on max_iterations or max_resolvents.
+    """
+    if stats is not None:
+        stats["iterations"] = iteration
+        stats["complete"] = not changed
+
+def _record_truncated(stats, truncated):
+    """Marks in `stats` that the loop was stopped by its deadline (never complete then)."""
+    if stats is not None:
+        stats["truncated"] = truncated
+        if truncated:
+            stats["complete"] = False
+
+def _add_counts(stats, **counts):
+    for key, amount in counts.items():
+        stats[key] = stats.get(key, 0) + amount
+
+def _start_iteration(stats):
+    return time.perf_counter() if stats is not None else None
+
+def _end_iteration(stats, start):
+    if stats is not None:
+        stats.setdefault("iteration_times", []).append(time.perf_counter() - start)
+
+def _filter_minimal_counted(R, stats, deadline=None):
+    """
+    filter_minimal, recording its time and the number of removed clauses in
+    `stats` when given.
+    """
+    if stats is None:
+        return filter_minimal(R, deadline)
+    before = len(R)
+    start = time.perf_counter()
+    R = filter_minimal(R, deadline)
+    _add_counts(stats, filter_minimal_time=time.perf_counter() - start, subsumed_removed=before - len(R))
+    return R
+
+def _resolve_pairs(current_clauses, R, new_resolvents, rows=None, deadline=None, parents=None):
+    """
+    One pass of pairwise resolution: every non-tautological resolvent of two
+    clauses of current_clauses that is not in R is added to new_resolvents.
+
+    `rows` restricts the pass to the pairs (i, j > i) with i in rows. The
+    deadline is checked once per row; returns the first row that was not
+    processed because it was cancelled, or None if the pass completed.
+
+    With a `parents` dict (proof logging), parents[resolvent] = (c1, c2,
+    literal) is recorded for every new resolvent, with literal in c1.
+    """
+    for i in (range(len(current_clauses)) if rows is None else rows):
+        if deadline is not None and deadline.cancelled:
+            return i
+        for j in range(i+1, len(current_clauses)):
+            c1 = current_clauses[i]
+            c2 = current_clauses[j]
+            for literal in c1:
+                if -literal in c2:
+                    resolvent = (c1 - {literal}) | (c2 - {-literal})
+                    # Skip tautologies (clauses containing both literal and its complement)
+                    if is_tautology(resolvent):
+                        continue
+                    resolvent = frozenset(resolvent)
+                    if resolvent not in R and resolvent not in new_resolvents:
+                        new_resolvents.add(resolvent)
+                        if parents is not None:
+                            parents[resolvent] = (c1, c2, literal)
+    return None
+
+def _resolve_pairs_counted(current_clauses, R, new_resolvents, stats, rows=None, deadline=None, parents=None):
+    """
+    _resolve_pairs, also counting pairs, clashes, tautologies and duplicates into `stats`.
+    """
+    n = len(current_clauses)
+    rows = range(n) if rows is None else rows
+    clashing = tautologies = duplicates = pairs = 0
+    stopped = None
+    for i in rows:
+        if deadline is not None and deadline.cancelled:
+            stopped = i
+            break
+        pairs += n - 1 - i
+        for j in range(i+1, len(current_clauses)):
+            c1 = current_clauses[i]
+            c2 = current_clauses[j]
+            clashed = False
+            for literal in c1:
+                if -literal in c2:
+                    clashed = True
+                    resolvent = (c1 - {literal}) | (c2 - {-literal})
+                    if is_tautology(resolvent):
+                        tautologies += 1
+                        continue
+                    resolvent = frozenset(resolvent)
+                    if resolvent not in R and resolvent not in new_resolvents:
+                        new_resolvents.add(resolvent)
+                        if parents is not None:
+                            parents[resolvent] = (c1, c2, literal)
+                    else:
+                        duplicates += 1
+            clashing += clashed
+    _add_counts(stats, pairs_examined=pairs, clashing_pairs=clashing,
+                tautologies_skipped=tautologies, duplicates_rejected=duplicates)
+    return stopped
+
+def eligible_literal(order=None, selection=None):
+    """
+    The literal ordered resolution may resolve a clause upon.
+
+    Variables are ranked by their position in `order` (default: by number,
+    the order res_sat decides them in). A clause's eligible literal is the
+    one picked by `selection` if it picks one, else its maximal literal.
+
+    Parameters:
+        order: optional sequence of all variables, lowest first
+        selection: None, "negative" (the maximal negative literal, when the
+                   clause has one) or a function clause -> literal or None
+
+    Returns:
+        a function clause -> literal (None for the empty clause)
+    """
+    if order is None:
+        key = abs
+    else:
+        rank = {v: i for i, v in enumerate(order)}
+        key = lambda l: rank[abs(l)]
+    if selection == "negative":
+        selection = lambda clause: max((l for l in clause if l < 0), key=key, default=None)
+    elif selection is not None and not callable(selection):
+        raise ValueError(f"unknown selection {selection!r}")
+
+    def eligible(clause):
+        literal = selection(clause) if selection is not None else None
+        return literal if literal is not None else max(clause, key=key, default=None)
+    return eligible
+
+def _eligible_index(current_clauses, eligible):
+    """The eligible literal of every clause and, per literal, the ascending indices of its clauses."""
+    literals = [eligible(clause) for clause in current_clauses]
+    buckets = {}
+    for j, literal in enumerate(literals):
+        if literal is not None:
+            buckets.setdefault(literal, []).append(j)
+    return literals, buckets
+
+def _resolve_pairs_ordered(current_clauses, R, new_resolvents, index, stats=None, rows=None, deadline=None,
+                           parents=None):
+    """
+    _resolve_pairs restricted to ordered resolution: a pair (i, j > i) is
+    resolved only if the eligible literals of both clauses (see
+    _eligible_index) are complementary, and only upon them. Clauses are
+    matched through the buckets of the index instead of trying every pair;
+    pairs_examined counts the matched pairs.
+    """
+    literals, buckets = index
+    rows = range(len(current_clauses)) if rows is None else rows
+    clashing = tautologies = duplicates = 0
+    stopped = None
+    for i in rows:
+        if deadline is not None and deadline.cancelled:
+            stopped = i
+            break
+        literal = literals[i]
+        if literal is None:
+            continue
+        partners = buckets.get(-literal, ())
+        c1 = current_clauses[i]
+        rest = c1 - {literal}
+        for j in partners[bisect_right(partners, i):]:
+            clashing += 1
+            resolvent = rest | (current_clauses[j] - {-literal})
+            if is_tautology(resolvent):
+                tautologies += 1
+                continue
+            if resolvent not in R and resolvent not in new_resolvents:
+                new_resolvents.add(resolvent)
+                if parents is not None:
+                    parents[resolvent] = (c1, current_clauses[j], literal)
+            else:
+                duplicates += 1
+    if stats is not None:
+        _add_counts(stats, pairs_examined=clashing, clashing_pairs=clashing,
+                    tautologies_skipped=tautologies, duplicates_rejected=duplicates)
+    return stopped
+
+def _resolve_rows(current_clauses, R, new_resolvents, stats, rows, deadline, parents, index):
+    """Runs the pairwise loop that matches the options on `rows`."""
+    if index is not None:
+        return _resolve_pairs_ordered(current_clauses, R, new_resolvents, index, stats, rows, deadline, parents)
+    if stats is None:
+        return _resolve_pairs(current_clauses, R, new_resolvents, rows, deadline, parents)
+    return _resolve_pairs_counted(current_clauses, R, new_resolvents, stats, rows, deadline, parents)
+
+def _filter_minimal_arena(arena, deadline=None):
+    """
+    filter_minimal for a ClauseArena.
+
+    Any clause d ⊆ c contains its own smallest literal, which must then occur
+    in c, so the candidates for c are looked up by smallest literal instead of
+    being compared against every clause.
+    """
+    if arena.find(()) is not None:
+        # The empty clause is a subset of every other clause
+        for cid in list(arena.ids()):
+            if arena.lengths[cid]:
+                arena.remove(cid)
+        return arena
+    by_first = {}
+    for cid in arena.ids():
+        clause = arena.clause(cid)
+        by_first.setdefault(clause[0], []).append((cid, clause))
+    for cid in list(arena.ids()):
+        if deadline is not None and deadline.cancelled:
+            break
+        clause = arena.clause(cid)
+        literals = set(clause)
+        for l in clause:
+            if any(len(d) < len(clause) and arena.alive[did] and literals.issuperset(d)
+                   for did, d in by_first.get(l, ())):
+                arena.remove(cid)
+                break
+    return arena
+
+
+def _generate_resolvents_arena(arena, max_iterations, max_resolvents, minimal, verbose, stats, deadline=None):
+    """
+    generate_resolvents / generate_resolvents_minimal for a ClauseArena.
+
+    Resolvents go straight into a copy of the arena, which does the duplicate
+    check. Clauses are only expanded to tuples (and one set for the outer
+    clause of each pair) while an iteration runs.
+    """
+    R = arena.copy()
+    iteration = 0
+    changed = True
+    truncated = False
+
+    while changed and iteration < max_iterations and len(R) < max_resolvents:
+        if deadline is not None and deadline.cancelled:
+            truncated = True
+            break
+        if minimal and verbose:
+            print(f"Starting iteration {iteration}...")
+        iteration += 1
+        changed = False
+        start = _start_iteration(stats)
+        current_clauses = list(R.iter_clauses())
+        added = 0
+        for i in range(len(current_clauses)):
+            if deadline is not None and deadline.cancelled:
+                truncated = True
+                break
+            c1 = frozenset(current_clauses[i])
+            for j in range(i+1, len(current_clauses)):
+                c2 = current_clauses[j]
+                for literal in c2:
+                    if -literal in c1:
+                        resolvent = (c1 - {-literal}).union(l for l in c2 if l != literal)
+                        if is_tautology(resolvent):
+                            continue
+                        if R.add(resolvent)[1]:
+                            added += 1
+        if added:
+            if minimal:
+                _filter_minimal_counted(R, stats, deadline)
+                R.maybe_compact()
+                truncated = deadline is not None and deadline.cancelled
+                if verbose:
+                    print(f"Iteration {iteration}: added {added} new resolvents; minimal total now: {len(R)}")
+            elif verbose:
+                print(f"Iteration {iteration}: added {added} new resolvents; total now: {len(R)}")
+            changed = True
+        elif verbose:
+            print(f"Iteration {iteration}: no new resolvents found, stopping.")
+        _end_iteration(stats, start)
+        if truncated:
+            break
+    _record_outcome(stats, iteration, changed)
+    _record_truncated(stats, truncated)
+    return R
+
+def _generate_resolvents_disk(store, max_iterations, max_resolvents, minimal, verbose, stats, deadline=None):
+    """
+    generate_resolvents / generate_resolvents_minimal for a DiskClauseStore.
+
+    The store is extended in place. Instead of enumerating all pairs, each
+    iteration walks the variables and resolves the partition of v against the
+    partition of ¬v, which yields exactly the resolvents of all clashing pairs.
+    Only clauses that existed when the iteration started take part.
+    """
+    iteration = 0
+    changed = True
+    truncated = False
+
+    while changed and iteration < max_iterations and len(store) < max_resolvents:
+        if deadline is not None and deadline.cancelled:
+            truncated = True
+            break
+        if minimal and verbose:
+            print(f"Starting iteration {iteration}...")
+        iteration += 1
+        changed = False
+        start = _start_iteration(stats)
+        snapshot = store.last_id
+        added = 0
+        for v in store.variables():
+            if deadline is not None and deadline.cancelled:
+                truncated = True
+                break
+            for positive in store.partition(v, snapshot):
+                rests = [frozenset(c1) - {v} for _, c1 in positive]
+                for negative in store.partition(-v, snapshot):
+                    for rest in rests:
+                        for _, c2 in negative:
+                            resolvent = rest.union(l for l in c2 if l != -v)
+                            if is_tautology(resolvent):
+                                continue
+                            if store.add(resolvent):
+                                added += 1
+        store.flush()
+        if added:
+            if minimal:
+                _filter_minimal_counted(store, stats, deadline)
+                truncated = deadline is not None and deadline.cancelled
+                if verbose:
+                    print(f"Iteration {iteration}: added {added} new resolvents; minimal total now: {len(store)}")
+            elif verbose:
+                print(f"Iteration {iteration}: added {added} new resolvents; total now: {len(store)}")
+            changed = True
+        elif verbose:
+            print(f"Iteration {iteration}: no new resolvents found, stopping.")
+        _end_iteration(stats, start)
+        if truncated:
+            break
+    _record_outcome(stats, iteration, changed)
+    _record_truncated(stats, truncated)
+    return store
+
+def _resume(checkpoint, clauses, minimal, stats, ordered=False):
+    """
+    Loads `checkpoint` (if it is resuming) after checking that it was taken
+    on the same input with the same kind of closure; restores its counters
+    into `stats`.
+    """
+    state = checkpoint.load()
+    if state is None:
+        return None
+    if (state["minimal"] != minimal or state.get("ordered", False) != ordered
+            or state["input"] != clauses_digest(clauses)):
+        raise ValueError(f"{checkpoint.path} was written for a different formula or closure type")
+    if stats is not None:
+        stats.update(state["stats"])
+    return state
+
+def _save(checkpoint, state, clauses, delta, stats):
+    checkpoint.save({**state, "clauses": encode_clauses(clauses), "delta": encode_clauses(delta),
+                     "stats": dict(stats) if stats is not None else {}})
+
+def _generate_resolvents_sets(clauses, max_iterations, max_resolvents, minimal, verbose, stats, checkpoint,
+                              deadline=None, proof=None, eligible=None):
+    """
+    generate_resolvents / generate_resolvents_minimal for sets of frozensets.
+
+    With a Checkpoint, the state is saved at iteration boundaries (or every
+    checkpoint.interval seconds, between rows of the pairwise loop) and a
+    resumed run continues from the saved row with the same clause order, so
+    it produces the same closure as an uninterrupted one. max_iterations and
+    max_resolvents may be raised on resume to saturate further.
+
+    When `deadline` is cancelled in the middle of a pass, the resolvents found
+    so far are added to R unfiltered and the loop stops; the checkpoint then
+    holds the interrupted pass, so resuming finishes it.
+
+    With a ProofLog, the input clauses, every resolvent kept in R (with its
+    parents and pivot) and every clause filter_minimal drops are logged.
+
+    With an `eligible` function (see eligible_literal), each pass performs
+    ordered resolution only.
+    """
+    R = set(clauses)
+    iteration = 0
+    new_resolvents = set()
+    changed = True
+    current_clauses, first_row = None, 0  # a pass in progress, when resuming mid-iteration
+    delta = set()  # the resolvents added by the last completed iteration
+    base = {}
+    truncated = False
+    parents = None
+    if proof is not None:
+        parents = {}
+        if checkpoint is not None:
+            raise ValueError("proof logging cannot be combined with checkpoints")
+        proof.add_inputs(clauses)
+    if checkpoint is not None:
+        base = {"minimal": minimal, "ordered": eligible is not None, "input": clauses_digest(R),
+                "max_iterations": max_iterations, "max_resolvents": max_resolvents}
+        state = _resume(checkpoint, R, minimal, stats, eligible is not None)
+        if state is not None:
+            iteration, changed = state["iteration"], state["changed"]
+            if state["row"] is None:
+                R = set(decode_clauses(state["clauses"]))
+                delta = set(decode_clauses(state["delta"]))
+            else:
+                current_clauses, first_row = decode_clauses(state["clauses"]), state["row"]
+                R = set(current_clauses)
+                new_resolvents = set(decode_clauses(state["delta"]))
+            if verbose:
+                print(f"Resumed from {checkpoint.path} at iteration {iteration} with {len(R)} clauses.")
+
+    while current_clauses is not None or (changed and iteration < max_iterations and len(R) < max_resolvents):
+        if current_clauses is None:
+            if deadline is not None and deadline.cancelled:
+                truncated = True
+                break
+            if minimal and verbose:
+                print(f"Starting iteration {iteration}...")
+            iteration += 1
+            current_clauses, first_row = list(R), 0
+        changed = False
+        start = _start_iteration(stats)
+        rows = range(first_row, len(current_clauses))
+        index = _eligible_index(current_clauses, eligible) if eligible is not None else None
+        stopped = None
+        if checkpoint is None or checkpoint.interval is None:
+            stopped = _resolve_rows(current_clauses, R, new_resolvents, stats, rows, deadline, parents, index)
+        else:
+            # row by row, so that a timed checkpoint can be taken inside a long iteration
+            for i in rows:
+                stopped = _resolve_rows(current_clauses, R, new_resolvents, stats, (i,), deadline, parents, index)
+                if stopped is not None:
+                    break
+                if checkpoint.due():
+                    _save(checkpoint, {**base, "iteration": iteration, "changed": True, "row": i + 1},
+                          current_clauses, new_resolvents, stats)
+        if stopped is not None:
+            truncated = True
+            if checkpoint is not None:
+                _save(checkpoint, {**base, "iteration": iteration, "changed": True, "row": stopped},
+                      current_clauses, new_resolvents, stats)
+            R |= new_resolvents
+            if proof is not None:
+                proof.add_resolvents(parents)
+            if verbose:
+                print(f"Iteration {iteration}: deadline reached after {stopped} of {len(current_clauses)} rows; "
+                      f"returning {len(R)} clauses.")
+            _end_iteration(stats, start)
+            break
+        current_clauses = None
+
+        if new_resolvents:
+            R |= new_resolvents
+            if minimal:
+                # Filter R to keep only minimal resolvents
+                R = _filter_minimal_counted(R, stats, deadline)
+                # a filter cut short leaves a superset that must not be checkpointed
+                truncated = deadline is not None and deadline.cancelled
+            if proof is not None:
+                # derivations first: a dropped clause may be the parent of a kept one
+                proof.add_resolvents(parents, R if minimal else None)
+                if minimal:
+                    proof.delete([clause for clause in proof.ids if clause not in R])
+                parents = {}
+            if verbose:
+                total = "minimal total" if minimal else "total"
+                print(f"Iteration {iteration}: added {len(new_resolvents)} new resolvents; {total} now: {len(R)}")
+            delta, new_resolvents = new_resolvents & R, set()
+            # resolvents that were all subsumed leave R as it was: a fixpoint
+            changed = bool(delta) or not minimal
+        else:
+            delta = set()
+            if verbose:
+                print(f"Iteration {iteration}: no new resolvents found, stopping.")
+        _end_iteration(stats, start)
+        _record_outcome(stats, iteration, changed)
+        if truncated:
+            break
+        if checkpoint is not None and (checkpoint.interval is None or checkpoint.due()):
+            _save(checkpoint, {**base, "iteration": iteration, "changed": changed, "row": None}, R, delta, stats)
+    _record_outcome(stats, iteration, changed)
+    _record_truncated(stats, truncated)
+    if checkpoint is not None and not truncated:
+        _save(checkpoint, {**base, "iteration": iteration, "changed": changed, "row": None}, R, delta, stats)
+    return R
+
+def generate_resolvents(clauses, max_iterations=2, max_resolvents=10000, verbose=True, stats=None,
+                        checkpoint=None, deadline=None, proof=None, ordered=False, order=None, selection=None):
+    """
+    Generate the resolution closure R = RES(S).
+
+    If `clauses` is a ClauseArena, the closure is built and returned as a
+    ClauseArena; a DiskClauseStore is saturated in place and returned.
+    If a dict (or SolverStats) is passed as `stats`, "iterations", "complete"
+    and the resolution counters described in SolverStats are recorded in it.
+    A Checkpoint (sets of clauses only) saves progress and resumes from it.
+    `deadline` (seconds or a CancellationToken) stops saturation early, a
+    ProofLog records the derivation and `ordered` restricts the closure to
+    ordered resolution; see generate_resolvents_minimal.
+    """
+    deadline = as_token(deadline)
+    eligible = _ordering(ordered, order, selection)
+    if isinstance(clauses, ClauseArena):
+        _no_checkpoint(checkpoint, proof, eligible)
+        return _generate_resolvents_arena(clauses, max_iterations, max_resolvents, False, verbose, stats,
+                                          deadline)
+    if isinstance(clauses, DiskClauseStore):
+        _no_checkpoint(checkpoint, proof, eligible)
+        return _generate_resolvents_disk(clauses, max_iterations, max_resolvents, False, verbose, stats,
+                                         deadline)
+    return _generate_resolvents_sets(clauses, max_iterations, max_resolvents, False, verbose, stats, checkpoint,
+                                     deadline, proof, eligible)
+
+def generate_resolvents_minimal(clauses, max_iterations=2, max_resolvents=10000, verbose = True, stats=None,
+                                checkpoint=None, deadline=None, proof=None, ordered=False, order=None,
+                                selection=None):
+    """
+    Generate the resolution closure R = RES(S) with only minimal resolvents.
+    
+    Parameters:
+        clauses: an iterable of frozenset (the original clauses)
+        max_iterations: limit on the number of resolution iterations
+        max_resolvents: limit on the total number of clauses (to avoid explosion)
+        stats: optional dict or SolverStats; receives "iterations" and
+               "complete" (False if the loop stopped on a limit before reaching
+               a fixpoint) and the resolution counters described in SolverStats
+        checkpoint: optional Checkpoint; progress is saved to it and, if it
+                    is resuming, saturation continues from the saved state
+                    (not supported for a ClauseArena or DiskClauseStore)
+        deadline: optional time budget in seconds or CancellationToken; once
+                  it is cancelled, saturation stops and returns the clauses
+                  derived so far (sound, but possibly neither saturated nor
+                  minimal) and stats["truncated"] is set
+        proof: optional ProofLog receiving the input clauses, each kept
+               resolvent with its parent IDs and pivot, and the deletions made
+               by filter_minimal (sets of clauses only, without a checkpoint)
+        ordered: if True, two clauses are resolved only upon their eligible
+                 literals: the maximal literal of each clause under `order`
+                 (default 1..num_vars, as in res_sat), unless `selection`
+                 ("negative" or a function clause -> literal or None) selects
+                 another one (see eligible_literal). This is refutation
+                 complete and generates far fewer resolvents; without a
+                 selection, res_sat with the same order still finds a model
+                 on the saturated closure (sets of clauses only)
+        
+    Returns:
+        R: set of minimal resolvents (each clause is a frozenset of ints), or a
+           ClauseArena / DiskClauseStore if `clauses` is one
+    """
+    deadline = as_token(deadline)
+    eligible = _ordering(ordered, order, selection)
+    if isinstance(clauses, ClauseArena):
+        _no_checkpoint(checkpoint, proof, eligible)
+        return _generate_resolvents_arena(clauses, max_iterations, max_resolvents, True, verbose, stats,
+                                          deadline)
+    if isinstance(clauses, DiskClauseStore):
+        _no_checkpoint(checkpoint, proof, eligible)
+        return _generate_resolvents_disk(clauses, max_iterations, max_resolvents, True, verbose, stats,
+                                         deadline)
+    return _generate_resolvents_sets(clauses, max_iterations, max_resolvents, True, verbose, stats, checkpoint,
+                                     deadline, proof, eligible)
+
+def _ordering(ordered, order, selection):
+    if not ordered:
+        if order is not None or selection is not None:
+            raise ValueError("order and selection require ordered=True")
+        return None
+    return eligible_literal(order, selection)
+
+def _no_checkpoint(checkpoint, proof=None, eligible=None):
+    if checkpoint is not None:
+        raise ValueError("checkpoints are only supported for sets of clauses; "
+                         "a DiskClauseStore is already persistent")
+    if proof is not None:
+        raise ValueError("proof logging is only supported for sets of clauses")
+    if eligible is not None:
+        raise ValueError("ordered resolution is only supported for sets of clauses")
@@ -0,0 +1,89 @@
+import hashlib
+import json
+import os
+import time
+
+DEFAULT_PATH = ".res_sat_cache.sqlite"
+
+
+def file_digest(path) -> str:
+    """SHA-256 of the file's content."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def code_version(directory=None) -> str:
+    """
+    Short hash of every .py file next to this module (or in `directory`).
+
+    All of them are hashed rather than a hand-kept list of solver modules,
+    so an edit to anything a result could depend on, however indirectly
+    imported, invalidates every cached entry.
+    """
+    directory = directory or os.path.dirname(os.path.abspath(__file__))
+    digest = hashlib.sha256()
+    for name in sorted(os.listdir(directory)):
+        if name.endswith(".py"):
+            digest.update(name.encode() + b"\0")
+            with open(os.path.join(directory, name), "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+class ResultCache:
+    """
+    Results of solved instances, kept in a local SQLite file.
+
+    An entry is keyed by the content hash of the CNF file, the solver
+    configuration (any JSON-serialisable dict, e.g. engine and method) and
+    the code version, and holds a JSON record chosen by the caller: verdict,
+    interpretation, timings, closure size, ...
+    """
+
+    def __init__(self, path=DEFAULT_PATH, version=None):
+        # imported here so that importing the batch runners stays cheap without a cache
+        import sqlite3
+        self.path = path
+        self.version = version or code_version()
+        self.db = sqlite3.connect(path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS results (file_hash TEXT, config TEXT, version TEXT, "
+                        "file TEXT, record TEXT, created REAL, PRIMARY KEY (file_hash, config, version))")
+        self._digests = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.db.close()
+
+    def _key(self, cnf_file, config):
+        path = os.path.abspath(cnf_file)
+        stat = os.stat(path)
+        # hash each file once per (size, mtime), not on every lookup
+        cached = self._digests.get(path)
+        if cached is None or cached[0] != (stat.st_size, stat.st_mtime_ns):
+            cached = ((stat.st_size, stat.st_mtime_ns), file_digest(path))
+            self._digests[path] = cached
+        return cached[1], json.dumps(config, sort_keys=True), self.version
+
+    def get(self, cnf_file, config):
+        """The cached record for this file and configuration, or None."""
+        row = self.db.execute("SELECT record FROM results WHERE file_hash = ? AND config = ? AND version = ?",
+                              self._key(cnf_file, config)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, cnf_file, config, record):
+        """Stores (or replaces) the record for this file and configuration."""
+        self.db.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                        (*self._key(cnf_file, config), os.path.basename(cnf_file),
+                         json.dumps(record), time.time()))
+        self.db.commit()
+
+    def __len__(self):
+        return self.db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
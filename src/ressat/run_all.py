@@ -0,0 +1,457 @@
+import os
+import sys
+import re
+import json
+import time
+import argparse
+import subprocess
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .cnf_parser import parse_cnf
+from .resolvent_generator import generate_resolvents_minimal
+from .res_sat import res_sat
+from .validator import validate_interpretation
+from .symmetry import break_symmetries
+from .cdcl import cdcl_sat
+from .solver_stats import SolverStats
+from .profiling import PhaseProfiler
+from .result_cache import DEFAULT_PATH, ResultCache
+from .checkpoint import Checkpoint
+from .utils import module_command
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+def natural_sort_key(s):
+    """
+    Sort strings that contain numbers in a way that humans would expect.
+    For example: aim-50-1_6-no-1.cnf comes before aim-100-1_6-no-1.cnf
+    """
+    # Extract the main number after "aim-"
+    main_number_match = re.search(r'aim-(\d+)-', s)
+    main_number = int(main_number_match.group(1)) if main_number_match else 0
+    
+    # Extract the secondary parameters in x_y format
+    secondary_match = re.search(r'-(\d+)_(\d+)-', s)
+    x = int(secondary_match.group(1)) if secondary_match else 0
+    y = int(secondary_match.group(2)) if secondary_match else 0
+    
+    # Extract if it's yes/no
+    yes_no = 1 if "yes" in s else 0
+    
+    # Extract the final number
+    final_match = re.search(r'-(yes|no)-(\d+)\.cnf', s)
+    final_number = int(final_match.group(2)) if final_match else 0
+    
+    # Return a tuple for sorting
+    return (main_number, x, y, yes_no, final_number)
+
+def checkpoint_for(cnf_file, checkpoint_dir, interval=None, resume=False):
+    """The Checkpoint of one file inside `checkpoint_dir` (None if no directory is given)."""
+    if checkpoint_dir is None:
+        return None
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    path = os.path.join(checkpoint_dir, os.path.basename(cnf_file) + ".ckpt.gz")
+    return Checkpoint(path, interval=interval, resume=resume)
+
+def process_cnf_file(cnf_file, symmetry=False, engine="auto", profiler=None, checkpoint=None):
+    """
+    Process a single CNF file with the resolution-based SAT solver.
+
+    engine is "res-sat", "cdcl", or "auto" (RES-SAT, falling back to CDCL
+    when the resolution closure is incomplete and the RES-SAT interpretation
+    does not satisfy the formula). If a PhaseProfiler is given,
+    every phase is profiled with it; a Checkpoint saves (and resumes) the
+    saturation.
+    """
+    if profiler is None:
+        profiler = PhaseProfiler(enabled=False)
+    print(f"\n{'='*80}\nProcessing CNF file: {cnf_file}\n{'='*80}")
+    
+    try:
+        num_vars, clauses, satisfiable = profiler.call("parse", parse_cnf, cnf_file)
+        print(f"Number of variables: {num_vars}")
+        print(f"Number of clauses: {len(clauses)}")
+
+        working_clauses, working_vars = clauses, num_vars
+        if symmetry:
+            working_clauses, working_vars, num_symmetries = profiler.call("symmetry", break_symmetries,
+                                                                          clauses, num_vars)
+            print(f"Found {num_symmetries} symmetries; added {len(working_clauses) - len(clauses)} symmetry-breaking clauses.")
+        
+        stats = SolverStats()
+        if engine != "cdcl":
+            print("Generating resolution closure (this may take some time for large inputs)...")
+            R = profiler.call("resolve", generate_resolvents_minimal, working_clauses, stats=stats,
+                              checkpoint=checkpoint)
+            print(f"Resolution closure generated with {len(R)} clauses.")
+
+            print("Running RES-SAT procedure...")
+            interpretation = profiler.call("res_sat", res_sat, R, working_vars, stats=stats)
+            print(f"Solver stats: {stats.summary()}")
+
+        fallback = engine == "cdcl"
+        if engine == "auto" and not stats["complete"]:
+            # an incomplete closure may still give a model: keep it if it checks out
+            if profiler.call("check", validate_interpretation, working_clauses, interpretation):
+                print("Resolution closure is incomplete, but the RES-SAT interpretation satisfies the formula.")
+            else:
+                print("Resolution closure is incomplete; switching to the CDCL engine.")
+                fallback = True
+        if fallback:
+            print("Running CDCL solver...")
+            interpretation = profiler.call("cdcl", cdcl_sat, working_clauses, working_vars)
+            if interpretation is None:
+                print("The formula is unsatisfiable.")
+                return True
+        interpretation = {l for l in interpretation if abs(l) <= num_vars}
+        print("Satisfying interpretation (as a set of literals):")
+        print(interpretation)
+
+        # Validate the interpretation against the original CNF clauses
+        if profiler.call("validate", validate_interpretation, clauses, interpretation):
+            print("Validation passed: the interpretation satisfies the CNF formula.")
+        else:
+            print("Validation failed: the interpretation does NOT satisfy the CNF formula.")
+        
+        return True
+    except Exception as e:
+        print(f"Error processing file {cnf_file}: {str(e)}")
+        return False
+
+def solve_instance(cnf_file, symmetry=False, engine="auto", checkpoint=None):
+    """
+    Solves one CNF file like process_cnf_file, but quietly.
+
+    Returns:
+        dict: "file", "status" ("sat", "unsat" or "unknown"), "engine" (the engine that
+        produced the answer), "num_vars", "num_clauses", "closure_size"
+        (None if no closure was built), "valid" (None when unsat), the
+        per-phase times "<phase>_time", "interpretation" (sorted literals,
+        None when unsat) and the SolverStats counters as "stats_*".
+    """
+    record = {"file": os.path.basename(cnf_file)}
+
+    def phase(name, function, *args, **kwargs):
+        start = time.perf_counter()
+        value = function(*args, **kwargs)
+        record[f"{name}_time"] = time.perf_counter() - start
+        return value
+
+    num_vars, clauses, _ = phase("parse", parse_cnf, cnf_file)
+    record.update({"num_vars": num_vars, "num_clauses": len(clauses), "closure_size": None})
+    working_clauses, working_vars = clauses, num_vars
+    if symmetry:
+        working_clauses, working_vars, _ = phase("symmetry", break_symmetries, clauses, num_vars)
+
+    stats = SolverStats()
+    used = engine
+    if engine != "cdcl":
+        R = phase("resolve", generate_resolvents_minimal, working_clauses, verbose=False, stats=stats,
+                  checkpoint=checkpoint)
+        record["closure_size"] = len(R)
+        interpretation = phase("res_sat", res_sat, R, working_vars, stats=stats)
+        used = "res-sat"
+    if engine == "cdcl" or (engine == "auto" and not stats["complete"]
+                            and not phase("check", validate_interpretation, working_clauses, interpretation)):
+        interpretation = phase("cdcl", cdcl_sat, working_clauses, working_vars)
+        used = "cdcl"
+    record["engine"] = used
+    record.update({f"stats_{k}": v for k, v in stats.counters().items()})
+
+    if interpretation is None:
+        record.update({"status": "unsat", "valid": None, "interpretation": None})
+        return record
+    interpretation = {l for l in interpretation if abs(l) <= num_vars}
+    record["interpretation"] = sorted(interpretation, key=abs)
+    record["valid"] = phase("validate", validate_interpretation, clauses, interpretation)
+    # RES-SAT on an incomplete closure may return a non-model: no answer then
+    record["status"] = "sat" if record["valid"] else "unknown"
+    return record
+
+def estimate_cost(cnf_file):
+    """
+    Cheap size estimate used to schedule the longest instances first:
+    the clause count from the DIMACS header, or the file size if the
+    header is missing.
+    """
+    with open(cnf_file) as f:
+        for line in f:
+            if line.startswith("p"):
+                fields = line.split()
+                if len(fields) >= 4 and fields[3].isdigit():
+                    return int(fields[3])
+                break
+    return os.path.getsize(cnf_file)
+
+def run_limited(cnf_file, symmetry=False, engine="auto", timeout=None, memory_limit=None,
+                checkpoint_args=()):
+    """
+    Runs solve_instance in a fresh Python process with resource limits.
+
+    The child is killed when it exceeds `timeout` seconds of wall-clock time;
+    `memory_limit` (MB) caps its address space (RLIMIT_AS, Unix only), so a
+    runaway closure fails with MemoryError instead of exhausting the machine.
+    The child applies the limit to itself (--memory-limit): run_parallel
+    calls this from threads, where a preexec_fn could deadlock the child
+    between fork and exec.
+    `checkpoint_args` are extra command-line options for the child, e.g.
+    ["--checkpoint-dir", DIR, "--resume"], so that a killed run can be resumed.
+
+    Returns:
+        dict: the record of solve_instance plus "wall_time", or a record
+        whose "status" is "timeout", "memout" or "error" (with "error").
+    """
+    command, env = module_command(__spec__.name)
+    command += ["--instance", cnf_file, "--engine", engine]
+    if symmetry:
+        command.append("--symmetry")
+    if memory_limit is not None:
+        command += ["--memory-limit", str(memory_limit)]
+    command += list(checkpoint_args)
+
+    start = time.perf_counter()
+    record = {"file": os.path.basename(cnf_file)}
+    try:
+        completed = subprocess.run(command, capture_output=True, text=True, timeout=timeout, check=False, env=env)
+    except subprocess.TimeoutExpired:
+        record["status"] = "timeout"
+    else:
+        lines = completed.stdout.splitlines()
+        if completed.returncode == 0 and lines:
+            record = json.loads(lines[-1])
+        elif "MemoryError" in completed.stderr:
+            record["status"] = "memout"
+        else:
+            record.update({"status": "error",
+                           "error": (completed.stderr.strip().splitlines() or [f"exit code {completed.returncode}"])[-1]})
+    record["wall_time"] = time.perf_counter() - start
+    return record
+
+# Statuses that depend only on the formula and the solver, not on the limits
+CACHEABLE = ("sat", "unsat", "unknown")
+
+def cache_config(symmetry=False, engine="auto"):
+    """The solver configuration that result-cache entries of run_all are keyed by."""
+    return {"runner": "run_all", "engine": engine, "symmetry": symmetry, "method": "minimal"}
+
+def describe(record):
+    """One-line summary of a solve_instance / run_limited record."""
+    times = [f"{key[:-5]} {record[key]:.3f}s" for key in record
+             if key.endswith("_time") and not key.startswith("stats_")]
+    closure = f", closure {record['closure_size']} clauses" if record.get("closure_size") is not None else ""
+    return f"{record['status']}{closure}" + (f" ({', '.join(times)})" if times else "")
+
+def run_parallel(cnf_files, jobs, output, symmetry=False, engine="auto", timeout=None, memory_limit=None,
+                 cache=None, checkpoint_args=()):
+    """
+    Solves many files with `jobs` limited worker processes (see run_limited).
+
+    Files are started longest-first (by estimate_cost) to shorten the
+    makespan. One JSON line per file is written to `output` and flushed as
+    soon as that file finishes, so the order of lines is completion order.
+
+    With a ResultCache, files solved before with the same configuration and
+    solver code are not run again: their stored records are written first,
+    marked "cached": true. New sat/unsat/unknown results are stored.
+
+    Returns:
+        list of dict: the records, in completion order.
+    """
+    config = cache_config(symmetry, engine)
+    records = []
+
+    def emit(record):
+        output.write(json.dumps(record) + "\n")
+        output.flush()
+        records.append(record)
+
+    todo = []
+    for cnf_file in cnf_files:
+        record = cache.get(cnf_file, config) if cache is not None else None
+        if record is None:
+            todo.append(cnf_file)
+        else:
+            emit({**record, "cached": True})
+
+    ordered = sorted(todo, key=estimate_cost, reverse=True)
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = {pool.submit(run_limited, f, symmetry, engine, timeout, memory_limit, checkpoint_args): f
+                   for f in ordered}
+        for future in as_completed(futures):
+            record = future.result()
+            if cache is not None and record["status"] in CACHEABLE:
+                cache.put(futures[future], config, record)
+            emit(record)
+    return records
+
+def main():
+    parser = argparse.ArgumentParser(description="Run RES-SAT on every CNF file in a directory")
+    parser.add_argument("directory", nargs="?", help="Directory containing .cnf files")
+    parser.add_argument("--symmetry", action="store_true",
+                        help="Add lex-leader symmetry-breaking clauses before resolution")
+    parser.add_argument("--engine", choices=["auto", "res-sat", "cdcl"], default="auto",
+                        help="Solving engine; 'auto' runs RES-SAT and switches to CDCL "
+                             "when the closure is incomplete and the RES-SAT model fails")
+    parser.add_argument("--profile", nargs="?", const="profiles", metavar="DIR",
+                        help="Profile each phase (accumulated over all files) and write "
+                             ".pstats and collapsed stacks to DIR (default: profiles; not with -j or --cache)")
+    parser.add_argument("-j", "--jobs", type=int,
+                        help="Solve N files at a time, each in its own limited process, and "
+                             "stream one JSON line per file")
+    parser.add_argument("--timeout", type=float,
+                        help="Wall-clock limit per file in seconds (with -j)")
+    parser.add_argument("--memory-limit", type=float, metavar="MB",
+                        help="Address-space limit per file in MB (with -j or --instance, Unix only)")
+    parser.add_argument("--output", metavar="FILE",
+                        help="Write the JSON lines to FILE instead of stdout (with -j)")
+    parser.add_argument("--cache", nargs="?", const=DEFAULT_PATH, metavar="PATH",
+                        help="Reuse results of unchanged files from a SQLite result cache "
+                             f"(default: {DEFAULT_PATH}); without -j, files are then solved "
+                             "quietly and summarised in one line")
+    parser.add_argument("--checkpoint-dir", metavar="DIR",
+                        help="Save the saturation state of every file to DIR/<file>.ckpt.gz")
+    parser.add_argument("--checkpoint-interval", type=float, metavar="SECONDS",
+                        help="Save checkpoints every SECONDS instead of after every iteration")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue every file from its checkpoint in --checkpoint-dir, if any")
+    parser.add_argument("--instance", metavar="FILE", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.resume and not args.checkpoint_dir:
+        parser.error("--resume requires --checkpoint-dir")
+    if args.checkpoint_dir and args.engine == "cdcl":
+        parser.error("--checkpoint-dir saves the resolution closure and cannot be combined with --engine cdcl")
+    if not args.jobs and not args.instance and (args.timeout is not None or args.memory_limit is not None
+                                                or args.output):
+        parser.error("--timeout, --memory-limit and --output apply to the worker processes of -j")
+    if args.profile is not None and (args.jobs or args.cache):
+        parser.error("--profile profiles the serial, uncached run and cannot be combined with -j or --cache")
+
+    def checkpoint(cnf_file):
+        return checkpoint_for(cnf_file, args.checkpoint_dir, args.checkpoint_interval, args.resume)
+
+    if args.instance:
+        # worker mode of run_limited: solve one file and print its record
+        if args.memory_limit is not None and resource is not None:
+            size = int(args.memory_limit * 1024 * 1024)
+            resource.setrlimit(resource.RLIMIT_AS, (size, size))
+        try:
+            record = solve_instance(args.instance, symmetry=args.symmetry, engine=args.engine,
+                                    checkpoint=checkpoint(args.instance))
+        except MemoryError:
+            record = {"file": os.path.basename(args.instance), "status": "memout"}
+        print(json.dumps(record))
+        return
+    if args.directory is None:
+        parser.error("the directory argument is required")
+    profiler = PhaseProfiler(args.profile, enabled=args.profile is not None)
+    
+    directory = args.directory
+    
+    if not os.path.isdir(directory):
+        print(f"Error: {directory} is not a valid directory.")
+        sys.exit(1)
+    
+    # with -j, stdout carries the JSON lines only
+    log = sys.stderr if args.jobs else sys.stdout
+    print(f"Processing all CNF files in directory: {directory}", file=log)
+    
+    # Get all CNF files
+    cnf_files = [f for f in os.listdir(directory) if f.endswith('.cnf')]
+    
+    if not cnf_files:
+        print("No CNF files found in the specified directory.")
+        sys.exit(1)
+    
+    # Sort files using the natural sort key
+    try:
+        sorted_files = sorted(cnf_files, key=natural_sort_key)
+    except Exception as e:
+        print(f"Error during sorting: {str(e)}")
+        print("Falling back to basic sort")
+        sorted_files = sorted(cnf_files)
+    
+    cache = ResultCache(args.cache) if args.cache else None
+    checkpoint_args = []
+    if args.checkpoint_dir:
+        checkpoint_args += ["--checkpoint-dir", args.checkpoint_dir]
+        if args.checkpoint_interval is not None:
+            checkpoint_args += ["--checkpoint-interval", str(args.checkpoint_interval)]
+        if args.resume:
+            checkpoint_args.append("--resume")
+    if args.jobs:
+        output = open(args.output, "w") if args.output else sys.stdout
+        try:
+            records = run_parallel([os.path.join(directory, f) for f in sorted_files], args.jobs, output,
+                                   symmetry=args.symmetry, engine=args.engine,
+                                   timeout=args.timeout, memory_limit=args.memory_limit, cache=cache,
+                                   checkpoint_args=checkpoint_args)
+        finally:
+            if args.output:
+                output.close()
+            if cache is not None:
+                cache.close()
+        counts = {}
+        for record in records:
+            counts[record["status"]] = counts.get(record["status"], 0) + 1
+        print("Summary: " + ", ".join(f"{status}={n}" for status, n in sorted(counts.items())), file=log)
+        return
+
+    print(f"Found {len(sorted_files)} CNF files to process.")
+    print("Files will be processed in the following order:")
+    for i, file in enumerate(sorted_files, 1):
+        print(f"{i}. {file}")
+    
+    # Ask for confirmation
+    response = 'y'
+    if response.lower() != 'y':
+        print("Operation cancelled.")
+        sys.exit(0)
+    
+    results = {}
+    for i, cnf_file in enumerate(sorted_files, 1):
+        full_path = os.path.join(directory, cnf_file)
+        print(f"\nProcessing file {i}/{len(sorted_files)}: {cnf_file}")
+        if cache is None:
+            results[cnf_file] = process_cnf_file(full_path, symmetry=args.symmetry, engine=args.engine,
+                                                 profiler=profiler, checkpoint=checkpoint(full_path))
+            continue
+        config = cache_config(args.symmetry, args.engine)
+        record = cache.get(full_path, config)
+        if record is not None:
+            print(f"Cached result: {describe(record)}")
+            results[cnf_file] = True
+            continue
+        try:
+            record = solve_instance(full_path, symmetry=args.symmetry, engine=args.engine,
+                                    checkpoint=checkpoint(full_path))
+        except Exception as e:
+            print(f"Error processing file {full_path}: {str(e)}")
+            results[cnf_file] = False
+            continue
+        cache.put(full_path, config, record)
+        print(f"Solved: {describe(record)}")
+        results[cnf_file] = True
+    if cache is not None:
+        cache.close()
+    
+    # Print summary
+    print("\n" + "="*80)
+    print("SUMMARY OF RESULTS")
+    print("="*80)
+    print(f"Total files processed: {len(sorted_files)}")
+    successful = sum(1 for success in results.values() if success)
+    print(f"Successfully processed: {successful}")
+    print(f"Failed: {len(sorted_files) - successful}")
+    
+    if len(sorted_files) - successful > 0:
+        print("\nFailed files:")
+        for cnf_file, success in results.items():
+            if not success:
+                print(f"- {cnf_file}")
+
+    profiler.write()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,406 @@
+import argparse
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlsplit, parse_qs
+from .cnf_parser import parse_cnf_text
+from .prop_to_cnf import formula_to_cnf
+from .resolvent_generator import generate_resolvents_minimal
+from .res_sat import res_sat
+from .validator import validate_interpretation
+from .cdcl import cdcl_sat
+from .cancellation import CancellationToken
+
+ENGINES = ("auto", "res-sat", "cdcl")
+FORMATS = ("dimacs", "prop")
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            408: "Request Timeout", 413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable", 504: "Gateway Timeout"}
+
+
+class _LRUCache:
+    """
+    Least-recently-used mapping holding at most `maxsize` entries.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+        self.misses += 1
+        return None
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def info(self):
+        return {"size": len(self.entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+def formula_key(clauses, num_vars: int) -> str:
+    """
+    Returns a digest that identifies a formula regardless of clause and literal order.
+    """
+    canonical = sorted(tuple(sorted(clause)) for clause in set(map(frozenset, clauses)))
+    return hashlib.sha256(repr((num_vars, canonical)).encode()).hexdigest()
+
+
+def parse_formula(text: str, fmt="dimacs"):
+    """
+    Parses a formula sent to the daemon.
+
+    Returns:
+        num_vars (int): number of atoms.
+        clauses (list of frozenset): the clauses.
+        mapping (dict or None): variable name -> atom for propositional input.
+    """
+    if fmt == "prop":
+        clauses, num_vars, mapping = formula_to_cnf(text)
+        return num_vars, [frozenset(clause) for clause in clauses], mapping
+    num_vars, clauses, _ = parse_cnf_text(text)
+    if num_vars is None:
+        num_vars = max((abs(l) for clause in clauses for l in clause), default=0)
+    return num_vars, clauses, None
+
+
+def prepare(text: str, fmt="dimacs"):
+    """
+    parse_formula plus the formula_key of the result. Executed in the worker
+    processes, so a large body does not hold up the event loop.
+    """
+    num_vars, clauses, mapping = parse_formula(text, fmt)
+    return num_vars, clauses, mapping, formula_key(clauses, num_vars)
+
+
+def solve(clauses, num_vars: int, engine="auto", closure=None, deadline=None):
+    """
+    Runs the resolve -> RES-SAT -> validate pipeline (with the CDCL fallback)
+    on an already parsed formula. Executed in the worker processes.
+
+    Args:
+        closure: a previously computed (closure, complete) pair for this
+                 formula, or None to generate it.
+        deadline: time.time() value after which the job gives up (it may
+                  have waited in the pool's queue, so this is absolute).
+
+    Returns:
+        dict: "satisfiable" (True, False, or None when RES-SAT failed on an
+        incomplete closure and CDCL was not allowed, or the deadline passed),
+        "interpretation", "engine" (the engine that produced the answer),
+        "timed_out" and, when a complete or budget-free closure was generated
+        here, "closure" so the caller can cache it.
+    """
+    token = None
+    if deadline is not None:
+        token = CancellationToken(time_budget=max(0.0, deadline - time.time()))
+    result = {"closure": None, "timed_out": False}
+    interpretation = None
+    complete = False
+    if engine != "cdcl":
+        if closure is None:
+            stats = {"complete": False, "truncated": False}
+            R = generate_resolvents_minimal(clauses, verbose=False, stats=stats, deadline=token)
+            closure = (list(R), stats["complete"])
+            if not stats["truncated"]:
+                # a closure cut short by this request's deadline is not worth keeping
+                result["closure"] = closure
+        R, complete = closure
+        interpretation = res_sat(R, num_vars, deadline=token)
+        result["engine"] = "res-sat"
+    if token is not None and token.cancelled:
+        result.update(satisfiable=None, interpretation=None, timed_out=True)
+        return result
+    if engine == "cdcl" or (engine == "auto" and not complete
+                            and not validate_interpretation(clauses, interpretation, deadline=token)):
+        interpretation = cdcl_sat(clauses, num_vars, deadline=token)
+        result["engine"] = "cdcl"
+        if interpretation is None:
+            if token is not None and token.cancelled:
+                result.update(satisfiable=None, interpretation=None, timed_out=True)
+            else:
+                result.update(satisfiable=False, interpretation=None)
+            return result
+
+    if validate_interpretation(clauses, interpretation):
+        satisfiable = True
+    else:
+        # A complete closure that RES-SAT cannot satisfy contains the empty clause.
+        satisfiable = False if complete else None
+    result.update(satisfiable=satisfiable,
+                  interpretation=sorted(interpretation, key=abs) if satisfiable else None)
+    return result
+
+
+class SolverServer:
+    """
+    Long-lived solver daemon speaking a small subset of HTTP/1.1 over TCP
+    (localhost) or a Unix socket.
+
+    Endpoints:
+      - POST /solve?format=dimacs|prop&engine=auto|res-sat|cdcl&timeout=SECONDS
+        with the formula as the request body; answers with a JSON object.
+      - GET /stats: cache and queue counters.
+      - GET /health: liveness check.
+
+    Parsing and solving run in a process pool, so the event loop keeps
+    answering other connections (and the 503/504 fast paths) meanwhile. At most `max_pending` jobs are admitted
+    at a time (running or waiting for a worker); further requests are refused
+    with 503 instead of piling up. Every job carries its request's deadline
+    and stops itself once it passes, and its admission slot is only freed
+    when the job has actually finished, so a request that timed out (504)
+    keeps counting against `max_pending` until its worker is free again. A
+    client that does not send its request within `read_timeout` seconds gets
+    408.
+
+    Two LRU caches stay warm across requests: parsed formulas keyed by the
+    request body, and resolution closures keyed by the canonical formula.
+    """
+
+    def __init__(self, workers=None, max_pending=None, timeout=60.0, cache_size=128,
+                 max_request_bytes=64 * 1024 * 1024, read_timeout=10.0):
+        self.workers = workers or os.cpu_count() or 1
+        self.max_pending = max_pending or 4 * self.workers
+        self.timeout = timeout
+        self.read_timeout = read_timeout
+        self.max_request_bytes = max_request_bytes
+        self.formulas = _LRUCache(cache_size)
+        self.closures = _LRUCache(cache_size)
+        self.executor = None
+        self.server = None
+        self._slots = None
+        self.pending = 0
+        self.counters = {"requests": 0, "solved": 0, "rejected": 0, "timeouts": 0, "errors": 0,
+                         "read_timeouts": 0}
+
+    async def start(self, host="127.0.0.1", port=8765, path=None):
+        """
+        Starts listening on `path` (a Unix socket) if given, otherwise on host:port.
+        """
+        # Forked workers would inherit the sockets of open connections and keep
+        # them from closing, so workers are spawned fresh (once, they are reused).
+        self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                            mp_context=multiprocessing.get_context("spawn"))
+        self._slots = asyncio.Semaphore(self.max_pending)
+        if path is not None:
+            if os.path.exists(path):
+                os.remove(path)
+            self.server = await asyncio.start_unix_server(self._handle, path=path)
+        else:
+            self.server = await asyncio.start_server(self._handle, host, port)
+        return self.server
+
+    async def close(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+
+    # -- HTTP plumbing -----------------------------------------------------
+
+    async def _handle(self, reader, writer):
+        try:
+            status, body = await self._dispatch(reader)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+            return
+        payload = json.dumps(body).encode()
+        head = (f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: close\r\n")
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write(head.encode() + b"\r\n" + payload)
+        try:
+            await writer.drain()
+        except ConnectionError:
+            pass
+        writer.close()
+
+    async def _read_head(self, reader):
+        request_line = (await reader.readline()).decode("latin-1").split()
+        headers = {}
+        while True:
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        return request_line, headers
+
+    async def _dispatch(self, reader):
+        try:
+            request_line, headers = await asyncio.wait_for(self._read_head(reader), self.read_timeout)
+        except asyncio.TimeoutError:
+            self.counters["read_timeouts"] += 1
+            return 408, {"error": f"request not received within {self.read_timeout} seconds"}
+        if len(request_line) < 2:
+            return 400, {"error": "malformed request line"}
+        method, target = request_line[0], request_line[1]
+
+        url = urlsplit(target)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        if url.path == "/health":
+            return 200, {"status": "ok"}
+        if url.path == "/stats":
+            return 200, self.stats()
+        if url.path != "/solve":
+            return 404, {"error": f"unknown path {url.path}"}
+        if method != "POST":
+            return 405, {"error": "use POST /solve"}
+
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            return 400, {"error": "invalid Content-Length"}
+        if length > self.max_request_bytes:
+            return 413, {"error": f"request body exceeds {self.max_request_bytes} bytes"}
+        try:
+            text = (await asyncio.wait_for(reader.readexactly(length), self.read_timeout)).decode()
+        except asyncio.TimeoutError:
+            self.counters["read_timeouts"] += 1
+            return 408, {"error": f"request body not received within {self.read_timeout} seconds"}
+        except UnicodeDecodeError:
+            return 400, {"error": "request body is not UTF-8"}
+        return await self.handle_solve(text, query)
+
+    # -- solving -----------------------------------------------------------
+
+    async def handle_solve(self, text: str, query: dict):
+        """
+        Solves one formula. Returns (HTTP status, JSON-serializable body).
+        """
+        self.counters["requests"] += 1
+        fmt = query.get("format", "dimacs")
+        engine = query.get("engine", "auto")
+        if fmt not in FORMATS or engine not in ENGINES:
+            return 400, {"error": f"format must be one of {FORMATS} and engine one of {ENGINES}"}
+        try:
+            timeout = float(query.get("timeout", self.timeout))
+        except ValueError:
+            return 400, {"error": "timeout must be a number"}
+
+        if self._slots.locked():
+            self.counters["rejected"] += 1
+            return 503, {"error": "server busy, retry later"}
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        text_key = hashlib.sha256(f"{fmt}\0{text}".encode()).hexdigest()
+        parsed = self.formulas.get(text_key)
+        if parsed is None:
+            try:
+                parsed = await loop.run_in_executor(self.executor, prepare, text, fmt)
+            except (SyntaxError, ValueError) as e:
+                self.counters["errors"] += 1
+                return 400, {"error": f"cannot parse formula: {e}"}
+            self.formulas.put(text_key, parsed)
+        num_vars, clauses, mapping, key = parsed
+
+        # other requests may have filled the slots while this one was parsed
+        if self._slots.locked():
+            self.counters["rejected"] += 1
+            return 503, {"error": "server busy, retry later"}
+        # the slot is given back when the job is done (_finish_job), not when
+        # the request gives up on it, so abandoned jobs still count against max_pending
+        await self._slots.acquire()
+        self.pending += 1
+        closure = self.closures.get(key) if engine != "cdcl" else None
+        job = loop.run_in_executor(self.executor, solve, clauses, num_vars, engine, closure,
+                                   time.time() + timeout)
+        job.add_done_callback(lambda f: self._finish_job(key, f))
+        try:
+            result = await asyncio.wait_for(asyncio.shield(job), timeout)
+        except asyncio.TimeoutError:
+            self.counters["timeouts"] += 1
+            return 504, {"error": f"no answer within {timeout} seconds"}
+        except Exception as e:
+            self.counters["errors"] += 1
+            return 500, {"error": f"solver failed: {e!r}"}
+        if result.pop("timed_out"):
+            self.counters["timeouts"] += 1
+            return 504, {"error": f"no answer within {timeout} seconds"}
+
+        self.counters["solved"] += 1
+        result.pop("closure")
+        result["cached_closure"] = closure is not None
+        result["num_vars"] = num_vars
+        result["num_clauses"] = len(clauses)
+        result["time"] = time.perf_counter() - start
+        if mapping is not None and result["interpretation"] is not None:
+            values = {abs(l): l > 0 for l in result["interpretation"]}
+            result["assignment"] = {name: values[v] for name, v in mapping.items()}
+        return 200, result
+
+    def _release_slot(self):
+        self.pending -= 1
+        self._slots.release()
+
+    def _finish_job(self, key, future):
+        self._release_slot()
+        if future.cancelled() or future.exception() is not None:
+            return
+        closure = future.result()["closure"]
+        if closure is not None:
+            self.closures.put(key, closure)
+
+    def stats(self):
+        return {"workers": self.workers, "max_pending": self.max_pending, "pending": self.pending,
+                "formulas": self.formulas.info(), "closures": self.closures.info(),
+                **self.counters}
+
+
+async def serve(args):
+    server = SolverServer(workers=args.workers, max_pending=args.max_pending,
+                          timeout=args.timeout, cache_size=args.cache_size, read_timeout=args.read_timeout)
+    await server.start(host=args.host, port=args.port, path=args.socket)
+    where = args.socket if args.socket else f"http://{args.host}:{args.port}"
+    print(f"RES-SAT daemon listening on {where} with {server.workers} workers")
+    try:
+        await server.server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run RES-SAT as a long-lived solver service")
+    parser.add_argument("--host", default="127.0.0.1", help="Address to listen on")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port to listen on")
+    parser.add_argument("--socket", help="Listen on this Unix socket path instead of TCP")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of solver processes (default: CPU count)")
+    parser.add_argument("--max-pending", type=int, default=None,
+                        help="Requests admitted at once before answering 503 (default: 4 per worker)")
+    parser.add_argument("--timeout", type=float, default=60.0,
+                        help="Default per-request timeout in seconds")
+    parser.add_argument("--cache-size", type=int, default=128,
+                        help="Number of formulas and closures kept in memory")
+    parser.add_argument("--read-timeout", type=float, default=10.0,
+                        help="Seconds a client has to send its request line, headers and body")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
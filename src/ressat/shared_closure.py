@@ -0,0 +1,206 @@
+import struct
+import sys
+import threading
+from array import array
+
+# Block layout: a header (number of clauses, number of literals), then
+# num_clauses + 1 int64 offsets, then the int32 literals; clause i is
+# lits[offsets[i]:offsets[i + 1]].
+_HEADER = struct.Struct("qq")
+
+# worker side: closures already attached in this process, by block name
+_attached = {}
+_untracked_lock = threading.Lock()
+
+
+class SharedClosure:
+    """
+    A clause collection published once in shared memory.
+
+    Pickling a SharedClosure sends only the name of its block, so passing one
+    to a process pool costs nothing per task: each worker attaches to the
+    same pages zero-copy (once per process) and reads them through read-only
+    views. res_sat and validate_interpretation accept it like a ClauseArena;
+    iterating yields frozensets, `iter_clauses` plain tuples. A process keeps
+    its attachments until it exits or calls detach().
+
+    The process that publishes the closure owns the block and must call
+    unlink() (or use it as a context manager) when the workers are done.
+    """
+
+    def __init__(self, shm, owner):
+        self._shm = shm
+        self.owner = owner
+        self.name = shm.name
+        num_clauses, num_lits = _HEADER.unpack_from(shm.buf, 0)
+        start = _HEADER.size
+        end = start + 8 * (num_clauses + 1)
+        self.offsets = shm.buf[start:end].cast("q").toreadonly()
+        self.lits = shm.buf[end:end + 4 * num_lits].cast("i").toreadonly()
+        self._len = num_clauses
+
+    @classmethod
+    def publish(cls, clauses, name=None):
+        """
+        Copies `clauses` (any collection of clauses: a set of frozensets, a
+        ClauseArena, a DiskClauseStore, ...) into a new shared memory block.
+        """
+        # imported here: multiprocessing is slow to import and most runs are single-process
+        from multiprocessing import shared_memory
+        source = clauses.iter_clauses() if hasattr(clauses, "iter_clauses") else clauses
+        offsets, lits = [0], []
+        for clause in source:
+            lits.extend(sorted(clause))
+            offsets.append(len(lits))
+        size = _HEADER.size + 8 * len(offsets) + 4 * len(lits)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=max(size, 1))
+        _HEADER.pack_into(shm.buf, 0, len(offsets) - 1, len(lits))
+        start = _HEADER.size
+        end = start + 8 * len(offsets)
+        shm.buf[start:end].cast("q")[:] = _as_array("q", offsets)
+        shm.buf[end:end + 4 * len(lits)].cast("i")[:] = _as_array("i", lits)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """Maps the block published under `name`, read-only, without copying it."""
+        from multiprocessing import shared_memory
+        # only the owner should make the resource tracker clean the block up
+        if sys.version_info >= (3, 13):
+            shm = shared_memory.SharedMemory(name=name, track=False)
+        else:
+            shm = _attach_untracked(name)
+        return cls(shm, owner=False)
+
+    def __reduce__(self):
+        return _attach_cached, (self.name,)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        if self.owner:
+            self.unlink()
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        for clause in self.iter_clauses():
+            yield frozenset(clause)
+
+    def clause(self, i: int) -> tuple:
+        """Returns the literals of clause `i` as a sorted tuple."""
+        return tuple(self.lits[self.offsets[i]:self.offsets[i + 1]])
+
+    def iter_clauses(self):
+        """Iterates over the clauses as sorted tuples of literals."""
+        lits, offsets = self.lits, self.offsets
+        for i in range(self._len):
+            yield tuple(lits[offsets[i]:offsets[i + 1]])
+
+    def nbytes(self) -> int:
+        """Size of the shared block in bytes."""
+        return self._shm.size
+
+    def close(self):
+        """Unmaps the block in this process (the views must not be used afterwards)."""
+        _attached.pop(self.name, None)
+        self.offsets.release()
+        self.lits.release()
+        self._shm.close()
+
+    def unlink(self):
+        """Frees the block; only the publishing process should call this."""
+        self._shm.unlink()
+
+
+def _as_array(typecode, values):
+    return memoryview(array(typecode, values))
+
+
+def _attach_untracked(name):
+    """
+    SharedMemory(name=name, track=False) before Python 3.13.
+
+    Attaching registers the block with this process's resource tracker,
+    which unlinks it when the process exits. Unregistering it afterwards is
+    no better: spawned workers share the owner's tracker, so that would drop
+    the owner's registration too. The registration is skipped instead.
+    """
+    from multiprocessing import resource_tracker, shared_memory
+    with _untracked_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+def _attach_cached(name):
+    closure = _attached.get(name)
+    if closure is None:
+        closure = _attached[name] = SharedClosure.attach(name)
+    return closure
+
+
+def detach(name=None):
+    """
+    Closes the closure attached in this process under `name` by unpickling
+    (all of them if `name` is None); the next unpickling attaches again.
+    """
+    names = list(_attached) if name is None else [name]
+    for name in names:
+        closure = _attached.get(name)
+        if closure is not None:
+            closure.close()
+
+
+def _res_sat_worker(closure, num_vars, order):
+    from .res_sat import res_sat
+    return sorted(res_sat(closure, num_vars, order=order))
+
+
+def _validate_worker(clauses, interpretation):
+    from .validator import validate_interpretation
+    return validate_interpretation(clauses, set(interpretation))
+
+
+def _pool(processes):
+    from concurrent.futures import ProcessPoolExecutor
+    import multiprocessing
+    return ProcessPoolExecutor(max_workers=processes, mp_context=multiprocessing.get_context("spawn"))
+
+
+def evaluate_orders(closure, num_vars: int, orders, processes=None):
+    """
+    Runs res_sat on one published closure for every variable order in a
+    process pool.
+
+    Args:
+        closure: a SharedClosure (anything else is pickled into every task).
+        orders: iterable of variable orders, each a sequence of 1..num_vars.
+        processes: pool size (default: one per CPU).
+
+    Returns:
+        list: the interpretation (set of literals) found with each order.
+    """
+    orders = [list(order) for order in orders]
+    with _pool(processes) as executor:
+        return [set(T) for T in executor.map(_res_sat_worker, [closure] * len(orders), [num_vars] * len(orders),
+                                             orders)]
+
+
+def validate_many(clauses, interpretations, processes=None):
+    """
+    Checks several interpretations against one clause collection (e.g. a
+    SharedClosure of the input formula) in a process pool.
+
+    Returns:
+        list of bool, in the order of `interpretations`.
+    """
+    interpretations = [sorted(T) for T in interpretations]
+    with _pool(processes) as executor:
+        return list(executor.map(_validate_worker, [clauses] * len(interpretations), interpretations))
@@ -0,0 +1,52 @@
+class SolverStats(dict):
+    """
+    Counters collected by the resolvent generators and RES-SAT.
+
+    Pass an instance as the `stats` argument of generate_resolvents,
+    generate_resolvents_minimal and res_sat. Without it (stats=None) they run
+    their uninstrumented loops, so the counters cost nothing when disabled.
+
+    Keys (also readable as attributes):
+      - complete, iterations: how the saturation loop ended.
+      - truncated: a deadline stopped saturation or res_sat early, so the
+        closure is partial and undecided variables were set to true.
+      - pairs_examined, clashing_pairs, tautologies_skipped,
+        duplicates_rejected: the pairwise resolution loop (set-based clause
+        collections only; a ClauseArena or DiskClauseStore records the
+        timings and subsumption counts below).
+      - subsumed_removed, filter_minimal_time: clauses dropped by
+        filter_minimal and the seconds spent in it.
+      - iteration_times: seconds per saturation iteration.
+      - clauses_scanned: for res_sat, the number of clauses checked while
+        deciding each variable (index 0 is variable 1).
+
+    Being a dict, it serializes to JSON as is, and code that passes a plain
+    dict as `stats` keeps working.
+    """
+
+    def __init__(self, **values):
+        super().__init__(complete=False, truncated=False, iterations=0, pairs_examined=0, clashing_pairs=0,
+                         tautologies_skipped=0, duplicates_rejected=0, subsumed_removed=0,
+                         filter_minimal_time=0.0, iteration_times=[], clauses_scanned=[])
+        self.update(values)
+
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def counters(self):
+        """Returns the scalar entries, with clauses_scanned summed, e.g. for a CSV row."""
+        flat = {k: v for k, v in self.items() if not isinstance(v, list)}
+        flat["resolve_time"] = sum(self.get("iteration_times", ()))
+        flat["clauses_scanned"] = sum(self.get("clauses_scanned", ()))
+        return flat
+
+    def summary(self) -> str:
+        c = self.counters()
+        return (f"iterations={c['iterations']} complete={c['complete']} pairs={c['pairs_examined']} "
+                f"clashing={c['clashing_pairs']} tautologies={c['tautologies_skipped']} "
+                f"duplicates={c['duplicates_rejected']} subsumed={c['subsumed_removed']} "
+                f"resolve={c['resolve_time']:.4f}s filter_minimal={c['filter_minimal_time']:.4f}s "
+                f"res_sat_scanned={c['clauses_scanned']}")
@@ -0,0 +1,189 @@
+def _build_graph(clauses, num_vars: int):
+    """
+    Builds the colored graph of a CNF formula.
+
+    Vertex 2(v-1) is the literal v, vertex 2(v-1)+1 the literal -v, and every
+    clause gets one vertex after the literals. Each literal is linked to its
+    complement and to the clauses containing it. Positive literals, negative
+    literals and clauses get different colors, so every automorphism of the
+    graph maps variables to variables without flipping their sign.
+    """
+    num_vertices = 2 * num_vars + len(clauses)
+    adjacency = [[] for _ in range(num_vertices)]
+    colors = [0, 1] * num_vars + [2] * len(clauses)
+    for v in range(num_vars):
+        adjacency[2 * v].append(2 * v + 1)
+        adjacency[2 * v + 1].append(2 * v)
+    for c, clause in enumerate(clauses, 2 * num_vars):
+        for l in clause:
+            vertex = 2 * (l - 1) if l > 0 else 2 * (-l - 1) + 1
+            adjacency[c].append(vertex)
+            adjacency[vertex].append(c)
+    return adjacency, colors
+
+
+def _refine(colors, adjacency):
+    """
+    Refines a vertex coloring until it is equitable.
+
+    New colors are numbered by sorting the distinct (color, neighbor colors)
+    signatures, so two colorings of the same graph that are related by an
+    automorphism are refined to colorings that are related by the same automorphism.
+    """
+    num_colors = len(set(colors))
+    while True:
+        signatures = [(colors[v], tuple(sorted(colors[u] for u in adjacency[v])))
+                      for v in range(len(colors))]
+        labels = {sig: i for i, sig in enumerate(sorted(set(signatures)))}
+        colors = [labels[sig] for sig in signatures]
+        if len(labels) == num_colors:
+            return colors
+        num_colors = len(labels)
+
+
+def _cells(colors):
+    """
+    Returns a dict mapping each color to the sorted list of vertices with that color.
+    """
+    cells = {}
+    for v, c in enumerate(colors):
+        cells.setdefault(c, []).append(v)
+    return cells
+
+
+def _individualize(colors, vertex):
+    """
+    Gives `vertex` a fresh color of its own.
+    """
+    colors = list(colors)
+    colors[vertex] = max(colors) + 1
+    return colors
+
+
+def _match(left, right, adjacency):
+    """
+    Tries to extend the partial correspondence between two colorings to a
+    discrete one, always pairing a vertex with itself when possible.
+
+    Returns:
+        list or None: the vertex permutation (left vertex -> right vertex), or
+        None if the colorings stop being compatible.
+    """
+    while True:
+        left = _refine(left, adjacency)
+        right = _refine(right, adjacency)
+        left_cells, right_cells = _cells(left), _cells(right)
+        if {c: len(vs) for c, vs in left_cells.items()} != {c: len(vs) for c, vs in right_cells.items()}:
+            return None
+        open_cells = [c for c, vs in left_cells.items() if len(vs) > 1]
+        if not open_cells:
+            perm = [0] * len(left)
+            for c, vs in left_cells.items():
+                perm[vs[0]] = right_cells[c][0]
+            return perm
+        cell = min(open_cells)
+        a = left_cells[cell][0]
+        b = a if a in right_cells[cell] else right_cells[cell][0]
+        left = _individualize(left, a)
+        right = _individualize(right, b)
+
+
+def find_symmetries(clauses, num_vars: int, max_generators=50):
+    """
+    Searches for variable permutations that map the clause set onto itself.
+
+    The CNF is turned into a colored graph which is refined to an equitable
+    partition. For every variable a in a non-trivial cell and every other b in
+    the same cell, a is individualized on one side and b on the other and the
+    two colorings are refined in lockstep until they are discrete. The
+    resulting permutation is kept if it really preserves the clause set.
+
+    Args:
+        clauses (iterable of frozenset): the clauses of the formula.
+        num_vars (int): number of atoms.
+        max_generators (int): stop after this many distinct symmetries.
+
+    Returns:
+        list of dict: each symmetry maps every moved variable to its image.
+    """
+    clauses = list(clauses)
+    clause_set = set(clauses)
+    adjacency, colors = _build_graph(clauses, num_vars)
+    colors = _refine(colors, adjacency)
+
+    # Atoms that occur in no clause are trivially interchangeable; breaking
+    # those symmetries adds clauses without helping resolution.
+    occurring = {abs(l) for clause in clauses for l in clause}
+    symmetries = []
+    seen = set()
+    for cell in _cells(colors[:2 * num_vars]).values():
+        variables = [u // 2 + 1 for u in cell if u % 2 == 0 and u // 2 + 1 in occurring]
+        for a in variables[:1]:
+            for b in variables[1:]:
+                perm = _match(_individualize(colors, 2 * (a - 1)),
+                              _individualize(colors, 2 * (b - 1)), adjacency)
+                if perm is None:
+                    continue
+                sigma = {v: perm[2 * (v - 1)] // 2 + 1 for v in range(1, num_vars + 1)
+                         if perm[2 * (v - 1)] // 2 + 1 != v}
+                key = tuple(sorted(sigma.items()))
+                if not sigma or key in seen:
+                    continue
+                image = {frozenset(sigma.get(l, l) if l > 0 else -sigma.get(-l, -l) for l in clause)
+                         for clause in clause_set}
+                if image != clause_set:
+                    continue
+                seen.add(key)
+                symmetries.append(sigma)
+                if len(symmetries) >= max_generators:
+                    return symmetries
+    return symmetries
+
+
+def lex_leader_clauses(symmetries, num_vars: int, max_prefix=1):
+    """
+    Encodes lex-leader symmetry-breaking constraints x <=lex sigma(x).
+
+    Variables are compared in the order RES-SAT decides them (1..num_vars),
+    with false < true. Only the first `max_prefix` moved variables of each
+    symmetry are constrained; comparing one position needs a single binary
+    clause, every further position introduces one auxiliary variable
+    (numbered after num_vars) meaning "the prefix so far is equal".
+
+    Returns:
+        clauses (list of frozenset): the symmetry-breaking clauses.
+        num_vars (int): the number of atoms including the auxiliary ones.
+    """
+    clauses = []
+    for sigma in symmetries:
+        support = sorted(sigma)[:max_prefix]
+        equal = None  # auxiliary variable for "all earlier positions are equal"
+        for j, x in enumerate(support):
+            y = sigma[x]
+            guard = [] if equal is None else [-equal]
+            # prefix equal -> x <= sigma(x)
+            clauses.append(frozenset(guard + [-x, y]))
+            if j == len(support) - 1:
+                break
+            num_vars += 1
+            # prefix equal and x == sigma(x) -> new prefix equal
+            clauses.append(frozenset(guard + [x, y, num_vars]))
+            clauses.append(frozenset(guard + [-x, -y, num_vars]))
+            equal = num_vars
+    return clauses, num_vars
+
+
+def break_symmetries(clauses, num_vars: int, max_generators=50, max_prefix=1):
+    """
+    Adds lex-leader symmetry-breaking clauses to a formula.
+
+    Returns:
+        clauses (list of frozenset): the original clauses followed by the new ones.
+        num_vars (int): the number of atoms including auxiliary ones.
+        num_symmetries (int): how many symmetries were found.
+    """
+    clauses = list(clauses)
+    symmetries = find_symmetries(clauses, num_vars, max_generators=max_generators)
+    extra, new_num_vars = lex_leader_clauses(symmetries, num_vars, max_prefix=max_prefix)
+    existing = set(clauses)
+    return clauses + [c for c in dict.fromkeys(extra) if c not in existing], new_num_vars, len(symmetries)
@@ -0,0 +1,194 @@
+# trial.py
+import argparse
+import json
+import os
+import queue
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .cnf_parser import parse_cnf
+from .resolvent_generator import generate_resolvents_minimal, generate_resolvents
+from .res_sat import res_sat
+from .validator import validate_interpretation
+from .solver_stats import SolverStats
+from .profiling import PhaseProfiler
+from .utils import module_command
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+PHASES = ["parse", "resolvent", "res_sat", "validation"]
+
+
+def _max_rss_mb():
+    """Peak resident set size of this process so far, in MB (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def measure_trial(cnf_file, use_minimal=True, profile_dir=None, collect_stats=False):
+    """
+    Runs parse -> resolve -> RES-SAT -> validate once in this process.
+
+    If `profile_dir` is given, every phase is also profiled (see
+    PhaseProfiler) and the profiles are written there; timings then include
+    the profiler's overhead.
+
+    Every phase is measured in wall time (perf_counter) and CPU time
+    (process_time). Memory is the process's peak RSS (ru_maxrss), read once
+    before parsing and once at the end; it is only meaningful in a fresh
+    process, which is what run_isolated provides.
+
+    The measured run does not pass a SolverStats: counting sends resolution
+    through its instrumented loop, which is not the code users run. With
+    `collect_stats`, resolution and RES-SAT are run a second time, after
+    the measurements, to collect the counters.
+
+    Returns:
+        dict: "<phase>_time" and "<phase>_cpu" for every phase, "total_time",
+        "total_cpu", "baseline_rss", "peak_rss", "memory_used" (MB), clause
+        counts, "valid" and (with `collect_stats`) the SolverStats counters
+        as "stats_*".
+    """
+    baseline_rss = _max_rss_mb()
+    profiler = PhaseProfiler(profile_dir, enabled=profile_dir is not None)
+    result = {"file": os.path.basename(cnf_file), "method": "minimal" if use_minimal else "standard"}
+
+    def phase(name, function, *args, **kwargs):
+        wall, cpu = time.perf_counter(), time.process_time()
+        value = profiler.call(name, function, *args, **kwargs)
+        result[f"{name}_time"] = time.perf_counter() - wall
+        result[f"{name}_cpu"] = time.process_time() - cpu
+        return value
+
+    num_vars, clauses, _ = phase("parse", parse_cnf, cnf_file)
+    generate = generate_resolvents_minimal if use_minimal else generate_resolvents
+    R = phase("resolvent", generate, clauses, verbose=False)
+    interpretation = phase("res_sat", res_sat, R, num_vars)
+    valid = phase("validation", validate_interpretation, clauses, interpretation)
+    peak_rss = _max_rss_mb()
+    profiler.write(verbose=False)
+
+    if collect_stats:
+        stats = SolverStats()
+        res_sat(generate(clauses, verbose=False, stats=stats), num_vars, stats=stats)
+        result.update({f"stats_{k}": v for k, v in stats.counters().items()})
+
+    result.update({
+        "num_vars": num_vars,
+        "num_clauses_orig": len(clauses),
+        "num_clauses_res": len(R),
+        "total_time": sum(result[f"{p}_time"] for p in PHASES),
+        "total_cpu": sum(result[f"{p}_cpu"] for p in PHASES),
+        "baseline_rss": baseline_rss,
+        "peak_rss": peak_rss,
+        "memory_used": peak_rss - baseline_rss if peak_rss is not None else None,
+        "valid": valid,
+    })
+    return result
+
+
+def run_isolated(cnf_file, use_minimal=True, profile_dir=None, cpu=None, timeout=None, collect_stats=False):
+    """
+    Runs measure_trial in a fresh Python process, optionally pinned to one CPU.
+
+    A fresh process means peak RSS covers only this trial and no allocator
+    or cache state is inherited from earlier runs. The CPU is passed on the
+    command line and the child pins itself: run_trials calls this from
+    threads, where a preexec_fn could deadlock the child between fork and
+    exec.
+
+    Args:
+        profile_dir: if given, the child profiles its phases into this directory.
+        collect_stats: also collect the SolverStats counters (see measure_trial).
+        cpu: CPU number to pin the child to (Linux only; ignored elsewhere).
+        timeout: seconds before the child is killed (subprocess.TimeoutExpired).
+
+    Returns:
+        dict: the result of measure_trial, plus "cpu" and (where the platform
+        reports it) "affinity", the CPUs the child actually ran on.
+    """
+    command, env = module_command(__spec__.name)
+    command.append(cnf_file)
+    if not use_minimal:
+        command.append("--standard")
+    if profile_dir is not None:
+        command += ["--profile", profile_dir]
+    if cpu is not None:
+        command += ["--cpu", str(cpu)]
+    if collect_stats:
+        command.append("--stats")
+    completed = subprocess.run(command, capture_output=True, text=True, timeout=timeout, check=False, env=env)
+    if completed.returncode != 0:
+        raise RuntimeError(f"trial for {cnf_file} failed:\n{completed.stderr}")
+    result = json.loads(completed.stdout.splitlines()[-1])
+    result["cpu"] = cpu
+    return result
+
+
+def available_cpus():
+    """The CPUs this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def run_trials(trials, jobs=1, pin=True, timeout=None, collect_stats=False):
+    """
+    Runs many isolated trials, up to `jobs` at a time.
+
+    Each running trial gets a CPU of its own from available_cpus() (when
+    `pin` is set) so concurrent trials do not compete for a core; `jobs` is
+    capped at the number of CPUs for the same reason.
+
+    Args:
+        trials: list of (cnf_file, use_minimal) or (cnf_file, use_minimal,
+                profile_dir) tuples.
+
+    Returns:
+        list of dict: results in the order of `trials`.
+    """
+    cpus = available_cpus()
+    jobs = max(1, min(jobs, len(cpus)))
+    free = queue.Queue()
+    for cpu in cpus[:jobs]:
+        free.put(cpu)
+
+    def run(trial):
+        cpu = free.get()
+        try:
+            return run_isolated(*trial, cpu=cpu if pin else None, timeout=timeout, collect_stats=collect_stats)
+        finally:
+            free.put(cpu)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(run, trials))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure one RES-SAT trial and print it as JSON")
+    parser.add_argument("cnf_file", help="Path to the CNF file (DIMACS format)")
+    parser.add_argument("--standard", action="store_true",
+                        help="Use standard resolvent generation (default: minimal)")
+    parser.add_argument("--profile", metavar="DIR", help="Profile each phase into DIR")
+    parser.add_argument("--cpu", type=int, help="Pin this process to CPU N first (Linux only; ignored elsewhere)")
+    parser.add_argument("--stats", action="store_true",
+                        help="Also collect the solver counters, in a second, unmeasured run")
+    args = parser.parse_args()
+    if args.cpu is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {args.cpu})
+    result = measure_trial(args.cnf_file, use_minimal=not args.standard, profile_dir=args.profile,
+                           collect_stats=args.stats)
+    if hasattr(os, "sched_getaffinity"):
+        result["affinity"] = sorted(os.sched_getaffinity(0))
+    print(json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
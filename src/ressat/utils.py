@@ -0,0 +1,33 @@
+import os
+import sys
+
+def complement(literal: int) -> int:
+    """
+    Returns the complement of a literal.
+    If literal is positive, returns its negative and vice versa.
+    """
+    return -literal
+
+def complement_clause(clause: set) -> set:
+    """
+    Returns the set of complementary literals for a given clause.
+    """
+    return {complement(l) for l in clause}
+
+def is_tautology(clause) -> bool:
+    """
+    Returns True if the clause contains some literal together with its complement.
+    """
+    return any(complement(l) in clause for l in clause)
+
+def module_command(module: str):
+    """
+    Returns the command line and environment that run `python -m module`, a
+    module of this package, in a fresh interpreter. The directory this
+    package was imported from goes first on PYTHONPATH, so the child runs
+    the same code as its parent whether the package is installed or not.
+    """
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    path = os.environ.get("PYTHONPATH")
+    env = dict(os.environ, PYTHONPATH=root + os.pathsep + path if path else root)
+    return [sys.executable, "-m", module], env
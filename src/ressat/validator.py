@@ -0,0 +1,42 @@
+from .clause_arena import ClauseArena
+from .shared_closure import SharedClosure
+from .cancellation import as_token
+
+# clauses checked between two looks at the deadline (the first block is always checked)
+CHECK_EVERY = 1024
+
+
+def validate_interpretation(clauses, interpretation, deadline=None):
+    """
+    Check whether the given interpretation satisfies the CNF formula.
+
+    Args:
+        clauses (iterable of frozenset): Each clause is a frozenset of integers (literals),
+                                         or a ClauseArena / SharedClosure.
+        interpretation (set of int): A set of literals representing the assignment. 
+                                     For each variable p, exactly one of p or -p should be in this set.
+
+    Returns:
+        bool: True if every clause is satisfied (i.e., has at least one literal in the interpretation), 
+              False otherwise.
+        None: if `deadline` (seconds or a CancellationToken) was cancelled
+              before every clause was checked and no falsified clause was found.
+    """
+    deadline = as_token(deadline)
+    if deadline is not None:
+        interpretation = set(interpretation)
+        iterator = clauses.iter_clauses() if isinstance(clauses, (ClauseArena, SharedClosure)) else clauses
+        for checked, clause in enumerate(iterator):
+            if checked and checked % CHECK_EVERY == 0 and deadline.cancelled:
+                return None
+            if interpretation.isdisjoint(clause):
+                return False
+        return True
+    if isinstance(clauses, (ClauseArena, SharedClosure)):
+        interpretation = set(interpretation)
+        return not any(interpretation.isdisjoint(clause) for clause in clauses.iter_clauses())
+    for clause in clauses:
+        # A clause is satisfied if it has a non-empty intersection with the interpretation.
+        if clause.isdisjoint(interpretation):
+            return False
+    return True
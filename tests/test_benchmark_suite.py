@@ -0,0 +1,62 @@
+import unittest
+from ressat.generators import random_ksat, pigeonhole, aim_like
+import os
+from ressat.benchmark_suite import mann_whitney_u, run_suite, run_files, compare_to_baseline, compare_methods, compare_ordered
+from ressat.cdcl import cdcl_sat
+
+class TestBenchmarkSuite(unittest.TestCase):
+    def test_generators(self):
+        num_vars, clauses = random_ksat(20, 4.26, seed=1)
+        self.assertEqual((num_vars, len(clauses)), (20, 85))
+        self.assertTrue(all(len(c) == 3 for c in clauses))
+        self.assertEqual(random_ksat(20, 4.26, seed=1), (num_vars, clauses))
+
+        num_vars, clauses = pigeonhole(3)
+        self.assertEqual((num_vars, len(clauses)), (12, 4 + 3 * 6))
+        self.assertIsNone(cdcl_sat(clauses, num_vars))
+
+        num_vars, clauses = aim_like(30, 2.0, seed=2)
+        self.assertIsNotNone(cdcl_sat(clauses, num_vars))
+        num_vars, clauses = aim_like(30, 2.0, satisfiable=False, seed=2)
+        self.assertIsNone(cdcl_sat(clauses, num_vars))
+
+    def test_mann_whitney(self):
+        # Exact two-sided p-value for complete separation of 5 vs 5 samples is 2 / C(10, 5).
+        u, p = mann_whitney_u([1, 2, 3, 4, 5], [6, 7, 8, 9, 10])
+        self.assertEqual(u, 0)
+        self.assertAlmostEqual(p, 2 / 252)
+        self.assertEqual(mann_whitney_u([1, 2, 3], [1, 2, 3])[1], 1.0)
+
+    def test_regression_detection(self):
+        baseline = run_suite(["php"], {"php": [2]}, repeats=5, verbose=False)
+        self.assertEqual([r["method"] for r in baseline], ["minimal", "standard"])
+        self.assertTrue(all(r["valid"] is False for r in baseline))
+        self.assertEqual(len(compare_methods(baseline)), 1)
+
+        slower = [dict(r, total=[t * 10 + 1 for t in r["total"]]) for r in baseline]
+        regressions = compare_to_baseline(slower, baseline)
+        self.assertEqual({r["metric"] for r in regressions}, {"total"})
+        self.assertEqual(compare_to_baseline(baseline, baseline), [])
+
+        # only growth counts, and memory needs a significant difference too
+        changed = [dict(r, closure_size=r["closure_size"] - 1, peak_memory=[m * 2 for m in r["peak_memory"]])
+                   for r in baseline]
+        self.assertEqual({r["metric"] for r in compare_to_baseline(changed, baseline)}, {"peak_memory"})
+        self.assertEqual({r["metric"] for r in compare_to_baseline(baseline, changed)}, {"closure_size"})
+        noisy = [dict(r, peak_memory=r["peak_memory"][:1] * 4 + [r["peak_memory"][0] * 2]) for r in baseline]
+        self.assertEqual(compare_to_baseline(noisy, baseline), [])
+
+    def test_ordered_comparison(self):
+        results = run_suite(["random"], {"random": [8]}, ["standard", "ordered"], repeats=1, verbose=False)
+        rows = compare_ordered(results)
+        self.assertEqual(len(rows), 1)
+        self.assertLess(rows[0]["steps"], rows[0]["unrestricted_steps"])
+
+        data = os.path.join(os.path.dirname(__file__), "..", "data", "AIM")
+        cnf_file = os.path.join(data, sorted(os.listdir(data))[0])
+        results = run_files([cnf_file], ["minimal", "ordered-minimal"], repeats=1, verbose=False)
+        self.assertEqual([r["family"] for r in results], ["aim", "aim"])
+        self.assertEqual(compare_ordered(results)[0]["size"], os.path.basename(cnf_file))
+
+if __name__ == '__main__':
+    unittest.main()
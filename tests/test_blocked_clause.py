@@ -0,0 +1,24 @@
+import unittest
+from ressat.blocked_clause import eliminate_blocked_clauses, reconstruct_interpretation
+from ressat.validator import validate_interpretation
+
+class TestBlockedClause(unittest.TestCase):
+    def test_blocked_clauses_removed_and_model_reconstructed(self):
+        # (p ∨ q), (¬p ∨ ¬q), (q ∨ r): every clause is blocked
+        clauses = [frozenset({1, 2}), frozenset({-1, -2}), frozenset({2, 3})]
+        remaining, stack = eliminate_blocked_clauses(clauses)
+        self.assertEqual(remaining, [])
+        self.assertEqual(len(stack), 3)
+        # Start from an interpretation that falsifies the original clauses.
+        interpretation = reconstruct_interpretation({-1, -2, -3}, stack)
+        self.assertTrue(validate_interpretation(clauses, interpretation))
+
+    def test_non_blocked_clauses_kept(self):
+        # p, ¬p ∨ q, ¬q: no clause is blocked (the formula is unsatisfiable)
+        clauses = [frozenset({1}), frozenset({-1, 2}), frozenset({-2})]
+        remaining, stack = eliminate_blocked_clauses(clauses)
+        self.assertEqual(remaining, clauses)
+        self.assertEqual(stack, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+import asyncio
+import os
+import tempfile
+import threading
+import unittest
+from ressat.cancellation import CancellationToken, as_token
+from ressat.checkpoint import Checkpoint
+from ressat.clause_arena import ClauseArena
+from ressat.resolvent_generator import generate_resolvents_minimal, generate_resolvents
+from ressat.res_sat import res_sat, solve_anytime
+from ressat.cdcl import cdcl_sat
+from ressat.disk_store import DiskClauseStore
+from ressat.solver_stats import SolverStats
+from ressat.validator import validate_interpretation
+from ressat.generators import random_ksat, pigeonhole
+
+
+class _CountdownToken:
+    """Becomes cancelled after `polls` looks, so the cut-off point is deterministic."""
+
+    def __init__(self, polls):
+        self.polls = polls
+
+    @property
+    def cancelled(self):
+        self.polls -= 1
+        return self.polls < 0
+
+
+class _SlowClauses(list):
+    """A clause list whose iteration calls `on_clause` first, to cancel mid-run."""
+
+    def __init__(self, clauses, on_clause):
+        super().__init__(clauses)
+        self.on_clause = on_clause
+
+    def __iter__(self):
+        for clause in super().__iter__():
+            self.on_clause()
+            yield clause
+
+
+class TestCancellationToken(unittest.TestCase):
+    def test_budget_and_cancel(self):
+        self.assertFalse(CancellationToken().cancelled)
+        self.assertIsNone(CancellationToken().remaining())
+        self.assertTrue(CancellationToken(time_budget=0).cancelled)
+        token = CancellationToken(time_budget=60)
+        self.assertGreater(token.remaining(), 0)
+        token.cancel()
+        self.assertTrue(token.cancelled)
+        self.assertEqual(token.remaining(), 0.0)
+
+    def test_as_token(self):
+        self.assertIsNone(as_token(None))
+        token = CancellationToken()
+        self.assertIs(as_token(token), token)
+        self.assertTrue(as_token(0).cancelled)
+
+
+class TestAnytimeResolution(unittest.TestCase):
+    def setUp(self):
+        self.num_vars, self.clauses = random_ksat(10, 4.26, seed=5)
+
+    def test_no_deadline_is_unchanged(self):
+        expected = generate_resolvents_minimal(self.clauses, verbose=False)
+        stats = SolverStats()
+        self.assertEqual(generate_resolvents_minimal(self.clauses, verbose=False, stats=stats,
+                                                     deadline=CancellationToken()), expected)
+        self.assertFalse(stats.truncated)
+        self.assertEqual(res_sat(expected, self.num_vars, deadline=CancellationToken()),
+                         res_sat(expected, self.num_vars))
+
+    def test_truncated_closure_is_partial_and_sound(self):
+        full = generate_resolvents(self.clauses, verbose=False)
+        for stats in (None, SolverStats()):
+            R = generate_resolvents(self.clauses, verbose=False, stats=stats, deadline=_CountdownToken(20))
+            self.assertTrue(set(self.clauses) <= R < full)
+            if stats is not None:
+                self.assertTrue(stats.truncated)
+                self.assertFalse(stats.complete)
+
+    def test_expired_budget_returns_input(self):
+        stats = SolverStats()
+        R = generate_resolvents_minimal(self.clauses, verbose=False, stats=stats, deadline=0)
+        self.assertEqual(R, set(self.clauses))
+        self.assertTrue(stats.truncated)
+        self.assertEqual(stats.iterations, 0)
+
+    def test_arena_stops(self):
+        stats = SolverStats()
+        R = generate_resolvents_minimal(ClauseArena(self.clauses), verbose=False, stats=stats,
+                                        deadline=_CountdownToken(5))
+        self.assertTrue(stats.truncated)
+        self.assertEqual(stats.iterations, 1)
+        self.assertGreater(len(R), 0)
+
+    def test_truncated_run_resumes_from_checkpoint(self):
+        expected = generate_resolvents_minimal(self.clauses, verbose=False)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "run.ckpt.gz")
+            stats = SolverStats()
+            generate_resolvents_minimal(self.clauses, verbose=False, stats=stats, checkpoint=Checkpoint(path),
+                                        deadline=_CountdownToken(30))
+            self.assertTrue(stats.truncated)
+            resumed = generate_resolvents_minimal(self.clauses, verbose=False,
+                                                  checkpoint=Checkpoint(path, resume=True))
+        self.assertEqual(resumed, expected)
+
+    def test_res_sat_fills_undecided_variables(self):
+        R = generate_resolvents_minimal(self.clauses, verbose=False)
+        stats = SolverStats()
+        T = res_sat(R, self.num_vars, stats=stats, deadline=_CountdownToken(3))
+        self.assertTrue(stats.truncated)
+        self.assertEqual(sorted(abs(l) for l in T), list(range(1, self.num_vars + 1)))
+        self.assertTrue(set(range(4, self.num_vars + 1)) <= T)
+
+
+class TestAnytimeCDCL(unittest.TestCase):
+    def test_cdcl_gives_up(self):
+        num_vars, clauses = pigeonhole(6)
+        stats = {}
+        self.assertIsNone(cdcl_sat(clauses, num_vars, deadline=_CountdownToken(10), stats=stats))
+        self.assertTrue(stats["truncated"])
+        self.assertIsNone(cdcl_sat(clauses, num_vars, deadline=CancellationToken(), stats=stats))
+        self.assertFalse(stats["truncated"])
+
+    def test_disk_filter_stops(self):
+        num_vars, clauses = random_ksat(8, 4.26, seed=5)
+        with DiskClauseStore() as store:
+            store.update(clauses)
+            stats = SolverStats()
+            generate_resolvents_minimal(store, verbose=False, stats=stats, deadline=_CountdownToken(12))
+            self.assertTrue(stats.truncated)
+
+
+class TestCancellationFromOutside(unittest.TestCase):
+    def setUp(self):
+        self.num_vars, self.clauses = random_ksat(10, 4.26, seed=6)
+
+    def test_cancel_from_another_thread(self):
+        token = CancellationToken()
+        started = threading.Event()
+        clauses = _SlowClauses(self.clauses, started.set)
+        timer = threading.Thread(target=lambda: started.wait() and token.cancel())
+        timer.start()
+        stats = SolverStats()
+        generate_resolvents(clauses, max_iterations=50, max_resolvents=10 ** 9, verbose=False, stats=stats,
+                            deadline=token)
+        timer.join()
+        self.assertTrue(stats.truncated)
+
+    def test_cancel_from_asyncio(self):
+        async def solve_with_timeout():
+            token = CancellationToken()
+            task = asyncio.ensure_future(asyncio.to_thread(
+                solve_anytime, self.clauses, self.num_vars, token, False, 50, 10 ** 9))
+            try:
+                return await asyncio.wait_for(asyncio.shield(task), timeout=0.05)
+            except asyncio.TimeoutError:
+                token.cancel()
+                return await task
+
+        if not hasattr(asyncio, "to_thread"):
+            self.skipTest("asyncio.to_thread needs Python 3.9")
+        result = asyncio.run(solve_with_timeout())
+        self.assertTrue(result["truncated"])
+        self.assertEqual(len(result["interpretation"]), self.num_vars)
+
+
+class TestAnytimeValidation(unittest.TestCase):
+    def test_cancelled_validation_returns_none(self):
+        clauses = [frozenset({i}) for i in range(1, 3000)]
+        self.assertIsNone(validate_interpretation(clauses, set(range(1, 3000)), deadline=0))
+        self.assertTrue(validate_interpretation(clauses, set(range(1, 3000)), deadline=CancellationToken()))
+        # a falsified clause in the first block is still reported
+        self.assertFalse(validate_interpretation(clauses, {-1}, deadline=0))
+
+    def test_solve_anytime_without_deadline(self):
+        num_vars, clauses = random_ksat(8, 3.0, seed=1)
+        result = solve_anytime(clauses, num_vars)
+        self.assertFalse(result["truncated"])
+        self.assertEqual(result["valid"], validate_interpretation(clauses, result["interpretation"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import itertools
+import random
+import unittest
+from ressat.cdcl import cdcl_sat, _luby
+from ressat.validator import validate_interpretation
+
+def brute_force_sat(clauses, num_vars):
+    for bits in itertools.product([False, True], repeat=num_vars):
+        if all(any(bits[abs(l) - 1] == (l > 0) for l in clause) for clause in clauses):
+            return True
+    return False
+
+class TestCDCL(unittest.TestCase):
+    def test_luby(self):
+        self.assertEqual([_luby(i) for i in range(1, 16)], [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8])
+
+    def test_random_formulas_match_brute_force(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            num_vars = rng.randint(1, 8)
+            clauses = [frozenset(rng.choice([v, -v]) for v in rng.sample(range(1, num_vars + 1), min(3, num_vars)))
+                       for _ in range(rng.randint(1, 40))]
+            interpretation = cdcl_sat(clauses, num_vars)
+            if brute_force_sat(clauses, num_vars):
+                self.assertIsNotNone(interpretation)
+                self.assertEqual({abs(l) for l in interpretation}, set(range(1, num_vars + 1)))
+                self.assertTrue(validate_interpretation(clauses, interpretation))
+            else:
+                self.assertIsNone(interpretation)
+
+    def test_pigeonhole_unsat(self):
+        # 4 pigeons, 3 holes: variable 3*(p-1)+h means pigeon p sits in hole h.
+        var = lambda p, h: 3 * (p - 1) + h
+        clauses = [frozenset(var(p, h) for h in range(1, 4)) for p in range(1, 5)]
+        clauses += [frozenset({-var(p, h), -var(q, h)})
+                    for h in range(1, 4) for p in range(1, 5) for q in range(p + 1, 5)]
+        self.assertIsNone(cdcl_sat(clauses, 12))
+
+    def test_empty_clause(self):
+        self.assertIsNone(cdcl_sat([frozenset({1}), frozenset()], 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import os
+import tempfile
+import unittest
+from ressat.checkpoint import Checkpoint, encode_clauses, decode_clauses
+from ressat.clause_arena import ClauseArena
+from ressat.resolvent_generator import generate_resolvents_minimal, generate_resolvents
+from ressat.solver_stats import SolverStats
+from ressat.generators import random_ksat
+
+
+class _CrashingCheckpoint(Checkpoint):
+    """Simulates a crash right after the n-th save."""
+
+    def __init__(self, path, crash_after, **kwargs):
+        super().__init__(path, **kwargs)
+        self.crash_after = crash_after
+
+    def save(self, state):
+        super().save(state)
+        self.crash_after -= 1
+        if self.crash_after == 0:
+            raise KeyboardInterrupt
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "run.ckpt.gz")
+        self.num_vars, self.clauses = random_ksat(8, 4.26, seed=4)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_encode_round_trip(self):
+        clauses = [frozenset({1, -2}), frozenset(), frozenset({3})]
+        self.assertEqual(decode_clauses(encode_clauses(clauses)), clauses)
+
+    def test_resume_after_iteration_boundary(self):
+        for generate in (generate_resolvents_minimal, generate_resolvents):
+            full_stats = SolverStats()
+            full = generate(self.clauses, max_iterations=2, verbose=False, stats=full_stats)
+            generate(self.clauses, max_iterations=1, verbose=False, stats=SolverStats(),
+                     checkpoint=Checkpoint(self.path))
+            stats = SolverStats()
+            resumed = generate(self.clauses, max_iterations=2, verbose=False, stats=stats,
+                               checkpoint=Checkpoint(self.path, resume=True))
+            self.assertEqual(resumed, full)
+            self.assertEqual((stats.iterations, stats.complete), (full_stats.iterations, full_stats.complete))
+            self.assertEqual(stats.pairs_examined, full_stats.pairs_examined)
+
+    def test_resume_inside_an_iteration(self):
+        full = generate_resolvents_minimal(self.clauses, max_iterations=2, verbose=False)
+        crashing = _CrashingCheckpoint(self.path, crash_after=40, interval=0)
+        with self.assertRaises(KeyboardInterrupt):
+            generate_resolvents_minimal(self.clauses, max_iterations=2, verbose=False, checkpoint=crashing)
+        self.assertIsNotNone(Checkpoint(self.path, resume=True).load()["row"])
+        resumed = generate_resolvents_minimal(self.clauses, max_iterations=2, verbose=False,
+                                              checkpoint=Checkpoint(self.path, resume=True))
+        self.assertEqual(resumed, full)
+
+    def test_failed_write_keeps_previous_checkpoint(self):
+        checkpoint = Checkpoint(self.path, resume=True)
+        checkpoint.save({"iteration": 1})
+        with self.assertRaises(TypeError):
+            checkpoint.save({"iteration": object()})
+        self.assertEqual(checkpoint.load()["iteration"], 1)
+        self.assertEqual(os.listdir(self.directory.name), ["run.ckpt.gz"])
+
+    def test_rejects_other_inputs(self):
+        generate_resolvents_minimal(self.clauses, max_iterations=1, verbose=False, checkpoint=Checkpoint(self.path))
+        _, other = random_ksat(8, 4.26, seed=5)
+        with self.assertRaises(ValueError):
+            generate_resolvents_minimal(other, verbose=False, checkpoint=Checkpoint(self.path, resume=True))
+        with self.assertRaises(ValueError):
+            generate_resolvents(self.clauses, verbose=False, checkpoint=Checkpoint(self.path, resume=True))
+        with self.assertRaises(ValueError):
+            generate_resolvents(ClauseArena(self.clauses), verbose=False, checkpoint=Checkpoint(self.path))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import contextlib
+import io
+import unittest
+from ressat.clause_arena import ClauseArena
+from ressat.disk_store import DiskClauseStore
+from ressat.resolvent_generator import generate_resolvents_minimal, generate_resolvents, filter_minimal
+from ressat.res_sat import res_sat
+from ressat.validator import validate_interpretation
+
+class TestClauseArena(unittest.TestCase):
+    def test_dedup_tombstones_and_compaction(self):
+        arena = ClauseArena([frozenset({1, -2}), frozenset({-2, 1}), frozenset({3})])
+        self.assertEqual(len(arena), 2)
+        cid = arena.find({3})
+        arena.remove(cid)
+        self.assertNotIn(frozenset({3}), arena)
+        self.assertEqual(arena.num_dead, 1)
+        arena.compact()
+        self.assertEqual(arena.num_dead, 0)
+        self.assertEqual(list(arena.iter_clauses()), [(-2, 1)])
+
+    def test_pipeline_matches_set_version(self):
+        clauses = [frozenset({1, 2}), frozenset({-1, 3}), frozenset({-2, 3}), frozenset({-3, 4}), frozenset({1, 2, 4})]
+        R = generate_resolvents_minimal(clauses, verbose=False)
+        A = generate_resolvents_minimal(ClauseArena(clauses), verbose=False)
+        self.assertIsInstance(A, ClauseArena)
+        self.assertEqual(set(A), R)
+        self.assertEqual(set(filter_minimal(ClauseArena(clauses))), filter_minimal(set(clauses)))
+        interpretation = res_sat(A, 4)
+        self.assertEqual(interpretation, res_sat(R, 4))
+        self.assertTrue(validate_interpretation(ClauseArena(clauses), interpretation))
+
+    def test_quiet_when_not_verbose(self):
+        clauses = [frozenset({1, 2}), frozenset({-1, 3}), frozenset({-2, 3}), frozenset({-3, 4})]
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), DiskClauseStore() as store:
+            store.update(clauses)
+            for generate in (generate_resolvents, generate_resolvents_minimal):
+                generate(ClauseArena(clauses), verbose=False)
+                generate(store, verbose=False)
+        self.assertEqual(output.getvalue(), "")
+
+if __name__ == '__main__':
+    unittest.main()
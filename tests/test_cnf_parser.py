@@ -1,5 +1,5 @@
 import unittest
-from src.cnf_parser import parse_cnf
+from ressat.cnf_parser import parse_cnf
 import os
 
 class TestCNFParser(unittest.TestCase):
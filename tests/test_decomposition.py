@@ -0,0 +1,40 @@
+import contextlib
+import io
+import unittest
+from ressat.decomposition import split_components, solve_decomposed
+from ressat.validator import validate_interpretation
+
+class TestDecomposition(unittest.TestCase):
+    def test_split_and_solve(self):
+        # Two independent parts {1, 3} and {2, 4}; variable 5 is free.
+        clauses = [frozenset({1, 3}), frozenset({-1, 3}), frozenset({2, -4}), frozenset({-2})]
+        components, free_vars = split_components(clauses, 5)
+        self.assertEqual([variables for variables, _ in components], [[1, 3], [2, 4]])
+        self.assertEqual(free_vars, [5])
+
+        for processes in (None, 2):
+            R, interpretation, num_components = solve_decomposed(clauses, 5, processes=processes)
+            self.assertEqual(num_components, 2)
+            self.assertIn(frozenset({3}), R)
+            self.assertEqual({abs(l) for l in interpretation}, {1, 2, 3, 4, 5})
+            self.assertTrue(validate_interpretation(clauses, interpretation))
+
+    def test_empty_clause(self):
+        clauses = [frozenset({1, 2}), frozenset(), frozenset({-3})]
+        components, free_vars = split_components(clauses, 4)
+        self.assertEqual(components, [([], [frozenset()]), ([1, 2], [frozenset({1, 2})]), ([3], [frozenset({-3})])])
+        self.assertEqual(free_vars, [4])
+        R, interpretation, _ = solve_decomposed(clauses, 4)
+        self.assertIn(frozenset(), R)
+        self.assertEqual({abs(l) for l in interpretation}, {1, 2, 3, 4})
+
+    def test_quiet(self):
+        clauses = [frozenset({1, 3}), frozenset({-1, 3}), frozenset({2, -4}), frozenset({-2})]
+        for minimal in (True, False):
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                solve_decomposed(clauses, 5, minimal=minimal)
+            self.assertEqual(out.getvalue(), "")
+
+if __name__ == '__main__':
+    unittest.main()
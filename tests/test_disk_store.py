@@ -0,0 +1,17 @@
+import unittest
+from ressat.disk_store import DiskClauseStore
+from ressat.resolvent_generator import generate_resolvents_minimal, generate_resolvents
+
+class TestDiskStore(unittest.TestCase):
+    def test_matches_in_memory_closure(self):
+        clauses = [frozenset({1, 2}), frozenset({-1, 3}), frozenset({-2, 3}), frozenset({-3, 4}), frozenset({1, 2, 4})]
+        for generate in (generate_resolvents_minimal, generate_resolvents):
+            # A tiny memory limit forces chunked partitions and frequent flushes.
+            with DiskClauseStore(memory_limit=1024) as store:
+                store.update(clauses)
+                self.assertFalse(store.add(frozenset({2, 1})))
+                self.assertIs(generate(store), store)
+                self.assertEqual(set(store), generate(clauses))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,23 @@
+import unittest
+from ressat.microbench import bench, run_microbenchmarks, compare_results, BENCHMARKS
+
+class TestMicrobench(unittest.TestCase):
+    def test_bench_reports_times_and_allocations(self):
+        record = bench(lambda n: [i for i in range(n)], (10000,), warmup=1, repeat=5)
+        self.assertEqual(len(record["times"]), 5)
+        self.assertLessEqual(record["min"], record["median"])
+        self.assertLessEqual(record["median"], record["p95"])
+        self.assertGreater(record["alloc_peak_bytes"], 10000 * 8)
+        self.assertGreater(record["surviving_blocks"], 0)
+
+    def test_all_benchmarks_run_and_compare(self):
+        sizes = {"parse_cnf": 20, "filter_minimal": 20, "resolve_pass_minimal": 6,
+                 "resolve_pass_standard": 6, "res_sat": 6, "validate_interpretation": 20}
+        results = run_microbenchmarks(sizes=sizes, warmup=0, repeat=3, verbose=False)
+        self.assertEqual([r["name"] for r in results], list(BENCHMARKS))
+        rows = compare_results(results, results)
+        self.assertEqual(len(rows), len(BENCHMARKS))
+        self.assertTrue(all(row["ratio"] == 1.0 and not row["significant"] for row in rows))
+
+if __name__ == '__main__':
+    unittest.main()
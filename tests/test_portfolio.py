@@ -0,0 +1,46 @@
+import os
+import tempfile
+import unittest
+from ressat.portfolio import race, record_result, win_table, best_configuration, family_of
+from ressat.validator import validate_interpretation
+from ressat.generators import random_ksat, pigeonhole
+
+FAST = {"name": "fast", "minimal": True, "max_iterations": 2, "max_resolvents": 10000}
+SLOW = {"name": "slow", "minimal": False, "max_iterations": 50, "max_resolvents": 10 ** 9}
+
+class TestPortfolio(unittest.TestCase):
+    def test_first_valid_result_wins(self):
+        num_vars, clauses = random_ksat(6, 3.0, seed=1)
+        outcome = race(clauses, num_vars, configurations=[SLOW, FAST])
+        self.assertEqual(outcome["winner"], "fast")
+        self.assertTrue(validate_interpretation(clauses, outcome["interpretation"]))
+        self.assertEqual(outcome["configurations"]["slow"]["status"], "cancelled")
+
+    def test_no_winner(self):
+        num_vars, clauses = pigeonhole(2)
+        outcome = race(clauses, num_vars, jobs=1)
+        self.assertIsNone(outcome["winner"])
+        self.assertTrue(all(r["status"] == "invalid" for r in outcome["configurations"].values()))
+
+    def test_timeout_cancels(self):
+        num_vars, clauses = random_ksat(30, 4.26, seed=0)
+        outcome = race(clauses, num_vars, configurations=[SLOW], timeout=0.5)
+        self.assertIsNone(outcome["winner"])
+        self.assertEqual(outcome["configurations"]["slow"]["status"], "cancelled")
+
+    def test_win_statistics(self):
+        self.assertEqual(family_of("data/AIM/aim-50-1_6-yes1-4.cnf"), "aim")
+        self.assertEqual(family_of("hole6_simplified.cnf"), "hole")
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "wins.jsonl")
+            for name, winner in [("aim-1.cnf", "a"), ("aim-2.cnf", "b"), ("aim-3.cnf", "b"), ("hole6.cnf", None)]:
+                record_result(path, name, 3, 5, {"winner": winner, "time": 0.1,
+                                                 "configurations": {"a": {"status": "won"}}})
+            table = win_table(path)
+        self.assertEqual(table["aim"], {"a": 1, "b": 2})
+        self.assertEqual(best_configuration(table, "aim"), "b")
+        self.assertIsNone(best_configuration(table, "hole"))
+        self.assertIsNone(best_configuration(table, "uf"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import pstats
+import tempfile
+import unittest
+from ressat.profiling import PhaseProfiler
+from ressat.resolvent_generator import generate_resolvents_minimal
+from ressat.res_sat import res_sat
+from ressat.generators import random_ksat
+
+class TestPhaseProfiler(unittest.TestCase):
+    def test_writes_profiles_per_phase(self):
+        num_vars, clauses = random_ksat(10, 4.26, seed=1)
+        with tempfile.TemporaryDirectory() as directory:
+            profiler = PhaseProfiler(directory, top=5)
+            R = profiler.call("resolve", generate_resolvents_minimal, clauses, verbose=False)
+            profiler.call("res_sat", res_sat, R, num_vars)
+            summary = profiler.write(verbose=False)
+
+            self.assertIn("=== Phase: resolve ===", summary)
+            self.assertIn("=== Phase: res_sat ===", summary)
+            for phase in ("resolve", "res_sat"):
+                stats = pstats.Stats(os.path.join(directory, f"{phase}.pstats"))
+                self.assertGreater(stats.total_calls, 0)
+                # the profiler does not show up in its own output
+                self.assertFalse([func for func in stats.stats if os.path.basename(func[0]) == "profiling.py"])
+            self.assertTrue(os.path.exists(os.path.join(directory, "summary.txt")))
+            with open(os.path.join(directory, "resolve.collapsed")) as f:
+                for line in f:
+                    stack, count = line.rsplit(" ", 1)
+                    self.assertTrue(stack)
+                    self.assertNotIn("(profiling.py:", stack)
+                    self.assertGreater(int(count), 0)
+
+    def test_disabled_profiler_passes_through(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "profiles")
+            profiler = PhaseProfiler(output, enabled=False)
+            self.assertEqual(profiler.call("parse", sorted, [3, 1, 2], reverse=True), [3, 2, 1])
+            self.assertEqual(profiler.write(verbose=False), "")
+            self.assertFalse(os.path.exists(output))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import tempfile
+import unittest
+from ressat.clause_arena import ClauseArena
+from ressat.proof_log import ProofLog, check_proof, export_tracecheck, read_proof
+from ressat.resolvent_generator import generate_resolvents, generate_resolvents_minimal
+from ressat.generators import random_ksat
+
+
+class TestProofLog(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, "proof.bin")
+        self.num_vars, self.clauses = random_ksat(8, 4.26, seed=7)
+
+    def log(self, generate, clauses, **kwargs):
+        with ProofLog(self.path, buffer_words=64) as proof:
+            return generate(clauses, verbose=False, proof=proof, **kwargs)
+
+    def test_standard_closure_checks(self):
+        R = self.log(generate_resolvents, self.clauses)
+        self.assertEqual(R, generate_resolvents(self.clauses, verbose=False))
+        result = check_proof(self.path, self.clauses, R)
+        self.assertTrue(result["valid"], result["error"])
+        self.assertEqual(result["resolvents"], len(R) - len(set(self.clauses)))
+        self.assertEqual(result["deleted"], 0)
+
+    def test_minimal_closure_logs_deletions(self):
+        R = self.log(generate_resolvents_minimal, self.clauses, max_iterations=3)
+        self.assertEqual(R, generate_resolvents_minimal(self.clauses, max_iterations=3, verbose=False))
+        result = check_proof(self.path, self.clauses, R)
+        self.assertTrue(result["valid"], result["error"])
+        self.assertGreater(result["deleted"], 0)
+
+    def test_refutation_derives_empty_clause(self):
+        clauses = [frozenset(c) for c in ({1, 2}, {1, -2}, {-1, 2}, {-1, -2})]
+        R = self.log(generate_resolvents, clauses, max_iterations=5)
+        self.assertIn(frozenset(), R)
+        self.assertTrue(check_proof(self.path, clauses)["empty_clause"])
+        export = os.path.join(self.directory.name, "proof.trc")
+        export_tracecheck(self.path, export)
+        with open(export) as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0].split()[-2:], ["0", "0"])
+        # the empty clause: "id 0 parent1 parent2 0"
+        self.assertTrue(any(len(line.split()) == 5 and line.split()[1] == "0" for line in lines))
+
+    def test_rejects_tampered_proofs(self):
+        self.log(generate_resolvents, self.clauses)
+        records = list(read_proof(self.path))
+        resolvent = next(r for r in records if r[0] == "resolvent")
+        # a wrong pivot
+        with ProofLog(self.path) as proof:
+            proof.add_inputs(r[2] for r in records if r[0] == "input")
+            proof._write([proof.next_id, resolvent[2], resolvent[3], -resolvent[4]])
+        self.assertFalse(check_proof(self.path)["valid"])
+        # an input clause that is not in the formula
+        with ProofLog(self.path) as proof:
+            proof.add_inputs([frozenset({1, 2, 3, 4})])
+        self.assertFalse(check_proof(self.path, self.clauses)["valid"])
+        # a truncated file
+        self.log(generate_resolvents, self.clauses)
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 2)
+        self.assertFalse(check_proof(self.path)["valid"])
+
+    def test_unsupported_inputs(self):
+        with ProofLog(self.path) as proof:
+            with self.assertRaises(ValueError):
+                generate_resolvents(ClauseArena(self.clauses), verbose=False, proof=proof)
+
+
+if __name__ == "__main__":
+    unittest.main()
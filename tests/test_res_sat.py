@@ -1,7 +1,9 @@
 import unittest
-from src.cnf_parser import parse_cnf
-from src.resolvent_generator import generate_resolvents_minimal
-from src.res_sat import res_sat
+from ressat.cnf_parser import parse_cnf
+from ressat.resolvent_generator import generate_resolvents_minimal
+from ressat.res_sat import res_sat, res_sat_lazy
+from ressat.resolvent_generator import generate_resolvents
+from ressat.validator import validate_interpretation
 import os
 
 class TestResSat(unittest.TestCase):
@@ -25,5 +27,14 @@ p cnf 2 2
         self.assertTrue(2 in interpretation or -2 in interpretation)
         os.remove(test_file)
 
+    def test_lazy_matches_full_closure(self):
+        # (p ∨ q), (¬p ∨ r), (¬q ∨ ¬r), (¬p ∨ ¬r ∨ q)
+        clauses = [frozenset({1, 2}), frozenset({-1, 3}), frozenset({-2, -3}), frozenset({-1, -3, 2})]
+        R = generate_resolvents(clauses, max_iterations=10)
+        interpretation, cached = res_sat_lazy(clauses, 3)
+        self.assertEqual(interpretation, res_sat(R, 3))
+        self.assertTrue(validate_interpretation(clauses, interpretation))
+        self.assertTrue(set(clauses) <= cached)
+
 if __name__ == '__main__':
     unittest.main()
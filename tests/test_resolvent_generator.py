@@ -1,5 +1,9 @@
+import random
 import unittest
-from src.resolvent_generator import generate_resolvents_minimal
+from ressat.resolvent_generator import generate_resolvents_minimal, generate_resolvents, eligible_literal
+from ressat.res_sat import res_sat
+from ressat.validator import validate_interpretation
+from ressat.generators import random_ksat, pigeonhole
 
 class TestResolventGenerator(unittest.TestCase):
     def test_resolvent_generation(self):
@@ -10,5 +14,58 @@ class TestResolventGenerator(unittest.TestCase):
         expected = frozenset({2, 3})
         self.assertIn(expected, R)
 
+class TestOrderedResolution(unittest.TestCase):
+    def test_only_maximal_literals_are_resolved(self):
+        S = {frozenset({1, 2}), frozenset({-1, 3})}
+        # 2 and 3 are the maximal literals, so the clauses do not resolve
+        self.assertEqual(generate_resolvents(S, verbose=False, ordered=True), S)
+        # with 1 ranked highest they do
+        self.assertIn(frozenset({2, 3}), generate_resolvents(S, verbose=False, ordered=True, order=[3, 2, 1]))
+
+    def test_eligible_literal(self):
+        eligible = eligible_literal()
+        self.assertEqual(eligible(frozenset({1, -3, 2})), -3)
+        self.assertIsNone(eligible(frozenset()))
+        self.assertEqual(eligible_literal(selection="negative")(frozenset({-1, -2, 3})), -2)
+        self.assertEqual(eligible_literal(selection="negative")(frozenset({1, 3})), 3)
+        self.assertEqual(eligible_literal(order=[3, 1, 2])(frozenset({1, 3})), 1)
+
+    def test_refutation_complete(self):
+        num_vars, clauses = pigeonhole(3)
+        for generate in (generate_resolvents, generate_resolvents_minimal):
+            for selection in (None, "negative"):
+                R = generate(clauses, max_iterations=100, max_resolvents=10 ** 6, verbose=False,
+                             ordered=True, selection=selection)
+                self.assertIn(frozenset(), R)
+
+    def test_res_sat_finds_a_model_on_the_ordered_closure(self):
+        rng = random.Random(1)
+        for seed in range(5):
+            num_vars, clauses = random_ksat(10, 3.5, seed=seed)
+            order = list(range(1, num_vars + 1))
+            rng.shuffle(order)
+            for kwargs in ({}, {"order": order}):
+                stats = {}
+                R = generate_resolvents_minimal(clauses, max_iterations=100, max_resolvents=10 ** 6, verbose=False,
+                                                stats=stats, ordered=True, **kwargs)
+                self.assertTrue(stats["complete"])
+                if frozenset() not in R:
+                    T = res_sat(R, num_vars, order=kwargs.get("order"))
+                    self.assertTrue(validate_interpretation(clauses, T))
+
+    def test_fewer_resolution_steps(self):
+        num_vars, clauses = random_ksat(12, 4.26, seed=3)
+        unrestricted, ordered = {}, {}
+        generate_resolvents(clauses, verbose=False, stats=unrestricted)
+        generate_resolvents(clauses, verbose=False, stats=ordered, ordered=True)
+        self.assertLess(ordered["clashing_pairs"] * 5, unrestricted["clashing_pairs"])
+
+    def test_invalid_options(self):
+        S = {frozenset({1, 2})}
+        with self.assertRaises(ValueError):
+            generate_resolvents(S, verbose=False, selection="negative")
+        with self.assertRaises(ValueError):
+            generate_resolvents(S, verbose=False, ordered=True, selection="positive")
+
 if __name__ == '__main__':
     unittest.main()
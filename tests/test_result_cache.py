@@ -0,0 +1,63 @@
+import io
+import os
+import shutil
+import tempfile
+import unittest
+from ressat.result_cache import ResultCache, file_digest, code_version
+from ressat.run_all import run_parallel
+from ressat.generators import random_ksat
+from ressat.prop_to_cnf import write_dimacs
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self.directory.name, "cache.sqlite")
+        self.cnf = os.path.join(self.directory.name, "f.cnf")
+        num_vars, clauses = random_ksat(6, 3.0, seed=1)
+        write_dimacs([sorted(c) for c in clauses], num_vars, self.cnf)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_keyed_by_content_config_and_version(self):
+        config = {"engine": "auto"}
+        with ResultCache(self.db) as cache:
+            self.assertIsNone(cache.get(self.cnf, config))
+            cache.put(self.cnf, config, {"status": "sat", "interpretation": [1, -2]})
+            self.assertEqual(cache.get(self.cnf, config)["interpretation"], [1, -2])
+            self.assertIsNone(cache.get(self.cnf, {"engine": "cdcl"}))
+        with ResultCache(self.db) as cache:
+            self.assertEqual(cache.get(self.cnf, config)["status"], "sat")
+        with ResultCache(self.db, version="other") as cache:
+            self.assertIsNone(cache.get(self.cnf, config))
+
+        digest = file_digest(self.cnf)
+        with open(self.cnf, "a") as f:
+            f.write("1 2 0\n")
+        self.assertNotEqual(file_digest(self.cnf), digest)
+        with ResultCache(self.db) as cache:
+            self.assertIsNone(cache.get(self.cnf, config))
+        self.assertEqual(len(code_version()), 16)
+
+    def test_code_version_covers_indirect_imports(self):
+        source = os.path.dirname(os.path.abspath(file_digest.__code__.co_filename))
+        copy = os.path.join(self.directory.name, "src")
+        shutil.copytree(source, copy, ignore=shutil.ignore_patterns("__pycache__"))
+        version = code_version(copy)
+        self.assertEqual(version, code_version(source))
+        # checkpoint is only imported through resolvent_generator
+        with open(os.path.join(copy, "checkpoint.py"), "a") as f:
+            f.write("\n# edited\n")
+        self.assertNotEqual(code_version(copy), version)
+
+    def test_batch_runner_skips_cached_instances(self):
+        with ResultCache(self.db) as cache:
+            first = run_parallel([self.cnf], jobs=1, output=io.StringIO(), cache=cache)
+            second = run_parallel([self.cnf], jobs=1, output=io.StringIO(), cache=cache)
+        self.assertNotIn("cached", first[0])
+        self.assertTrue(second[0]["cached"])
+        self.assertEqual(second[0]["interpretation"], first[0]["interpretation"])
+        self.assertEqual(second[0]["resolve_time"], first[0]["resolve_time"])
+
+if __name__ == '__main__':
+    unittest.main()
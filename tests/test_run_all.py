@@ -0,0 +1,69 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from ressat.run_all import solve_instance, estimate_cost, run_limited, run_parallel
+from ressat.generators import random_ksat, pigeonhole
+from ressat.prop_to_cnf import write_dimacs
+
+EXAMPLES = os.path.join(os.path.dirname(__file__), "..", "examples")
+
+class TestRunAll(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.files = []
+        for name, (num_vars, clauses) in [("small", random_ksat(6, 3.0, seed=1)),
+                                          ("php", pigeonhole(2)),
+                                          ("large", random_ksat(8, 4.0, seed=2))]:
+            path = os.path.join(self.directory.name, f"{name}.cnf")
+            write_dimacs([sorted(c) for c in clauses], num_vars, path)
+            self.files.append(path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_solve_instance(self):
+        record = solve_instance(self.files[0])
+        self.assertEqual(record["status"], "sat")
+        self.assertTrue(record["valid"])
+        self.assertGreater(record["closure_size"], 0)
+
+        record = solve_instance(self.files[1], engine="cdcl")
+        self.assertEqual((record["status"], record["engine"], record["closure_size"]), ("unsat", "cdcl", None))
+
+    def test_auto_keeps_a_valid_model_of_an_incomplete_closure(self):
+        num_vars, clauses = random_ksat(8, 4.0, seed=3)
+        path = os.path.join(self.directory.name, "incomplete.cnf")
+        write_dimacs([sorted(c) for c in clauses], num_vars, path)
+        record = solve_instance(path)
+        self.assertFalse(record["stats_complete"])
+        self.assertEqual((record["engine"], record["status"]), ("res-sat", "sat"))
+        self.assertNotIn("cdcl_time", record)
+
+    def test_estimate_cost_orders_by_clause_count(self):
+        costs = [estimate_cost(f) for f in self.files]
+        self.assertEqual(costs, [18, 9, 32])
+
+    def test_parallel_streams_json_lines(self):
+        output = io.StringIO()
+        records = run_parallel(self.files, jobs=2, output=output, timeout=60)
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual(lines, records)
+        statuses = {r["file"]: r["status"] for r in records}
+        self.assertEqual(statuses, {"small.cnf": "sat", "php.cnf": "unsat", "large.cnf": "sat"})
+        self.assertTrue(all(r["wall_time"] > 0 for r in records))
+
+    def test_limits(self):
+        slow = os.path.join(EXAMPLES, "aim-100-1_6-no-1.cnf")
+        self.assertEqual(run_limited(slow, engine="res-sat", timeout=0.5)["status"], "timeout")
+        # enough for the interpreter and a small instance, not for the second
+        # resolution round of a 40-variable random 3-SAT formula
+        self.assertEqual(run_limited(self.files[0], memory_limit=64)["status"], "sat")
+        num_vars, clauses = random_ksat(40, 4.26, seed=1)
+        large = os.path.join(self.directory.name, "explodes.cnf")
+        write_dimacs([sorted(c) for c in clauses], num_vars, large)
+        self.assertEqual(run_limited(large, engine="res-sat", memory_limit=64, timeout=60)["status"], "memout")
+
+if __name__ == '__main__':
+    unittest.main()
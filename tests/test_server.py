@@ -0,0 +1,91 @@
+import asyncio
+import json
+import unittest
+import time
+from ressat.server import SolverServer, formula_key, solve
+from ressat.generators import pigeonhole
+
+async def request(port, method, target, body=b""):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{method} {target} HTTP/1.1\r\nHost: localhost\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    head, _, payload = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), json.loads(payload)
+
+class TestServer(unittest.TestCase):
+    def test_formula_key_ignores_order(self):
+        self.assertEqual(formula_key([frozenset({1, -2}), frozenset({3})], 3),
+                         formula_key([frozenset({3}), frozenset({-2, 1})], 3))
+
+    def test_solve_and_cache(self):
+        async def scenario():
+            server = SolverServer(workers=1, max_pending=2, timeout=30)
+            await server.start(port=0)
+            port = server.server.sockets[0].getsockname()[1]
+            try:
+                dimacs = b"p cnf 3 3\n1 2 0\n-1 3 0\n-3 0\n"
+                status, first = await request(port, "POST", "/solve", dimacs)
+                self.assertEqual(status, 200)
+                self.assertTrue(first["satisfiable"])
+                self.assertEqual(set(first["interpretation"]), {-1, 2, -3})
+                self.assertFalse(first["cached_closure"])
+
+                status, second = await request(port, "POST", "/solve", b"p cnf 3 3\n-3 0\n2 1 0\n3 -1 0\n")
+                self.assertTrue(second["cached_closure"])
+
+                status, unsat = await request(port, "POST", "/solve?engine=cdcl", b"p cnf 1 2\n1 0\n-1 0\n")
+                self.assertEqual((status, unsat["satisfiable"]), (200, False))
+
+                status, prop = await request(port, "POST", "/solve?format=prop", b"A & (A -> B)")
+                self.assertEqual(prop["assignment"], {"A": True, "B": True})
+
+                status, error = await request(port, "POST", "/solve?format=prop", b"A & (")
+                self.assertEqual(status, 400)
+
+                status, stats = await request(port, "GET", "/stats")
+                self.assertEqual(stats["closures"]["hits"], 1)
+                self.assertEqual(stats["solved"], 4)
+                self.assertEqual(stats["pending"], 0)
+            finally:
+                await server.close()
+        asyncio.run(scenario())
+
+    def test_solve_gives_up_after_its_deadline(self):
+        num_vars, clauses = pigeonhole(5)
+        result = solve(clauses, num_vars, "auto", deadline=time.time() - 1)
+        self.assertTrue(result["timed_out"])
+        self.assertIsNone(result["closure"])
+        self.assertIsNone(result["satisfiable"])
+
+    def test_timeouts_free_their_slot_only_when_the_job_stops(self):
+        async def scenario():
+            server = SolverServer(workers=1, max_pending=1, timeout=30, read_timeout=0.2)
+            await server.start(port=0)
+            port = server.server.sockets[0].getsockname()[1]
+            try:
+                # a client that never sends its request line
+                reader, writer = await asyncio.open_connection("127.0.0.1", port)
+                response = await reader.read()
+                writer.close()
+                self.assertEqual(int(response.split()[1]), 408)
+
+                num_vars, clauses = pigeonhole(9)
+                dimacs = f"p cnf {num_vars} {len(clauses)}\n" + "".join(
+                    " ".join(map(str, sorted(c))) + " 0\n" for c in clauses)
+                status, _ = await request(port, "POST", "/solve?engine=cdcl&timeout=0.5", dimacs.encode())
+                self.assertEqual(status, 504)
+                # CDCL needs far longer than this on PHP(9): the job must have stopped itself
+                for _ in range(100):
+                    _, stats = await request(port, "GET", "/stats")
+                    if stats["pending"] == 0:
+                        break
+                    await asyncio.sleep(0.05)
+                self.assertEqual((stats["pending"], stats["timeouts"], stats["read_timeouts"]), (0, 1, 1))
+            finally:
+                await server.close()
+        asyncio.run(scenario())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+import os
+import pickle
+import random
+import subprocess
+import sys
+import unittest
+from ressat.clause_arena import ClauseArena
+from ressat.resolvent_generator import generate_resolvents_minimal
+from ressat.res_sat import res_sat
+from ressat.shared_closure import SharedClosure, detach, evaluate_orders, validate_many, _attached
+from ressat.validator import validate_interpretation
+from ressat.generators import random_ksat
+
+
+class TestSharedClosure(unittest.TestCase):
+    def setUp(self):
+        self.num_vars, self.clauses = random_ksat(10, 3.5, seed=2)
+        self.R = generate_resolvents_minimal(self.clauses, verbose=False)
+        self.shared = SharedClosure.publish(self.R)
+        self.addCleanup(self.shared.__exit__, None, None, None)
+
+    def test_round_trip(self):
+        self.assertEqual(len(self.shared), len(self.R))
+        self.assertEqual(set(self.shared), self.R)
+        with SharedClosure.publish(ClauseArena(self.clauses)) as shared:
+            self.assertEqual(set(shared), set(self.clauses))
+
+    def test_views_are_read_only(self):
+        with self.assertRaises(TypeError):
+            self.shared.lits[0] = 0
+
+    def test_pickle_attaches_by_name(self):
+        data = pickle.dumps(self.shared)
+        self.assertLess(len(data), 200)
+        attached = pickle.loads(data)
+        self.addCleanup(attached.close)
+        self.assertFalse(attached.owner)
+        self.assertEqual(list(attached.iter_clauses()), list(self.shared.iter_clauses()))
+
+    def test_detach(self):
+        attached = pickle.loads(pickle.dumps(self.shared))
+        self.assertIs(pickle.loads(pickle.dumps(self.shared)), attached)
+        detach(self.shared.name)
+        self.assertNotIn(self.shared.name, _attached)
+        with self.assertRaises(ValueError):
+            attached.clause(0)
+        again = pickle.loads(pickle.dumps(self.shared))
+        self.assertIsNot(again, attached)
+        detach()
+        self.assertEqual(_attached, {})
+
+    def test_other_process_does_not_unlink(self):
+        # an unrelated process has a resource tracker of its own, which must not free the block when it exits
+        src = os.path.join(os.path.dirname(__file__), "..", "src")
+        code = (f"import sys; sys.path.insert(0, {src!r}); from ressat.shared_closure import SharedClosure; "
+                f"closure = SharedClosure.attach({self.shared.name!r}); print(len(closure)); closure.close()")
+        completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        self.assertEqual(int(completed.stdout), len(self.R))
+        self.assertNotIn("leaked", completed.stderr)
+        attached = SharedClosure.attach(self.shared.name)
+        self.addCleanup(attached.close)
+        self.assertEqual(len(attached), len(self.R))
+
+    def test_res_sat_and_validation(self):
+        T = res_sat(self.shared, self.num_vars)
+        self.assertEqual(T, res_sat(self.R, self.num_vars))
+        self.assertEqual(validate_interpretation(self.shared, T), validate_interpretation(self.R, T))
+
+    def test_empty(self):
+        with SharedClosure.publish([]) as empty:
+            self.assertEqual(len(empty), 0)
+            self.assertEqual(list(empty), [])
+
+
+class TestVariableOrder(unittest.TestCase):
+    def test_every_order_gives_a_model_on_the_closure(self):
+        num_vars, clauses = random_ksat(8, 3.0, seed=3)
+        R = generate_resolvents_minimal(clauses, max_iterations=20, max_resolvents=10 ** 6, verbose=False)
+        rng = random.Random(0)
+        for _ in range(5):
+            order = list(range(1, num_vars + 1))
+            rng.shuffle(order)
+            for closure in (R, ClauseArena(R)):
+                T = res_sat(closure, num_vars, order=order)
+                self.assertEqual(len(T), num_vars)
+                self.assertTrue(validate_interpretation(clauses, T))
+
+
+class TestProcessPool(unittest.TestCase):
+    def test_workers_attach(self):
+        num_vars, clauses = random_ksat(8, 3.0, seed=3)
+        R = generate_resolvents_minimal(clauses, max_iterations=20, max_resolvents=10 ** 6, verbose=False)
+        orders = [list(range(1, num_vars + 1)), list(range(num_vars, 0, -1))]
+        with SharedClosure.publish(R) as shared, SharedClosure.publish(clauses) as formula:
+            models = evaluate_orders(shared, num_vars, orders, processes=2)
+            self.assertEqual(models, [res_sat(R, num_vars, order=order) for order in orders])
+            self.assertEqual(validate_many(formula, models + [{-v for v in range(1, num_vars + 1)}], processes=2),
+                             [True, True, validate_interpretation(clauses, {-v for v in range(1, num_vars + 1)})])
+
+
+if __name__ == "__main__":
+    unittest.main()
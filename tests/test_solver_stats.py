@@ -0,0 +1,37 @@
+import json
+import unittest
+from ressat.solver_stats import SolverStats
+from ressat.resolvent_generator import generate_resolvents_minimal, generate_resolvents
+from ressat.res_sat import res_sat
+from ressat.generators import random_ksat
+
+class TestSolverStats(unittest.TestCase):
+    def test_counters_do_not_change_results(self):
+        num_vars, clauses = random_ksat(8, 4.26, seed=3)
+        for generate in (generate_resolvents_minimal, generate_resolvents):
+            stats = SolverStats()
+            R = generate(clauses, verbose=False, stats=stats)
+            self.assertEqual(R, generate(clauses, verbose=False))
+            self.assertEqual(stats.iterations, len(stats.iteration_times))
+            self.assertGreater(stats.pairs_examined, 0)
+            self.assertLessEqual(stats.clashing_pairs, stats.pairs_examined)
+            self.assertGreater(stats.tautologies_skipped + stats.duplicates_rejected, 0)
+            if generate is generate_resolvents_minimal:
+                self.assertGreater(stats.subsumed_removed, 0)
+
+            T = res_sat(R, num_vars, stats=stats)
+            self.assertEqual(T, res_sat(R, num_vars))
+            self.assertEqual(len(stats.clauses_scanned), num_vars)
+            self.assertTrue(all(0 < n <= len(R) for n in stats.clauses_scanned))
+            self.assertEqual(json.loads(json.dumps(stats))["iterations"], stats.iterations)
+            self.assertEqual(stats.counters()["clauses_scanned"], sum(stats.clauses_scanned))
+
+    def test_pairs_examined_first_iteration(self):
+        clauses = [frozenset({1, 2}), frozenset({-1, 3}), frozenset({-2, -3})]
+        stats = SolverStats()
+        generate_resolvents(clauses, max_iterations=1, verbose=False, stats=stats)
+        self.assertEqual((stats.pairs_examined, stats.clashing_pairs), (3, 3))
+        self.assertEqual(stats.tautologies_skipped, 0)
+
+if __name__ == '__main__':
+    unittest.main()
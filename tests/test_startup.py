@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+import unittest
+
+SRC = os.path.join(os.path.dirname(__file__), "..", "src")
+
+# Cumulative import time of the single-file CLI, in microseconds. A cold
+# `import ressat.main` takes ~35 ms; tqdm alone used to add ~70 ms.
+IMPORT_BUDGET_US = 150_000
+HEAVY_MODULES = ["tqdm", "pandas", "numpy", "matplotlib", "psutil",
+                 "multiprocessing", "sqlite3", "cProfile"]
+
+
+def import_profile(module):
+    """Runs `import module` in a fresh interpreter with -X importtime.
+
+    Returns the cumulative import time of `module` (µs) and every module the
+    import loaded.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=SRC, capture_output=True, text=True, check=True,
+        env={**os.environ, "PYTHONPATH": os.path.abspath(SRC)},
+    )
+    total, loaded = None, set()
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        loaded.add(name)
+        if name == module:
+            total = int(cumulative)
+    return total, loaded
+
+
+class TestStartup(unittest.TestCase):
+    def test_cli_import_budget(self):
+        # best of three, so one slow run on a busy machine does not fail the test
+        best = min(import_profile("ressat.main")[0] for _ in range(3))
+        self.assertLess(best, IMPORT_BUDGET_US, f"import ressat.main took {best / 1000:.1f} ms")
+
+    def test_heavy_dependencies_are_lazy(self):
+        for module in ("ressat.main", "ressat.run_all", "ressat.benchmarking"):
+            _, loaded = import_profile(module)
+            self.assertFalse(loaded & set(HEAVY_MODULES), f"{module} imports {loaded & set(HEAVY_MODULES)}")
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+from ressat.symmetry import find_symmetries, break_symmetries
+
+class TestSymmetry(unittest.TestCase):
+    def test_pigeonhole_symmetries_broken(self):
+        # Three pigeons in two holes; variable 2*(p-1)+h means pigeon p sits in hole h.
+        clauses = [frozenset({1, 2}), frozenset({3, 4}), frozenset({5, 6})]
+        for h in (1, 2):
+            holes = [h, 2 + h, 4 + h]
+            clauses += [frozenset({-a, -b}) for i, a in enumerate(holes) for b in holes[i + 1:]]
+        clause_set = set(clauses)
+
+        symmetries = find_symmetries(clauses, 6)
+        self.assertTrue(symmetries)
+        for sigma in symmetries:
+            image = {frozenset(sigma.get(l, l) if l > 0 else -sigma.get(-l, -l) for l in c) for c in clauses}
+            self.assertEqual(image, clause_set)
+
+        extended, num_vars, num_symmetries = break_symmetries(clauses, 6)
+        self.assertEqual(num_symmetries, len(symmetries))
+        self.assertEqual(extended[:len(clauses)], clauses)
+        self.assertGreater(len(extended), len(clauses))
+        self.assertEqual(num_vars, 6)
+
+    def test_no_symmetry(self):
+        clauses = [frozenset({1}), frozenset({-1, 2}), frozenset({2, 3, -1})]
+        self.assertEqual(find_symmetries(clauses, 3), [])
+
+if __name__ == '__main__':
+    unittest.main()
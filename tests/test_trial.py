@@ -0,0 +1,34 @@
+import os
+import unittest
+from ressat.trial import measure_trial, run_isolated, run_trials, PHASES
+
+CNF = os.path.join(os.path.dirname(__file__), "..", "examples", "aim-50-1_6-yes1-4_simplified.cnf")
+
+class TestTrial(unittest.TestCase):
+    def test_measure_trial_in_process(self):
+        result = measure_trial(CNF)
+        self.assertTrue(result["valid"])
+        self.assertFalse([key for key in result if key.startswith("stats_")])
+        for phase in PHASES:
+            self.assertGreaterEqual(result[f"{phase}_time"], 0)
+            self.assertGreaterEqual(result[f"{phase}_cpu"], 0)
+        self.assertGreaterEqual(result["peak_rss"], result["baseline_rss"])
+        counted = measure_trial(CNF, collect_stats=True)
+        self.assertGreater(counted["stats_pairs_examined"], 0)
+        self.assertEqual(counted["num_clauses_res"], result["num_clauses_res"])
+
+    def test_isolated_trials(self):
+        single = run_isolated(CNF, use_minimal=False, collect_stats=True)
+        self.assertEqual(single["method"], "standard")
+        self.assertGreater(single["stats_pairs_examined"], 0)
+        self.assertGreater(single["peak_rss"], 0)
+
+        results = run_trials([(CNF, True), (CNF, False), (CNF, True)], jobs=2)
+        self.assertEqual([r["method"] for r in results], ["minimal", "standard", "minimal"])
+        self.assertEqual(results[0]["num_clauses_res"], results[2]["num_clauses_res"])
+        self.assertTrue(all(r["valid"] for r in results))
+        if "affinity" in results[0]:
+            self.assertEqual([r["affinity"] for r in results], [[r["cpu"]] for r in results])
+
+if __name__ == '__main__':
+    unittest.main()